@@ -17,8 +17,13 @@ Estructura del proyecto:
 import pygame
 import sys
 import os
-from src.game import Game
+from src.game import Game, TICK_RATE
+from src.assets import assets
+from src.audio import AudioSystem, register_sounds
 from src.characters import Character
+from src.text_cache import get_font, render_text
+from src.text_layout import get_layout
+from src.timestep import FixedTimestep
 
 # Inicializar Pygame
 pygame.init()
@@ -27,6 +32,7 @@ pygame.mixer.init()
 # Configuración
 WIDTH, HEIGHT = 800, 600
 FPS = 60
+DIRTY_RECTS = True  # Durante el partido solo se envía a la pantalla lo que cambió
 
 # Colores
 BLACK = (0, 0, 0)
@@ -44,12 +50,14 @@ class PongGame:
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         pygame.display.set_caption("Retro Pong Championship")
         self.clock = pygame.time.Clock()
+        # La simulación del partido corre a paso fijo, aparte de los FPS
+        self.timestep = FixedTimestep(TICK_RATE)
         
         # Fuentes
-        self.font_title = pygame.font.SysFont("Courier New", 60, bold=True)
-        self.font_menu = pygame.font.SysFont("Courier New", 30)
-        self.font_small = pygame.font.SysFont("Courier New", 20)
-        self.font_dialogue = pygame.font.SysFont("Courier New", 18)
+        self.font_title = get_font("Courier New", 60, bold=True)
+        self.font_menu = get_font("Courier New", 30)
+        self.font_small = get_font("Courier New", 20)
+        self.font_dialogue = get_font("Courier New", 18)
         
         # Estado del juego
         self.state = "MENU"  # MENU, SETTINGS, DIFFICULTY, DIALOGUE, GAME, GAME_OVER
@@ -122,22 +130,24 @@ class PongGame:
         }
     
     def load_sounds(self):
-        """Carga los sonidos del juego"""
-        try:
-            self.sound_bounce = pygame.mixer.Sound("assets/sounds/bounce.mp3")
-            self.sound_hit = pygame.mixer.Sound("assets/sounds/hit.mp3")
-            self.sound_score = pygame.mixer.Sound("assets/sounds/score.mp3")
-        except:
-            print("⚠️ No se pudieron cargar los sonidos. El juego continuará sin audio.")
-            self.sound_bounce = None
-            self.sound_hit = None
-            self.sound_score = None
+        """
+        Registra los sonidos del juego y los carga en segundo plano junto con
+        los sprites: el menú responde mientras tanto (sin audio hasta que estén)
+        """
+        self.sound_bounce = "sound_bounce"
+        self.sound_hit = "sound_hit"
+        self.sound_score = "sound_score"
+        register_sounds()
+        self.audio = AudioSystem(volume=self.sfx_volume / 100)
+        
+        self.asset_loader = assets.load_in_background(
+            [self.sound_hit, self.sound_bounce, self.sound_score, "girl_images"]
+        )
     
     def play_sound(self, sound):
-        """Reproduce un sonido con el volumen configurado"""
-        if sound:
-            sound.set_volume(self.sfx_volume / 100)
-            sound.play()
+        """Reproduce un sonido (nombre en el registro) con el volumen configurado"""
+        self.audio.volume = self.sfx_volume / 100
+        self.audio.play(sound)
     
     def get_text(self, key):
         """Obtiene texto en el idioma actual"""
@@ -148,8 +158,8 @@ class PongGame:
         self.screen.fill(BLACK)
         
         # Título
-        title = self.font_title.render(self.get_text("title"), True, CYAN)
-        subtitle = self.font_small.render(self.get_text("subtitle"), True, GREEN)
+        title = render_text(self.font_title, self.get_text("title"), CYAN)
+        subtitle = render_text(self.font_small, self.get_text("subtitle"), GREEN)
         self.screen.blit(title, (WIDTH//2 - title.get_width()//2, 80))
         self.screen.blit(subtitle, (WIDTH//2 - subtitle.get_width()//2, 150))
         
@@ -163,7 +173,7 @@ class PongGame:
         for i, option in enumerate(menu_options):
             color = YELLOW if i == self.selected_option else WHITE
             prefix = "> " if i == self.selected_option else "  "
-            text = self.font_menu.render(prefix + option, True, color)
+            text = render_text(self.font_menu, prefix + option, color)
             self.screen.blit(text, (WIDTH//2 - 100, 250 + i * 60))
         
         # Decoración
@@ -174,23 +184,23 @@ class PongGame:
         """Dibuja el menú de ajustes"""
         self.screen.fill(BLACK)
         
-        title = self.font_menu.render(self.get_text("settings"), True, CYAN)
+        title = render_text(self.font_menu, self.get_text("settings"), CYAN)
         self.screen.blit(title, (WIDTH//2 - title.get_width()//2, 50))
         
         # Música
-        music_text = self.font_small.render(f"{self.get_text('music')}: {self.music_volume}%", True, WHITE)
+        music_text = render_text(self.font_small, f"{self.get_text('music')}: {self.music_volume}%", WHITE)
         self.screen.blit(music_text, (150, 150))
         pygame.draw.rect(self.screen, GRAY, (150, 180, 400, 20))
         pygame.draw.rect(self.screen, GREEN, (150, 180, int(400 * self.music_volume / 100), 20))
         
         # SFX
-        sfx_text = self.font_small.render(f"{self.get_text('sfx')}: {self.sfx_volume}%", True, WHITE)
+        sfx_text = render_text(self.font_small, f"{self.get_text('sfx')}: {self.sfx_volume}%", WHITE)
         self.screen.blit(sfx_text, (150, 250))
         pygame.draw.rect(self.screen, GRAY, (150, 280, 400, 20))
         pygame.draw.rect(self.screen, GREEN, (150, 280, int(400 * self.sfx_volume / 100), 20))
         
         # Idioma
-        lang_text = self.font_small.render(f"{self.get_text('language')}: {self.language}", True, WHITE)
+        lang_text = render_text(self.font_small, f"{self.get_text('language')}: {self.language}", WHITE)
         self.screen.blit(lang_text, (150, 350))
         
         # Indicador
@@ -202,14 +212,14 @@ class PongGame:
         ])
         
         # Volver
-        back_text = self.font_small.render(f"[ESC] {self.get_text('back')}", True, GRAY)
+        back_text = render_text(self.font_small, f"[ESC] {self.get_text('back')}", GRAY)
         self.screen.blit(back_text, (WIDTH//2 - back_text.get_width()//2, HEIGHT - 50))
     
     def draw_difficulty(self):
         """Dibuja la selección de dificultad"""
         self.screen.fill(BLACK)
         
-        title = self.font_menu.render(self.get_text("difficulty"), True, CYAN)
+        title = render_text(self.font_menu, self.get_text("difficulty"), CYAN)
         self.screen.blit(title, (WIDTH//2 - title.get_width()//2, 80))
         
         difficulties = [
@@ -223,8 +233,8 @@ class PongGame:
         for i, diff in enumerate(difficulties):
             color = colors[i] if i == self.selected_difficulty else WHITE
             size = 35 if i == self.selected_difficulty else 25
-            diff_font = pygame.font.SysFont("Courier New", size, bold=(i == self.selected_difficulty))
-            text = diff_font.render(diff, True, color)
+            diff_font = get_font("Courier New", size, bold=(i == self.selected_difficulty))
+            text = render_text(diff_font, diff, color)
             self.screen.blit(text, (WIDTH//2 - text.get_width()//2, 200 + i * 80))
             
             if i == self.selected_difficulty:
@@ -247,7 +257,7 @@ class PongGame:
         pygame.draw.rect(self.screen, BLACK, (55, 55, bar_width, bar_height))
         hp_color = GREEN if self.game.player_hp > 50 else YELLOW if self.game.player_hp > 25 else RED
         pygame.draw.rect(self.screen, hp_color, (55, 55, int(bar_width * self.game.player_hp / 100), bar_height))
-        player_text = self.font_small.render(self.get_text("player"), True, WHITE)
+        player_text = render_text(self.font_small, self.get_text("player"), WHITE)
         self.screen.blit(player_text, (55, 25))
         
         # HP Oponente (derecha)
@@ -255,7 +265,7 @@ class PongGame:
         pygame.draw.rect(self.screen, BLACK, (WIDTH - 50 - bar_width - 5, 55, bar_width, bar_height))
         hp_color = GREEN if self.character.hp > 50 else YELLOW if self.character.hp > 25 else RED
         pygame.draw.rect(self.screen, hp_color, (WIDTH - 50 - bar_width - 5, 55, int(bar_width * self.character.hp / 100), bar_height))
-        opponent_text = self.font_small.render(self.get_text("opponent"), True, WHITE)
+        opponent_text = render_text(self.font_small, self.get_text("opponent"), WHITE)
         self.screen.blit(opponent_text, (WIDTH - 50 - bar_width - 5, 25))
         
         # Imagen del personaje (si existe)
@@ -269,33 +279,19 @@ class PongGame:
         pygame.draw.rect(self.screen, BLACK, (dialogue_box.x + 5, dialogue_box.y + 5,
                                               dialogue_box.width - 10, dialogue_box.height - 10))
         
-        # Texto con efecto typewriter
+        # Texto con efecto typewriter: el párrafo completo se parte y renderiza
+        # una vez, y solo se muestra hasta el carácter actual
         current_dialogue = self.character.dialogues[self.dialogue_index]
-        displayed_text = current_dialogue[:self.dialogue_char_index]
-        
-        # Dividir en líneas
-        words = displayed_text.split()
-        lines = []
-        current_line = ""
-        for word in words:
-            test_line = current_line + word + " "
-            if self.font_dialogue.size(test_line)[0] < dialogue_box.width - 40:
-                current_line = test_line
-            else:
-                lines.append(current_line)
-                current_line = word + " "
-        lines.append(current_line)
-        
-        # Dibujar líneas
-        for i, line in enumerate(lines[:4]):
-            text_surf = self.font_dialogue.render(line, True, WHITE)
-            self.screen.blit(text_surf, (dialogue_box.x + 20, dialogue_box.y + 20 + i * 25))
+        layout = get_layout(self.font_dialogue, current_dialogue, dialogue_box.width - 40,
+                            WHITE, 25, max_lines=4)
+        layout.draw(self.screen, (dialogue_box.x + 20, dialogue_box.y + 20),
+                    visible=self.dialogue_char_index)
         
         # Indicador de continuar
         if self.dialogue_char_index >= len(current_dialogue):
-            arrow = self.font_small.render("▼", True, YELLOW)
+            arrow = render_text(self.font_small, "▼", YELLOW)
             self.screen.blit(arrow, (dialogue_box.right - 30, dialogue_box.bottom - 30))
-            hint = self.font_small.render("[ESPACIO]", True, GRAY)
+            hint = render_text(self.font_small, "[ESPACIO]", GRAY)
             self.screen.blit(hint, (WIDTH//2 - hint.get_width()//2, HEIGHT - 30))
     
     def draw_game_over(self):
@@ -305,16 +301,17 @@ class PongGame:
         winner_text = self.get_text("victory") if self.game.score_player > self.game.score_ai else self.get_text("defeat")
         color = GREEN if self.game.score_player > self.game.score_ai else RED
         
-        title = self.font_title.render(winner_text, True, color)
+        title = render_text(self.font_title, winner_text, color)
         self.screen.blit(title, (WIDTH//2 - title.get_width()//2, 150))
         
-        final_score = self.font_menu.render(
+        final_score = render_text(
+            self.font_menu,
             f"{self.get_text('final_score')}: {self.game.score_player} - {self.game.score_ai}",
-            True, WHITE
+            WHITE
         )
         self.screen.blit(final_score, (WIDTH//2 - final_score.get_width()//2, 250))
         
-        hint = self.font_small.render(self.get_text("menu"), True, GRAY)
+        hint = render_text(self.font_small, self.get_text("menu"), GRAY)
         self.screen.blit(hint, (WIDTH//2 - hint.get_width()//2, HEIGHT - 100))
     
     def handle_menu_input(self, event):
@@ -382,7 +379,8 @@ class PongGame:
             
             # Crear personaje y juego
             self.character = Character(self.selected_difficulty)
-            self.game = Game(self.selected_difficulty)
+            self.game = Game(self.selected_difficulty, dirty_rects=DIRTY_RECTS)
+            self.game.event_listeners.append(self.audio.on_game_event)
             self.play_sound(self.sound_hit)
         elif event.key == pygame.K_ESCAPE:
             self.state = "MENU"
@@ -396,6 +394,7 @@ class PongGame:
                 self.dialogue_index += 1
                 if self.dialogue_index >= len(self.character.dialogues):
                     self.state = "GAME"
+                    self.timestep.reset()
                 else:
                     self.dialogue_char_index = 0
                     self.dialogue_timer = 0
@@ -446,12 +445,15 @@ class PongGame:
             if self.state == "DIALOGUE":
                 self.update_dialogue()
             elif self.state == "GAME":
-                game_over = self.game.update()
-                if game_over:
-                    self.state = "GAME_OVER"
-                    self.character.hp = self.game.ai_hp
+                for _ in range(self.timestep.advance()):
+                    game_over = self.game.update(self.timestep.dt)
+                    if game_over:
+                        self.state = "GAME_OVER"
+                        self.character.hp = self.game.ai_hp
+                        break
             
             # Dibujar según estado
+            rects = None
             if self.state == "MENU":
                 self.draw_menu()
             elif self.state == "SETTINGS":
@@ -461,11 +463,14 @@ class PongGame:
             elif self.state == "DIALOGUE":
                 self.draw_dialogue()
             elif self.state == "GAME":
-                self.game.draw(self.screen)
+                rects = self.game.draw(self.screen, self.timestep.alpha)
             elif self.state == "GAME_OVER":
                 self.draw_game_over()
             
-            pygame.display.flip()
+            if rects is not None and self.game.dirty_rects:
+                pygame.display.update(rects)
+            else:
+                pygame.display.flip()
             self.clock.tick(FPS)
         
         pygame.quit()
@@ -1,96 +1,219 @@
+import time
+
+INICIO = time.perf_counter()  # Origen de la línea de tiempo del arranque
+
+import argparse
 import pygame
-import cv2
-import mediapipe as mp
 import numpy as np
-from src.game import Game
-
-pygame.init()
+from src.assets import assets
+from src.audio import AudioSystem, register_sounds
+from src.control import ProportionalPaddleControl
+from src.game import Game, FRAME_DT, GAME_AREA_HEIGHT, PADDLE_HEIGHT, TICK_RATE, WHITE, RED
+from src.gestures import MOVIMIENTO_POR_GESTO
+from src.startup import StartupTimeline
+from src.text_cache import get_font, render_text, text_cache
+from src.timestep import FixedTimestep
 
 ANCHO, ALTO = 800, 600
-ventana = pygame.display.set_mode((ANCHO, ALTO))
-pygame.display.set_caption("Pong Flaquita - Puño Arriba / Palma Abajo")
-
-# ======== MEDIAPIPE HANDS =========
-mp_hands = mp.solutions.hands
-hands = mp_hands.Hands(max_num_hands=1, min_detection_confidence=0.7, min_tracking_confidence=0.7)
-mp_draw = mp.solutions.drawing_utils
-
-cap = cv2.VideoCapture(0)
-reloj = pygame.time.Clock()
-
-juego = Game(1)  # dificultad normal
-
-def detectar_gesto(hand):
-    """
-    Detecta:
-    - Puño ✊ (todos los dedos cerrados) → UP
-    - Palma abierta 🖐️ (todos extendidos) → DOWN
-    """
-    # Lista de puntas de dedos
-    tips = [4, 8, 12, 16, 20]
-
-    dedos_arriba = 0
-    for tip in tips[1:]:  # Ignorar el pulgar para evitar errores
-        # Si la punta está más arriba que la articulación base -> dedo extendido
-        if hand.landmark[tip].y < hand.landmark[tip - 2].y:
-            dedos_arriba += 1
-
-    # Si todos los dedos están cerrados → Puño
-    if dedos_arriba == 0:
-        return "UP"
-    # Si 3+ dedos arriba → Palma abierta
-    elif dedos_arriba >= 3:
-        return "DOWN"
+
+# Si el último gesto tiene más de esto, la paleta se queda quieta
+GESTO_MAX_EDAD = 0.5  # segundos
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Pong Flaquita - Puño Arriba / Palma Abajo")
+    parser.add_argument("--tracker", choices=["thread", "process"], default="thread",
+                        help="Dónde corre cámara + MediaPipe: hilo o proceso aparte")
+    parser.add_argument("--source", "--camera", default="0",
+                        help="Índice de cámara, archivo de video, carpeta de imágenes o 'synthetic'")
+    parser.add_argument("--camera-profile", default="auto",
+                        help="auto (probar y recordar), none (driver) o p. ej. 640x480@30:MJPG")
+    parser.add_argument("--roi", action="store_true",
+                        help="Inferir sobre un recorte alrededor de la mano (más barato en CPU)")
+    parser.add_argument("--inference-size", type=int, default=256,
+                        help="Resolución de la inferencia en modo --roi (px)")
+    parser.add_argument("--flow-interval", type=int, default=0,
+                        help="Correr el modelo cada N frames y usar flujo óptico entre medio (0 = siempre el modelo)")
+    parser.add_argument("--control", choices=["gesto", "proporcional"], default="gesto",
+                        help="gesto: puño/palma mueven ±7 px; proporcional: la altura de la mano es la paleta")
+    parser.add_argument("--jugadores", type=int, choices=[1, 2], default=1,
+                        help="2 = dos personas frente a la cámara, una mano por paleta (sin IA)")
+    parser.add_argument("--asignacion", choices=["lado", "mano"], default="lado",
+                        help="Con --jugadores 2: paleta por lado de la pantalla o por mano (izquierda/derecha)")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="Enviar a la pantalla solo las zonas que cambiaron en cada frame")
+    parser.add_argument("--tick-rate", type=int, default=TICK_RATE,
+                        help="Frecuencia fija de la simulación (Hz), independiente de los FPS")
+    parser.add_argument("--fps", type=int, default=60,
+                        help="Límite de FPS del dibujo (0 = sin límite)")
+    parser.add_argument("--timeline",
+                        help="Guardar la línea de tiempo del arranque en este archivo (JSON)")
+    args = parser.parse_args()
+    if args.jugadores == 2 and (args.roi or args.flow_interval):
+        parser.error("--roi y --flow-interval siguen una sola mano; no se pueden usar con --jugadores 2")
+    return args
+
+
+def main():
+    args = parse_args()
+    timeline = StartupTimeline(INICIO)
+    timeline.mark("imports")
+
+    pygame.init()
+    ventana = pygame.display.set_mode((ANCHO, ALTO))
+    pygame.display.set_caption("Pong Flaquita - Puño Arriba / Palma Abajo")
+    timeline.mark("ventana")
+
+    # ======== CÁMARA + MEDIAPIPE EN SEGUNDO PLANO =========
+    # OpenCV se importa recién con la ventana abierta; MediaPipe lo importa el
+    # tracker mientras abre la cámara en paralelo, y el juego arranca sin esperar
+    from src.tracking import HandTracker, ProcessHandTracker, PREVIEW_SIZE
+
+    roi_size = args.inference_size if args.roi else None
+    if args.tracker == "process":
+        tracker = ProcessHandTracker(source=args.source, roi_size=roi_size,
+                                     flow_interval=args.flow_interval, players=args.jugadores,
+                                     camera_profile=args.camera_profile,
+                                     asignacion=args.asignacion)
     else:
-        return "STOP"  # quieto
-
-
-ejecutando = True
-while ejecutando:
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            ejecutando = False
-    
-    ret, frame = cap.read()
-    movimiento = 0
-
-    if ret:
-        frame = cv2.flip(frame, 1)
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = hands.process(rgb)
-
-        if results.multi_hand_landmarks:
-            hand = results.multi_hand_landmarks[0]
-            gesto = detectar_gesto(hand)
-
-            # Mostrar gesto en pantalla (debug)
-            cv2.putText(frame, f"{gesto}", (20, 40),
-                        cv2.FONT_HERSHEY_SIMPLEX, 1, (0,255,0), 2)
-
-            if gesto == "UP":
-                movimiento = -7   # SUBE
-            elif gesto == "DOWN":
-                movimiento = 7    # BAJA
+        tracker = HandTracker(source=args.source, roi_size=roi_size,
+                              flow_interval=args.flow_interval, players=args.jugadores,
+                              camera_profile=args.camera_profile,
+                              asignacion=args.asignacion)
+    tracker.start()
+    timeline.mark("tracker_lanzado")
+
+    reloj = pygame.time.Clock()
+
+    # Superficie fija para la cámara: solo se copia cuando llega un frame nuevo
+    cam_surface = pygame.Surface(PREVIEW_SIZE)
+    cam_frame_id = None
+    cargando = render_text(get_font("Courier New", 14), "Iniciando cámara...", WHITE)
+    error_tracker = None
+
+    juego = Game(1, dos_jugadores=args.jugadores == 2, dirty_rects=args.dirty_rects)  # dificultad normal
+    timeline.mark("juego_listo")
+
+    # Efectos de sonido: se decodifican en segundo plano, suenan cuando estén
+    audio = AudioSystem()
+    assets.load_in_background(register_sounds())
+    juego.event_listeners.append(audio.on_game_event)
+
+    # (mover, colocar) de cada paleta controlada con la mano
+    paletas = [(juego.mover_paleta_cabeza, juego.colocar_paleta_cabeza)]
+    if args.jugadores == 2:
+        paletas.append((juego.mover_paleta_rival, juego.colocar_paleta_rival))
+
+    controles = None
+    if args.control == "proporcional":
+        controles = [ProportionalPaddleControl(PADDLE_HEIGHT / 2, GAME_AREA_HEIGHT - PADDLE_HEIGHT / 2)
+                     for _ in paletas]
+
+    paso = FixedTimestep(args.tick_rate)
+    inicio = time.perf_counter()
+    paso.reset(inicio)
+    frames = 0
+
+    ejecutando = True
+    while ejecutando:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                ejecutando = False
+
+        # Leer el último gesto publicado (no bloquea)
+        resultado = tracker.get_latest()
+        if tracker.error and error_tracker is None:
+            # La cámara o el modelo no arrancaron: avisar y seguir sin mano
+            print(f"❌ Tracking detenido: {tracker.error}")
+            error_tracker = render_text(get_font("Courier New", 14), "Cámara no disponible", RED)
+        if resultado is not None and "jugable" not in timeline.marks:
+            for etapa, t in tracker.startup_times.items():
+                timeline.mark(etapa, t)
+            timeline.mark("jugable")
+            print(f"⏱️ Listo para jugar en {timeline.elapsed('jugable'):.2f} s")
+
+        ahora = time.perf_counter()
+        fresco = resultado is not None and ahora - resultado.timestamp < GESTO_MAX_EDAD
+
+        # Velocidad de cada paleta por gesto (px por frame de 60 Hz)
+        velocidades = [0] * len(paletas)
+        # Paletas que el control proporcional coloca en este frame
+        colocadas = [False] * len(paletas)
+        for i, (mover, colocar) in enumerate(paletas):
+            if resultado is None:
+                break
+
+            if args.jugadores == 2:
+                gesto = resultado.gestos[i]
+                landmarks = resultado.landmarks[i] if gesto else None
             else:
-                movimiento = 0    # QUIETO
-
-            mp_draw.draw_landmarks(frame, hand, mp_hands.HAND_CONNECTIONS)
-
-        # Aplicar movimiento al jugador
-        juego.mover_paleta_cabeza(movimiento)
-
-    juego.update()
-    juego.draw(ventana)
-
-    # Mostrar cámara pequeña
-    if ret:
-        cam_small = cv2.resize(frame, (200, 140))
-        cam_small = cv2.cvtColor(cam_small, cv2.COLOR_BGR2RGB)
-        cam_surface = pygame.surfarray.make_surface(np.rot90(cam_small))
-        ventana.blit(cam_surface, (ANCHO - 220, 10))
-
-    pygame.display.flip()
-    reloj.tick(60)
-
-cap.release()
-pygame.quit()
+                gesto = resultado.gesto
+                landmarks = resultado.landmarks
+
+            if controles is not None:
+                if fresco and landmarks is not None:
+                    controles[i].update(landmarks, resultado.timestamp,
+                                        resultado.frame_id, ahora)
+                    colocadas[i] = True
+            else:
+                velocidades[i] = MOVIMIENTO_POR_GESTO[gesto] if fresco and gesto else 0
+
+        # Simulación a paso fijo: 0, 1 o varios ticks según el tiempo real
+        ticks = paso.advance(ahora)
+        for tick in range(ticks):
+            for (mover, _), velocidad in zip(paletas, velocidades):
+                if velocidad:
+                    # Aplicar movimiento al jugador
+                    mover(velocidad * paso.dt / FRAME_DT)
+            juego.update(paso.dt)
+
+            # Control proporcional: después del tick, con la posición predicha
+            # para el final del tick siguiente. Así el próximo tick choca con
+            # la paleta donde va a estar, y el dibujo (que interpola entre los
+            # dos últimos ticks) la muestra en "ahora" aunque no corra ningún tick
+            t_siguiente = ahora - paso.accumulator - (ticks - 1 - tick) * paso.dt + paso.dt
+            for i, (_, colocar) in enumerate(paletas):
+                if colocadas[i]:
+                    colocar(controles[i].target(t_siguiente))
+        rects = juego.draw(ventana, paso.alpha)
+
+        # Mostrar cámara pequeña
+        if resultado is not None:
+            if resultado.frame_id != cam_frame_id:
+                # np.rot90 es una vista: blit_array copia sin reservar memoria
+                pygame.surfarray.blit_array(cam_surface, np.rot90(resultado.preview))
+                cam_frame_id = resultado.frame_id
+            # Va encima de lo que dibujó el juego: siempre se vuelve a enviar
+            rects.append(ventana.blit(cam_surface, (ANCHO - 220, 10)))
+        else:
+            aviso = error_tracker or cargando
+            rects.append(ventana.blit(aviso, (ANCHO - 220, 10)))
+
+        if args.dirty_rects:
+            pygame.display.update(rects)
+        else:
+            pygame.display.flip()
+        timeline.mark("primer_dibujo")
+        reloj.tick(args.fps)
+        frames += 1
+
+    duracion = time.perf_counter() - inicio
+    print(f"📊 Juego: {frames / duracion:.1f} FPS | "
+          f"Tracking: {tracker.frames_processed / duracion:.1f} Hz ({args.tracker})")
+    print(f"   Simulación: {paso.ticks / duracion:.1f} Hz "
+          f"({paso.dropped:.2f} s descartados por el límite de ticks)")
+    print(f"   Inferencia: {tracker.inference_stats}")
+    print(f"   Texto: {text_cache.stats}")
+    print(f"   Audio: {audio.stats}")
+    print(f"⏱️ Arranque:\n{timeline.report()}")
+    if args.timeline:
+        timeline.save(args.timeline)
+    if controles is not None:
+        print(f"   Latencia cámara → control: {controles[0].latency * 1000:.0f} ms (compensada)")
+
+    tracker.stop()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
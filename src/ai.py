@@ -2,32 +2,73 @@
 # src/ai.py - Inteligencia Artificial del Oponente
 # ============================================================================
 
+import math
+
 WIDTH, HEIGHT = 800, 600
 
-def move_ai(ai_paddle, ball, ai_speed):
+# Retraso (frames de 60 Hz) de una IA con reacción 0; la de 1.0 no tiene retraso
+REACTION_FRAMES = 30
+
+
+def reaction_lag(reaction):
+    """Constante de tiempo (frames de 60 Hz) con la que la IA sigue a la pelota"""
+    return max(1.0 - reaction, 0.0) * REACTION_FRAMES
+
+
+def perceive(perceived_y, target_y, reaction, steps=1.0):
     """
-    Mueve la paleta de la IA para seguir la pelota
+    Altura de la pelota que "ve" la IA: se acerca a la real con un retraso
+    que crece al bajar la reacción (suavizado exponencial con constante de
+    tiempo reaction_lag). Un cambio de dirección de la pelota tarda en
+    notarse, como el tiempo de reacción de una persona.
     
     Args:
-        ai_paddle: Rectángulo de la paleta de la IA
-        ball: Rectángulo de la pelota
-        ai_speed: Velocidad de movimiento de la IA
+        perceived_y: Lo que la IA veía en el paso anterior
+        target_y: Centro vertical real de la pelota
+        reaction: Factor de reacción (0.0 a 1.0; 1.0 = sin retraso)
+        steps: Frames de 60 Hz de este paso
     """
-    # Calcular diferencia entre el centro de la pelota y la paleta
-    target_y = ball.centery
-    paddle_center_y = ai_paddle.centery
+    lag = reaction_lag(reaction)
+    if lag <= 0:
+        return target_y
+    return perceived_y + (target_y - perceived_y) * (1.0 - math.exp(-steps / lag))
+
+
+def ai_step(paddle_center_y, target_y, ai_speed):
+    """
+    Desplazamiento de la paleta de la IA en un paso (sin tocar ningún Rect)
     
+    Args:
+        paddle_center_y: Centro vertical de la paleta
+        target_y: Centro vertical de la pelota (el que ve la IA, ver perceive)
+        ai_speed: Velocidad de movimiento de la IA (px en este paso)
+    
+    Returns:
+        float: +ai_speed, -ai_speed o 0
+    """
     # Calcular distancia
     distance = target_y - paddle_center_y
     
     # Zona muerta para evitar vibración
     dead_zone = 10
     
-    # Mover la paleta
     if distance > dead_zone:
-        ai_paddle.y += ai_speed
+        return ai_speed
     elif distance < -dead_zone:
-        ai_paddle.y -= ai_speed
+        return -ai_speed
+    return 0
+
+
+def move_ai(ai_paddle, ball, ai_speed):
+    """
+    Mueve la paleta de la IA para seguir la pelota
+    
+    Args:
+        ai_paddle: Rectángulo de la paleta de la IA
+        ball: Rectángulo de la pelota
+        ai_speed: Velocidad de movimiento de la IA
+    """
+    ai_paddle.y += ai_step(ai_paddle.centery, ball.centery, ai_speed)
 
 
 class AI:
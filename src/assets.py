@@ -0,0 +1,190 @@
+# ============================================================================
+# src/assets.py - Registro de Recursos con Caché en Disco
+# ============================================================================
+
+import hashlib
+import json
+import os
+import threading
+
+import numpy as np
+import pygame
+
+# Carpeta con los recursos ya decodificados (píxeles RGBA / PCM crudos)
+CACHE_DIR = ".asset_cache"
+
+
+def _file_hash(path):
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class DiskCache:
+    """
+    Guarda datos ya procesados de un archivo fuente como .npy (se leen con
+    mmap, sin decodificar nada). Se invalida si cambia la fuente: primero se
+    compara mtime/tamaño y, si no coinciden, el hash del contenido.
+    """
+
+    def __init__(self, directory=CACHE_DIR):
+        self.directory = directory
+
+    def _paths(self, source, variant):
+        key = hashlib.sha1(f"{os.path.abspath(source)}|{variant}".encode()).hexdigest()[:20]
+        base = os.path.join(self.directory, key)
+        return base + ".npy", base + ".json"
+
+    @staticmethod
+    def _write_json(path, data):
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+
+    def load(self, source, variant):
+        """Retorna (array mapeado en memoria, info) o None si no hay caché válido"""
+        data_path, meta_path = self._paths(source, variant)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            stat = os.stat(source)
+            if (meta["mtime_ns"], meta["size"]) != (stat.st_mtime_ns, stat.st_size):
+                if meta["sha1"] != _file_hash(source):
+                    return None
+                # Mismo contenido (ej. tras un checkout): solo actualizar la fecha
+                meta["mtime_ns"], meta["size"] = stat.st_mtime_ns, stat.st_size
+                self._write_json(meta_path, meta)
+            # "c" = copy-on-write: se lee bajo demanda y el buffer es escribible
+            return np.load(data_path, mmap_mode="c"), meta["info"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def store(self, source, variant, array, info):
+        """Guarda `array` + `info` (dict serializable) para la fuente dada"""
+        data_path, meta_path = self._paths(source, variant)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            stat = os.stat(source)
+            tmp = f"{data_path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                np.save(f, array)
+            os.replace(tmp, data_path)
+            self._write_json(meta_path, {
+                "source": source,
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "sha1": _file_hash(source),
+                "info": info,
+            })
+        except OSError as e:
+            print(f"⚠️ No se pudo guardar el caché de {source}: {e}")
+
+
+disk_cache = DiskCache()
+
+
+def load_image(path, size=None, smooth=True, cache=disk_cache):
+    """
+    Carga una imagen como Surface RGBA, opcionalmente escalada a size (w, h)
+
+    La primera vez decodifica el PNG y guarda los píxeles ya escalados en el
+    caché; las siguientes los mapea directo desde disco.
+    """
+    variant = f"image:{size}:{smooth}"
+    cached = cache.load(path, variant)
+    if cached is not None:
+        pixels, info = cached
+        return pygame.image.frombuffer(pixels, tuple(info["size"]), "RGBA")
+
+    surface = pygame.image.load(path)
+    if surface.get_bitsize() < 24:
+        # Paleta → RGBA (smoothscale pide 24/32 bits; sin necesitar la pantalla)
+        rgba = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+        rgba.blit(surface, (0, 0))
+        surface = rgba
+    if size is not None:
+        scale = pygame.transform.smoothscale if smooth else pygame.transform.scale
+        surface = scale(surface, size)
+
+    raw = pygame.image.tostring(surface, "RGBA")
+    cache.store(path, variant, np.frombuffer(raw, np.uint8), {"size": surface.get_size()})
+    return surface
+
+
+def load_sound(path, cache=disk_cache):
+    """
+    Carga un sonido. El PCM decodificado se guarda en el caché para no
+    volver a decodificar el MP3 (depende del formato del mixer)
+    """
+    mixer_format = pygame.mixer.get_init()
+    if mixer_format is None:
+        raise pygame.error("mixer no inicializado")
+
+    variant = f"sound:{mixer_format}"
+    cached = cache.load(path, variant)
+    if cached is not None:
+        pcm, _ = cached
+        return pygame.mixer.Sound(buffer=pcm)
+
+    sound = pygame.mixer.Sound(path)
+    cache.store(path, variant, np.frombuffer(sound.get_raw(), np.uint8), {})
+    return sound
+
+
+class AssetRegistry:
+    """
+    Registro de recursos del proceso: cada uno se carga una sola vez, aunque
+    lo pidan varias pantallas o varios hilos a la vez. Los que no hacen falta
+    de inmediato se pueden cargar en un hilo de fondo.
+    """
+
+    def __init__(self):
+        self._loaders = {}
+        self._locks = {}
+        self._assets = {}
+        self._errors = {}
+        self._guard = threading.Lock()
+
+    def register(self, name, loader):
+        """Asocia `name` a una función loader() que retorna el recurso"""
+        with self._guard:
+            self._loaders[name] = loader
+            self._locks.setdefault(name, threading.Lock())
+
+    def get(self, name):
+        """Retorna el recurso, cargándolo (o esperando al hilo de fondo) si hace falta"""
+        if name in self._assets:
+            return self._assets[name]
+        with self._locks[name]:
+            if name not in self._assets and name not in self._errors:
+                try:
+                    self._assets[name] = self._loaders[name]()
+                except Exception as e:
+                    self._errors[name] = e
+        if name in self._errors:
+            raise self._errors[name]
+        return self._assets[name]
+
+    def peek(self, name):
+        """Retorna el recurso si ya está cargado, o None (nunca bloquea)"""
+        return self._assets.get(name)
+
+    def load_in_background(self, names):
+        """Carga `names` en orden en un hilo daemon y retorna el hilo"""
+        def run():
+            for name in names:
+                try:
+                    self.get(name)
+                except Exception as e:
+                    print(f"⚠️ No se pudo cargar {name}: {e}")
+
+        thread = threading.Thread(target=run, name="AssetLoader", daemon=True)
+        thread.start()
+        return thread
+
+
+# Registro compartido por el juego y los menús
+assets = AssetRegistry()
@@ -0,0 +1,122 @@
+# ============================================================================
+# src/audio.py - Efectos de Sonido con Canales Reservados
+# ============================================================================
+
+import time
+from functools import partial
+
+import pygame
+from src.assets import assets, load_sound
+
+# Recurso (nombre en src.assets) → archivo
+SOUND_FILES = {
+    "sound_bounce": "assets/sounds/bounce.mp3",
+    "sound_hit": "assets/sounds/hit.mp3",
+    "sound_score": "assets/sounds/score.mp3",
+}
+
+# Evento de Game → recurso
+GAME_EVENT_SOUNDS = {
+    "bounce": "sound_bounce",
+    "hit": "sound_hit",
+    "score": "sound_score",
+}
+
+# Si no hay canal libre, un sonido solo le roba el canal a uno de prioridad
+# menor o igual (un punto nunca se corta por un rebote)
+PRIORITIES = {
+    "sound_bounce": 0,
+    "sound_hit": 1,
+    "sound_score": 2,
+}
+
+
+def register_sounds():
+    """Registra los sonidos en el registro de recursos (PCM cacheado en disco)"""
+    for name, path in SOUND_FILES.items():
+        assets.register(name, partial(load_sound, path))
+    return list(SOUND_FILES)
+
+
+class AudioSystem:
+    """
+    Reproduce los efectos en un grupo fijo de canales reservados del mixer.
+
+    - Los Sound ya están decodificados (src.assets); aquí no se carga nada.
+    - El volumen se pone en el canal, no en el Sound compartido.
+    - Como mucho `channels` sonidos a la vez: si están todos ocupados se
+      reemplaza el más viejo de menor prioridad (voice stealing).
+    - El mismo sonido no se repite antes de `min_interval` segundos (en un
+      rally rápido la pelota puede tocar la paleta varios frames seguidos).
+    """
+
+    def __init__(self, channels=4, volume=0.5, min_interval=0.04):
+        self.volume = volume
+        self.min_interval = min_interval
+        self.played = 0
+        self.stolen = 0
+        self.dropped = 0
+
+        self._channels = []
+        if pygame.mixer.get_init() is not None:
+            if pygame.mixer.get_num_channels() < channels:
+                pygame.mixer.set_num_channels(channels)
+            # Los canales 0..channels-1 quedan fuera de Sound.play() automático
+            pygame.mixer.set_reserved(channels)
+            self._channels = [pygame.mixer.Channel(i) for i in range(channels)]
+
+        self._voices = [None] * len(self._channels)  # (prioridad, inicio) por canal
+        self._last_played = {}
+
+    @property
+    def enabled(self):
+        return bool(self._channels)
+
+    def _pick_channel(self, priority):
+        """Índice del canal a usar, o None si todos tienen algo más importante"""
+        victim = None
+        victim_voice = None
+        for i, channel in enumerate(self._channels):
+            if not channel.get_busy():
+                return i
+            voice = self._voices[i] or (-1, 0.0)  # Ocupado por alguien más: el primero en caer
+            if voice[0] <= priority and (victim is None or voice < victim_voice):
+                victim, victim_voice = i, voice
+        if victim is not None:
+            self.stolen += 1
+        return victim
+
+    def play(self, name, volume=1.0):
+        """Reproduce el recurso `name` si ya está cargado (nunca bloquea)"""
+        if not self._channels:
+            return
+        sound = assets.peek(name)
+        if sound is None:
+            return
+
+        now = time.perf_counter()
+        if now - self._last_played.get(name, float("-inf")) < self.min_interval:
+            return
+
+        priority = PRIORITIES.get(name, 0)
+        index = self._pick_channel(priority)
+        if index is None:
+            self.dropped += 1
+            return
+
+        channel = self._channels[index]
+        channel.set_volume(self.volume * volume)
+        channel.play(sound)  # En un canal ocupado reemplaza el sonido anterior
+        self._voices[index] = (priority, now)
+        self._last_played[name] = now
+        self.played += 1
+
+    def on_game_event(self, event):
+        """Listener para Game.event_listeners"""
+        name = GAME_EVENT_SOUNDS.get(event)
+        if name is not None:
+            self.play(name)
+
+    @property
+    def stats(self):
+        return {"played": self.played, "stolen": self.stolen, "dropped": self.dropped}
@@ -0,0 +1,273 @@
+# ============================================================================
+# src/batch.py - Miles de Partidos a la Vez (NumPy)
+# ============================================================================
+
+import numpy as np
+
+from src.model import (
+    WIDTH, GAME_AREA_HEIGHT, PADDLE_WIDTH, PADDLE_HEIGHT, BALL_SIZE, PLAYER_X,
+    AI_X, MAX_BALL_SPEED, WIN_SCORE, DIFFICULTY_SETTINGS,
+)
+from src.ai import REACTION_FRAMES
+from src.physics import MAX_HITS
+
+NO_HIT, HIT_PLAYER, HIT_AI, HIT_WALL = -1, 0, 1, 2
+
+
+def _swept_time(x, y, dx, dy, bx, by):
+    """
+    swept_aabb de src/physics.py para arrays (pelota contra una paleta)
+    Retorna el tiempo de impacto de cada fila, o inf si no la toca
+    """
+    w = h = BALL_SIZE
+    bw, bh = PADDLE_WIDTH, PADDLE_HEIGHT
+    right, down = dx > 0, dy > 0
+    x_entry = np.where(right, bx - (x + w), (bx + bw) - x)
+    x_exit = np.where(right, (bx + bw) - x, bx - (x + w))
+    y_entry = np.where(down, by - (y + h), (by + bh) - y)
+    y_exit = np.where(down, (by + bh) - y, by - (y + h))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tx_entry = np.where(dx == 0, -np.inf, x_entry / dx)
+        tx_exit = np.where(dx == 0, np.inf, x_exit / dx)
+        ty_entry = np.where(dy == 0, -np.inf, y_entry / dy)
+        ty_exit = np.where(dy == 0, np.inf, y_exit / dy)
+
+    apart = (((dx == 0) & ((x + w <= bx) | (x >= bx + bw))) |
+             ((dy == 0) & ((y + h <= by) | (y >= by + bh))))
+    entry = np.maximum(tx_entry, ty_entry)
+    exit_ = np.minimum(tx_exit, ty_exit)
+    miss = apart | (entry > exit_) | (entry < 0) | (entry > 1)
+    return np.where(miss, np.inf, entry)
+
+
+def _perceive(seen, target, reaction, steps):
+    """perceive de src/ai.py para arrays"""
+    lag = np.maximum(1.0 - reaction, 0.0) * REACTION_FRAMES
+    with np.errstate(divide="ignore", invalid="ignore"):
+        alpha = 1.0 - np.exp(-steps / lag)
+    return np.where(lag > 0, seen + (target - seen) * alpha, target)
+
+
+def _ai_step(paddle_y, target, speed):
+    """ai_step de src/ai.py para arrays (target = centro de la pelota que ve la IA)"""
+    distance = target - (paddle_y + PADDLE_HEIGHT / 2)
+    return np.where(distance > 10, speed, np.where(distance < -10, -speed, 0.0))
+
+
+class BatchMatches:
+    """
+    N partidos de MatchModel guardados como struct-of-arrays (una fila por
+    partido) y avanzados juntos con operaciones de NumPy, con las mismas
+    reglas: choques por tiempo de impacto, aceleración ×1.05, efecto según
+    dónde pega, deltas de HP y confianza, y fin a los 12 puntos o sin HP.
+
+    Los partidos terminados se congelan; step() solo avanza los que siguen.
+
+    Con left_ai_speed la paleta izquierda también la mueve una IA (partidos
+    IA contra IA, para ajustar dificultades sin jugadores). Esa IA apunta a
+    la pelota más un error al azar (left_ai_aim) que se sortea en cada saque
+    y cada vez que la pelota vuelve hacia ella: sin ese ruido dos IAs
+    determinísticas dan siempre el mismo resultado.
+    """
+
+    def __init__(self, n, difficulty=1, seed=None, ball_speed=None, ai_speed=None,
+                 ai_reaction=None, left_ai_speed=None, left_ai_reaction=1.0,
+                 left_ai_aim=0.0):
+        """
+        Args:
+            n: Cantidad de partidos
+            difficulty: Nivel de DIFFICULTY_SETTINGS para los valores por defecto
+            seed: Semilla del RNG de los saques
+            ball_speed, ai_speed, ai_reaction: Escalar o array de n valores
+                                  (para barrer parámetros con una fila por combinación)
+            left_ai_speed, left_ai_reaction: IA de la paleta izquierda; None =
+                                  la izquierda se mueve con step(player_dy=...)
+            left_ai_aim: Desvío estándar (px) del error de puntería de esa IA
+        """
+        settings = DIFFICULTY_SETTINGS[difficulty]
+        self.n = n
+        self.rng = np.random.default_rng(seed)
+        full = lambda value: np.broadcast_to(np.asarray(value, dtype=np.float64), (n,)).copy()
+        self.ball_speed = full(settings["ball_speed"] if ball_speed is None else ball_speed)
+        self.ai_speed = full(settings["ai_speed"] if ai_speed is None else ai_speed)
+        self.ai_reaction = full(settings["ai_reaction"] if ai_reaction is None else ai_reaction)
+        self.left_ai = left_ai_speed is not None
+        if self.left_ai:
+            self.left_ai_speed = full(left_ai_speed)
+            self.left_ai_reaction = full(left_ai_reaction)
+            self.left_ai_aim = left_ai_aim
+            self.left_offset = np.zeros(n)
+
+        self.x = np.zeros(n)
+        self.y = np.zeros(n)
+        self.vx = np.zeros(n)
+        self.vy = np.zeros(n)
+        self.player_y = np.full(n, float(GAME_AREA_HEIGHT // 2 - PADDLE_HEIGHT // 2))
+        self.ai_y = self.player_y.copy()
+        self.ai_seen = np.zeros(n)    # Altura de la pelota que ve cada IA
+        self.left_seen = np.zeros(n)
+
+        self.score_player = np.zeros(n, dtype=np.int32)
+        self.score_ai = np.zeros(n, dtype=np.int32)
+        self.player_hp = np.full(n, 100, dtype=np.int32)
+        self.ai_hp = np.full(n, 100, dtype=np.int32)
+        self.confianza = np.full(n, 50, dtype=np.int32)
+        self.rally = np.zeros(n, dtype=np.int32)        # Golpes del punto en curso
+        self.rally_total = np.zeros(n, dtype=np.int64)  # Golpes de los puntos ya jugados
+        self.steps = np.zeros(n, dtype=np.int64)        # Pasos jugados
+        self.done = np.zeros(n, dtype=bool)
+
+        self.serve(np.ones(n, dtype=bool))
+
+    def serve(self, mask):
+        """Saque (pelota al centro, dirección al azar) en las filas de `mask`"""
+        count = int(np.count_nonzero(mask))
+        if count == 0:
+            return
+        signs = self.rng.choice((-1.0, 1.0), size=(2, count))
+        self.x[mask] = float(WIDTH // 2 - BALL_SIZE // 2)
+        self.y[mask] = float(GAME_AREA_HEIGHT // 2 - BALL_SIZE // 2)
+        self.vx[mask] = self.ball_speed[mask] * signs[0]
+        self.vy[mask] = self.ball_speed[mask] * signs[1]
+        self.ai_seen[mask] = self.y[mask] + BALL_SIZE / 2
+        self.left_seen[mask] = self.ai_seen[mask]
+        self.rally[mask] = 0
+        self._aim(mask)
+
+    def _aim(self, mask):
+        """Nuevo error de puntería de la IA izquierda en las filas de `mask`"""
+        if self.left_ai and self.left_ai_aim > 0:
+            count = int(np.count_nonzero(mask))
+            self.left_offset[mask] = self.rng.normal(0.0, self.left_ai_aim, count)
+
+    def load_model(self, i, model):
+        """Copia el estado de un MatchModel a la fila i"""
+        ball = model.ball
+        self.x[i], self.y[i], self.vx[i], self.vy[i] = ball.x, ball.y, ball.vx, ball.vy
+        self.player_y[i], self.ai_y[i] = model.player_y, model.ai_y
+        self.score_player[i], self.score_ai[i] = model.score_player, model.score_ai
+        self.player_hp[i], self.ai_hp[i] = model.player_hp, model.ai_hp
+        self.confianza[i], self.rally[i] = model.confianza, model.rally
+        self.ball_speed[i], self.ai_speed[i] = model.ball_speed, model.ai_speed
+        self.ai_reaction[i], self.ai_seen[i] = model.ai_reaction, model.ai_seen
+
+    @property
+    def finished(self):
+        return bool(self.done.all())
+
+    def step(self, steps=1.0, player_dy=0.0):
+        """
+        Avanza `steps` frames de 60 Hz todos los partidos que no terminaron
+
+        Args:
+            player_dy: Desplazamiento de la paleta izquierda (escalar o array;
+                       se ignora si la izquierda es IA)
+        """
+        live = ~self.done
+        if not live.any():
+            return
+        self.steps[live] += 1
+
+        # Paletas
+        center = self.y + BALL_SIZE / 2
+        if self.left_ai:
+            self.left_seen = _perceive(self.left_seen, center + self.left_offset,
+                                       self.left_ai_reaction, steps)
+            player_dy = _ai_step(self.player_y, self.left_seen, self.left_ai_speed * steps)
+        player_dy = np.broadcast_to(player_dy, (self.n,))
+        self.player_y[live] = np.clip(self.player_y[live] + player_dy[live],
+                                      0, GAME_AREA_HEIGHT - PADDLE_HEIGHT)
+        self.ai_seen = _perceive(self.ai_seen, center, self.ai_reaction, steps)
+        move = _ai_step(self.ai_y, self.ai_seen, self.ai_speed * steps)
+        self.ai_y[live] = np.clip(self.ai_y[live] + move[live],
+                                  0, GAME_AREA_HEIGHT - PADDLE_HEIGHT)
+
+        self._advance_ball(steps, live)
+        self._score(live)
+
+    def _advance_ball(self, steps, moving):
+        """advance_ball de src/physics.py: choques en orden de tiempo, fila por fila"""
+        x, y, vx, vy = self.x, self.y, self.vx, self.vy
+        size = BALL_SIZE
+        bottom = GAME_AREA_HEIGHT
+        remaining = np.ones(self.n)
+        moving = moving.copy()
+
+        for _ in range(MAX_HITS):
+            if not moving.any():
+                return
+            dx = np.where(moving, vx * steps * remaining, 0.0)
+            dy = np.where(moving, vy * steps * remaining, 0.0)
+            t_hit = np.ones(self.n)
+            hit = np.full(self.n, NO_HIT)
+
+            # Paredes superior e inferior
+            with np.errstate(divide="ignore", invalid="ignore"):
+                up = moving & (dy < 0) & (y + dy <= 0)
+                down = moving & (dy > 0) & (y + size + dy >= bottom)
+                t_wall = np.where(up, -y / dy, (bottom - size - y) / dy)
+            wall = up | down
+            t_hit[wall] = np.maximum(t_wall[wall], 0.0)
+            hit[wall] = HIT_WALL
+
+            # Paletas (solo la que está del lado hacia donde va la pelota)
+            for index, px, py, salida in ((HIT_PLAYER, PLAYER_X, self.player_y, 1),
+                                          (HIT_AI, AI_X, self.ai_y, -1)):
+                toward = moving & (vx * salida < 0)
+                overlap = toward & ((x < px + PADDLE_WIDTH) & (px < x + size) &
+                                    (y < py + PADDLE_HEIGHT) & (py < y + size))
+                t_swept = _swept_time(x, y, dx, dy, px, py)
+                swept = toward & ~overlap & (t_swept < t_hit)
+                t_hit[overlap] = 0.0
+                t_hit[swept] = t_swept[swept]
+                hit[overlap | swept] = index
+
+            t_hit[~moving] = 0.0
+            x += dx * t_hit
+            y += dy * t_hit
+
+            wall = hit == HIT_WALL
+            vy[wall] = -vy[wall]
+            y[wall] = np.clip(y[wall], 0, bottom - size)
+
+            for index, paddle_y, sign, delta in ((HIT_PLAYER, self.player_y, 1.0, -5),
+                                                 (HIT_AI, self.ai_y, -1.0, +5)):
+                rows = hit == index
+                if not rows.any():
+                    continue
+                bvx = sign * np.abs(vx[rows]) * 1.05
+                bvy = vy[rows] * 1.05
+                hit_pos = ((y[rows] + size / 2) - (paddle_y[rows] + PADDLE_HEIGHT / 2)) / (PADDLE_HEIGHT / 2)
+                bvy += hit_pos * 2
+                vx[rows] = np.clip(bvx, -MAX_BALL_SPEED, MAX_BALL_SPEED)
+                vy[rows] = np.clip(bvy, -MAX_BALL_SPEED, MAX_BALL_SPEED)
+                self.confianza[rows] = np.clip(self.confianza[rows] + delta, 0, 100)
+                self.rally[rows] += 1
+                if index == HIT_AI:
+                    self._aim(rows)  # La pelota vuelve hacia la IA izquierda
+
+            remaining *= 1.0 - t_hit
+            moving &= (hit != NO_HIT) & (remaining > 0.0)
+
+    def _score(self, live):
+        ai_scores = live & (self.x <= 0)
+        player_scores = live & ~ai_scores & (self.x + BALL_SIZE >= WIDTH)
+
+        # IA anota: +25 confianza
+        self.score_ai[ai_scores] += 1
+        self.ai_hp[ai_scores] = np.maximum(self.ai_hp[ai_scores] - 10, 0)
+        self.player_hp[ai_scores] = np.maximum(self.player_hp[ai_scores] - 15, 0)
+        self.confianza[ai_scores] = np.minimum(self.confianza[ai_scores] + 25, 100)
+
+        # Jugador anota: -25 confianza
+        self.score_player[player_scores] += 1
+        self.ai_hp[player_scores] = np.maximum(self.ai_hp[player_scores] - 15, 0)
+        self.confianza[player_scores] = np.maximum(self.confianza[player_scores] - 25, 0)
+
+        scored = ai_scores | player_scores
+        self.rally_total[scored] += self.rally[scored]
+        self.serve(scored)
+
+        self.done |= ((self.player_hp <= 0) | (self.ai_hp <= 0) |
+                      (self.score_player >= WIN_SCORE) | (self.score_ai >= WIN_SCORE))
@@ -0,0 +1,202 @@
+# ============================================================================
+# src/camera.py - Perfiles de Captura y Negociación con la Cámara
+# ============================================================================
+
+import json
+import time
+
+import cv2
+
+# Archivo donde se recuerda el perfil elegido para cada cámara
+PROFILE_CACHE = ".camera_profile.json"
+
+# Para gestos basta una resolución baja: la vista previa es 200x140 y la
+# inferencia trabaja a ~256 px. Se prefiere MJPG (menos ancho de banda USB).
+DEFAULT_MIN_WIDTH = 320
+
+
+class CaptureProfile:
+    """Resolución, FPS, formato de píxel y tamaño de buffer pedidos al driver"""
+
+    def __init__(self, width, height, fps, fourcc="MJPG", buffer_size=1):
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.fourcc = fourcc
+        self.buffer_size = buffer_size
+
+    def __str__(self):
+        return f"{self.width}x{self.height}@{self.fps}:{self.fourcc}"
+
+    @classmethod
+    def parse(cls, text):
+        """Lee un perfil escrito como "640x480@30:MJPG" (formato opcional)"""
+        size, _, rest = text.partition("@")
+        fps, _, fourcc = rest.partition(":")
+        width, height = (int(v) for v in size.split("x"))
+        return cls(width, height, int(fps), fourcc or "MJPG")
+
+    def apply(self, cap):
+        """Configura la cámara (el formato va primero: en V4L2 limita el resto)"""
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*self.fourcc))
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+        cap.set(cv2.CAP_PROP_FPS, self.fps)
+        # Buffer de 1: siempre el frame más nuevo, nunca uno atrasado
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, self.buffer_size)
+
+
+# Candidatos en orden de preferencia
+PERFILES = [
+    CaptureProfile(640, 480, 30, "MJPG"),
+    CaptureProfile(640, 480, 60, "MJPG"),
+    CaptureProfile(320, 240, 30, "MJPG"),
+    CaptureProfile(320, 240, 60, "MJPG"),
+    CaptureProfile(640, 480, 30, "YUYV"),
+    CaptureProfile(320, 240, 30, "YUYV"),
+]
+
+
+def _fourcc_actual(cap):
+    """Formato que el driver dice usar ("" si el backend no lo informa)"""
+    code = int(cap.get(cv2.CAP_PROP_FOURCC))
+    if code == 0:
+        return ""
+    return "".join(chr((code >> 8 * i) & 0xFF) for i in range(4))
+
+
+def probar_perfil(cap, profile, frames=15, descartar=3):
+    """
+    Aplica un perfil y mide un calentamiento corto
+
+    Returns:
+        Dict con lo que el driver aceptó realmente, los FPS medidos y el
+        costo de CPU por frame (decodificación incluida)
+    """
+    profile.apply(cap)
+    for _ in range(descartar):  # Los primeros frames tras cambiar de formato son lentos
+        cap.read()
+
+    leidos = 0
+    inicio = time.perf_counter()
+    # CPU de este hilo solamente: la negociación corre en paralelo con la
+    # carga de MediaPipe (ver iniciar_captura) y process_time la sumaría
+    cpu_inicio = time.thread_time()
+    for _ in range(frames):
+        ret, _ = cap.read()
+        leidos += ret
+    duracion = time.perf_counter() - inicio
+    cpu = time.thread_time() - cpu_inicio
+
+    return {
+        "perfil": str(profile),
+        "ancho": int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+        "alto": int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+        "formato": _fourcc_actual(cap),
+        "ok": leidos == frames,
+        "fps_medido": leidos / duracion if duracion > 0 else 0.0,
+        "cpu_ms": cpu * 1000 / leidos if leidos else float("inf"),
+    }
+
+
+def _respetado(profile, medicion):
+    """True si el driver entregó el tamaño y el formato pedidos"""
+    if (medicion["ancho"], medicion["alto"]) != (profile.width, profile.height):
+        return False
+    return medicion["formato"] in ("", profile.fourcc)
+
+
+def _puntaje(medicion):
+    """Menor es mejor: intervalo entre frames + CPU por frame (ms)"""
+    if not medicion["ok"] or medicion["fps_medido"] <= 0:
+        return float("inf")
+    return 1000 / medicion["fps_medido"] + medicion["cpu_ms"]
+
+
+def negociar_perfil(cap, candidatos=PERFILES, min_width=DEFAULT_MIN_WIDTH):
+    """
+    Prueba cada perfil candidato y retorna (mejor_perfil, mediciones).
+    Descarta perfiles que el driver no respeta (entrega otro tamaño u otro
+    formato) y los de menos de min_width de ancho. Si el driver baja los FPS
+    pedidos, el puntaje usa los FPS medidos, así que ante un empate gana el
+    candidato anterior de la lista (el que pide lo que realmente entrega).
+    """
+    mediciones = []
+    mejor = None
+    mejor_puntaje = float("inf")
+
+    for profile in candidatos:
+        medicion = probar_perfil(cap, profile)
+        mediciones.append(medicion)
+        print(f"   {medicion['perfil']:<18} → {medicion['ancho']}x{medicion['alto']} "
+              f"{medicion['formato']} {medicion['fps_medido']:5.1f} FPS "
+              f"{medicion['cpu_ms']:5.2f} ms CPU")
+
+        if not _respetado(profile, medicion):
+            print("      (descartado: el driver entregó otro tamaño o formato)")
+            continue
+        puntaje = _puntaje(medicion)
+        if medicion["ancho"] >= min_width and puntaje < mejor_puntaje:
+            mejor, mejor_puntaje = profile, puntaje
+
+    return mejor, mediciones
+
+
+def _leer_cache(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _guardar_cache(path, cache):
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+    except OSError as e:
+        print(f"⚠️ No se pudo guardar el perfil de cámara: {e}")
+
+
+def abrir_camara(index, perfil="auto", cache_path=PROFILE_CACHE):
+    """
+    Abre la cámara con un perfil de captura
+
+    Args:
+        index: Índice de la cámara
+        perfil: "auto" (negociar y recordar), "none" (valores del driver),
+                o un perfil escrito como "640x480@30:MJPG"
+        cache_path: Archivo donde se recuerda el perfil elegido en modo auto
+    """
+    cap = cv2.VideoCapture(index)
+    if not cap.isOpened() or perfil in (None, "none"):
+        return cap
+
+    if perfil != "auto":
+        CaptureProfile.parse(perfil).apply(cap)
+        return cap
+
+    cache = _leer_cache(cache_path)
+    guardado = cache.get(str(index))
+    if guardado:
+        profile = CaptureProfile.parse(guardado)
+        profile.apply(cap)
+        ret, _ = cap.read()
+        if ret:
+            print(f"📷 Cámara {index}: perfil {profile} (guardado)")
+            return cap
+
+    print(f"🔍 Negociando perfil de la cámara {index}...")
+    profile, _ = negociar_perfil(cap)
+    if profile is None:
+        print("⚠️ Ningún perfil funcionó, se usan los valores del driver")
+        # La captura quedó con el último perfil probado: reabrirla vuelve a
+        # los valores por defecto del driver
+        cap.release()
+        return cv2.VideoCapture(index)
+
+    profile.apply(cap)
+    print(f"📷 Cámara {index}: perfil {profile}")
+    cache[str(index)] = str(profile)
+    _guardar_cache(cache_path, cache)
+    return cap
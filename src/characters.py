@@ -5,6 +5,15 @@
 import pygame
 import random
 import os
+from src.assets import assets, load_image
+from src.sprite_atlas import SpriteAtlas
+
+# girl1 = neutral, girl2 = smug, girl3 = angry
+SPRITE_FILES = ["girl1.png", "girl2.png", "girl3.png"]
+EXPRESIONES = ("neutral", "smug", "angry")
+
+# Tamaños del retrato que usa la interfaz: diálogo del menú y caja del juego
+PORTRAIT_SIZES = (160, 100)
 
 # Frases según el estado de la flaca
 neutral_lines = [
@@ -33,48 +42,44 @@ angry_lines = [
     "Para para 😭",
 ]
 
-def load_girl_sprites():
+def load_girl_images():
     """
-    Carga los sprites de la flaca desde assets/sprites/
+    Carga los sprites de la flaca desde assets/sprites/, ya escalados al
+    retrato más grande (vía caché en disco: solo la primera vez se decodifica
+    el PNG). No toca la pantalla, así que puede correr en un hilo de fondo.
     Retorna una tupla: (neutral, smug, angry)
     """
     sprite_path = "assets/sprites/"
+    size = max(PORTRAIT_SIZES)
     sprites = []
     
-    # Intentar cargar cada sprite (girl1 = neutral, girl2 = smug, girl3 = angry)
-    sprite_files = ["girl1.png", "girl2.png", "girl3.png"]
-    
-    print("🔍 Buscando sprites de la flaca...")
-    
-    for sprite_file in sprite_files:
+    for sprite_file in SPRITE_FILES:
         full_path = os.path.join(sprite_path, sprite_file)
         
         # Verificar si existe
         if os.path.exists(full_path):
             try:
-                print(f"✅ Cargando: {full_path}")
-                sprite = pygame.image.load(full_path).convert_alpha()
-                
-                # Obtener tamaño original
-                original_size = sprite.get_size()
-                print(f"   Tamaño original: {original_size}")
-                
-                # Escalar a 160x160 (se ajustará después en el juego)
-                sprite = pygame.transform.scale(sprite, (160, 160))
-                sprites.append(sprite)
-                print(f"   ✓ Sprite cargado correctamente")
-                
+                sprites.append(load_image(full_path, (size, size)))
             except Exception as e:
                 print(f"❌ Error cargando {sprite_file}: {e}")
                 sprites.append(create_placeholder_sprite())
         else:
-            print(f"⚠️ No se encontró: {full_path}")
-            print(f"   Usando placeholder para {sprite_file}")
+            print(f"⚠️ No se encontró: {full_path}, usando placeholder")
             sprites.append(create_placeholder_sprite())
     
-    print(f"📊 Total sprites cargados: {len(sprites)}")
     return tuple(sprites)
 
+def load_girl_atlas(sizes=PORTRAIT_SIZES, smooth=True):
+    """
+    Carga las expresiones de la flaca en un atlas con una variante
+    pre-escalada por cada tamaño de la interfaz (se busca por (expresión, tamaño))
+    """
+    return SpriteAtlas(dict(zip(EXPRESIONES, assets.get("girl_images"))), sizes, smooth)
+
+# Se cargan una sola vez por proceso (el juego y el menú comparten el atlas)
+assets.register("girl_images", load_girl_images)
+assets.register("girl_atlas", load_girl_atlas)
+
 def create_placeholder_sprite():
     """Crea un sprite placeholder simple"""
     surface = pygame.Surface((160, 160), pygame.SRCALPHA)
@@ -121,7 +126,8 @@ def get_expression_by_confianza(confianza, sprites):
     
     Args:
         confianza: Valor del confianzómetro (0-100)
-        sprites: Tupla (neutral, smug, angry)
+        sprites: Tupla (neutral, smug, angry); puede ser EXPRESIONES para
+                 obtener el nombre de la expresión en el atlas
     
     Returns:
         Tupla (sprite, frase)
@@ -186,8 +192,7 @@ class Character:
         """Intenta cargar la imagen del personaje para la pantalla de diálogo"""
         # Para la pantalla de diálogo, usar el sprite neutral
         try:
-            sprites = load_girl_sprites()
-            return sprites[0]  # Neutral
+            return assets.get("girl_atlas").get("neutral", 160)
         except Exception as e:
             print(f"⚠️ Error cargando sprite del personaje: {e}")
             return create_placeholder_sprite()
@@ -0,0 +1,109 @@
+# ============================================================================
+# src/control.py - Control Proporcional de la Paleta con la Mano
+# ============================================================================
+
+import math
+
+# Landmarks de la palma: muñeca + base de cada dedo
+PALM_LANDMARKS = [0, 5, 9, 13, 17]
+
+
+def _alpha(cutoff, dt):
+    """Factor de suavizado de un filtro pasa-bajos de primer orden"""
+    tau = 1.0 / (2 * math.pi * cutoff)
+    return 1.0 / (1.0 + tau / dt)
+
+
+class OneEuroFilter:
+    """
+    Filtro One-Euro (Casiez et al.): suaviza mucho cuando la mano está
+    quieta y poco cuando se mueve rápido. También entrega la velocidad
+    filtrada, que se usa para predecir hacia adelante.
+    """
+
+    def __init__(self, min_cutoff=1.0, beta=0.02, d_cutoff=1.0):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.reset()
+
+    def reset(self):
+        self.value = None
+        self.velocity = 0.0
+        self.timestamp = None
+
+    def __call__(self, x, timestamp):
+        """Filtra la muestra x tomada en timestamp (segundos)"""
+        if self.value is None:
+            self.value = x
+            self.velocity = 0.0
+            self.timestamp = timestamp
+            return x
+
+        dt = timestamp - self.timestamp
+        if dt <= 0:
+            return self.value
+
+        # Velocidad filtrada
+        raw_velocity = (x - self.value) / dt
+        a_d = _alpha(self.d_cutoff, dt)
+        self.velocity = a_d * raw_velocity + (1 - a_d) * self.velocity
+
+        # Corte adaptativo según la velocidad
+        cutoff = self.min_cutoff + self.beta * abs(self.velocity)
+        a = _alpha(cutoff, dt)
+        self.value = a * x + (1 - a) * self.value
+        self.timestamp = timestamp
+        return self.value
+
+
+class ProportionalPaddleControl:
+    """
+    Lleva la altura de la mano directo a la posición de la paleta.
+
+    - La altura de la palma (0..1 en la cámara) se mapea al rango de la
+      paleta; hand_range recorta los bordes donde la mano sale del cuadro
+    - Un One-Euro quita el temblor y estima la velocidad
+    - En cada frame de render se extrapola desde la captura hasta "ahora"
+      (+ lead), compensando la latencia medida de cámara + inferencia
+    """
+
+    def __init__(self, min_y, max_y, hand_range=(0.2, 0.8), lead=1 / 60,
+                 max_prediction=0.15, reset_after=0.5, filter_params=None):
+        self.min_y = min_y
+        self.max_y = max_y
+        self.hand_range = hand_range
+        self.lead = lead
+        self.max_prediction = max_prediction
+        self.reset_after = reset_after
+        self.filter = OneEuroFilter(**(filter_params or {}))
+
+        self.last_frame_id = None
+        self.latency = 0.0  # Latencia medida (media móvil), en segundos
+
+    def update(self, landmarks, timestamp, frame_id, now):
+        """Incorpora una medición nueva del tracker (ignora frames repetidos)"""
+        if frame_id == self.last_frame_id:
+            return
+        self.last_frame_id = frame_id
+
+        # Mano perdida un buen rato: no arrastrar la velocidad vieja
+        if self.filter.timestamp is not None and timestamp - self.filter.timestamp > self.reset_after:
+            self.filter.reset()
+
+        hand_y = float(landmarks[PALM_LANDMARKS, 1].mean())
+        low, high = self.hand_range
+        t = min(max((hand_y - low) / (high - low), 0.0), 1.0)
+        self.filter(self.min_y + t * (self.max_y - self.min_y), timestamp)
+
+        latency = now - timestamp
+        self.latency = latency if self.latency == 0.0 else 0.9 * self.latency + 0.1 * latency
+
+    def target(self, now):
+        """Posición (centro Y) predicha para el frame que se está dibujando"""
+        if self.filter.value is None:
+            return None
+
+        horizon = min(now - self.filter.timestamp + self.lead, self.max_prediction)
+        predicted = self.filter.value + self.filter.velocity * horizon
+        return min(max(predicted, self.min_y), self.max_y)
@@ -0,0 +1,65 @@
+# ============================================================================
+# src/frame_pipeline.py - Pipeline de Frames sin Asignaciones por Frame
+# ============================================================================
+
+import cv2
+import numpy as np
+
+PREVIEW_SIZE = (200, 140)
+
+
+class FramePipeline:
+    """
+    Convierte los frames de la cámara usando buffers reservados una sola vez.
+
+    - La captura se lee siempre sobre el mismo array (cap.read(buffer))
+    - BGR → RGB + espejo se hace una sola vez; ese RGB lo usan MediaPipe
+      y la vista previa
+    - La vista previa se escala dentro de un ring de buffers fijos, para
+      que el consumidor pueda leer uno mientras se escribe el siguiente
+    """
+
+    def __init__(self, preview_size=PREVIEW_SIZE, preview_buffers=3):
+        self.preview_size = preview_size
+        width, height = preview_size
+
+        self._capture = None    # Frame BGR tal como llega de la cámara
+        self._converted = None  # RGB sin espejo (paso intermedio)
+        self._rgb = None        # RGB espejado (MediaPipe + vista previa)
+
+        self._previews = [np.empty((height, width, 3), dtype=np.uint8)
+                          for _ in range(preview_buffers)]
+        self._next_preview = 0
+
+    def read(self, cap):
+        """Lee un frame de la cámara reutilizando el buffer de captura"""
+        ret, frame = cap.read(self._capture)
+        if ret:
+            self._capture = frame
+        return ret, frame
+
+    def prepare(self, frame):
+        """Espeja y convierte un frame BGR a RGB dentro del buffer fijo"""
+        if self._rgb is None or self._rgb.shape != frame.shape:
+            # Solo se reserva al inicio o si cambia la resolución
+            self._converted = np.empty_like(frame)
+            self._rgb = np.empty_like(frame)
+
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._converted)
+        cv2.flip(self._converted, 1, dst=self._rgb)
+        return self._rgb
+
+    def preview(self, rgb, dst=None):
+        """
+        Escala el frame RGB a la vista previa
+
+        Args:
+            rgb: Frame RGB (normalmente el retornado por prepare)
+            dst: Buffer destino opcional (ej. un slot de memoria compartida);
+                 si es None se usa el siguiente buffer del ring
+        """
+        if dst is None:
+            dst = self._previews[self._next_preview]
+            self._next_preview = (self._next_preview + 1) % len(self._previews)
+        cv2.resize(rgb, self.preview_size, dst=dst)
+        return dst
@@ -0,0 +1,166 @@
+# ============================================================================
+# src/frame_sources.py - Fuentes de Frames (Cámara, Video, Imágenes, Sintética)
+# ============================================================================
+
+import glob
+import os
+import time
+
+import cv2
+import numpy as np
+from src.camera import abrir_camara
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+
+class _Pacer:
+    """Espera lo necesario para entregar frames a un ritmo fijo (modo realtime)"""
+
+    def __init__(self, fps):
+        self.frame_time = 1.0 / fps
+        self._next_time = None
+
+    def wait(self):
+        now = time.perf_counter()
+        if self._next_time is not None and self._next_time > now:
+            time.sleep(self._next_time - now)
+            now = self._next_time
+        self._next_time = now + self.frame_time
+
+
+class VideoFileSource:
+    """
+    Video grabado. Con realtime=True respeta los FPS del archivo (para jugar
+    con una grabación); con realtime=False entrega frames lo más rápido posible.
+    """
+
+    def __init__(self, path, loop=True, realtime=True):
+        self.path = path
+        self.loop = loop
+        self.realtime = realtime
+        self._cap = cv2.VideoCapture(path)
+        if not self._cap.isOpened():
+            raise IOError(f"No se pudo abrir el video: {path}")
+
+        fps = self._cap.get(cv2.CAP_PROP_FPS)
+        self._pacer = _Pacer(fps if fps > 0 else 30)
+
+    def read(self, image=None):
+        ret, frame = self._cap.read(image)
+        if not ret and self.loop:
+            self._cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = self._cap.read(image)
+
+        if ret and self.realtime:
+            self._pacer.wait()
+        return ret, frame
+
+    def isOpened(self):
+        return self._cap.isOpened()
+
+    def release(self):
+        self._cap.release()
+
+
+class ImageSequenceSource:
+    """Carpeta de imágenes (orden alfabético), opcionalmente en loop"""
+
+    def __init__(self, directory, loop=True, fps=30, realtime=True):
+        self.paths = sorted(p for p in glob.glob(os.path.join(directory, "*"))
+                            if p.lower().endswith(IMAGE_EXTENSIONS))
+        if not self.paths:
+            raise IOError(f"No hay imágenes en: {directory}")
+
+        self.loop = loop
+        self.realtime = realtime
+        self._pacer = _Pacer(fps)
+        self._index = 0
+
+    def read(self, image=None):
+        if self._index >= len(self.paths):
+            if not self.loop:
+                return False, None
+            self._index = 0
+
+        frame = cv2.imread(self.paths[self._index])
+        self._index += 1
+        if frame is None:
+            return False, None
+
+        if self.realtime:
+            self._pacer.wait()
+        return True, frame
+
+    def isOpened(self):
+        return True
+
+    def release(self):
+        pass
+
+
+class SyntheticSource:
+    """
+    Frames generados (fondo con ruido + un círculo color piel que sube y baja).
+    MediaPipe no ve una mano real aquí: sirve para medir el costo del pipeline
+    sin cámara ni archivos.
+    """
+
+    def __init__(self, width=640, height=480, fps=30, realtime=False, seed=0):
+        self.width = width
+        self.height = height
+        self.realtime = realtime
+        self._pacer = _Pacer(fps)
+        self._index = 0
+
+        rng = np.random.default_rng(seed)
+        self._background = rng.integers(0, 60, (height, width, 3), dtype=np.uint8)
+
+    def read(self, image=None):
+        if image is None or image.shape != self._background.shape:
+            image = np.empty_like(self._background)
+        np.copyto(image, self._background)
+
+        # Mano falsa: círculo que oscila verticalmente
+        phase = (self._index % 120) / 120
+        center_y = int(self.height * (0.25 + 0.5 * abs(2 * phase - 1)))
+        cv2.circle(image, (self.width // 2, center_y), self.height // 8, (140, 170, 220), -1)
+        self._index += 1
+
+        if self.realtime:
+            self._pacer.wait()
+        return True, image
+
+    def isOpened(self):
+        return True
+
+    def release(self):
+        pass
+
+
+def abrir_fuente(spec, realtime=True, camera_profile="none"):
+    """
+    Abre una fuente de frames a partir de un texto:
+
+    - "0", "1", ... (o un int) → cámara (cv2.VideoCapture), configurada con
+      camera_profile ("none", "auto" o "640x480@30:MJPG", ver src/camera.py)
+    - "synthetic" o "synthetic:640x480" → SyntheticSource
+    - una carpeta → ImageSequenceSource
+    - cualquier otro → VideoFileSource
+
+    Todas tienen read(image=None) → (ret, frame), isOpened() y release(),
+    la misma interfaz de cv2.VideoCapture.
+    """
+    if isinstance(spec, int) or str(spec).isdigit():
+        return abrir_camara(int(spec), camera_profile)
+
+    spec = str(spec)
+    if spec.startswith("synthetic"):
+        width, height = 640, 480
+        if ":" in spec:
+            width, height = (int(v) for v in spec.split(":", 1)[1].split("x"))
+        return SyntheticSource(width, height, realtime=realtime)
+
+    if os.path.isdir(spec):
+        return ImageSequenceSource(spec, realtime=realtime)
+
+    return VideoFileSource(spec, realtime=realtime)
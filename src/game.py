@@ -2,10 +2,21 @@
 # src/game.py - Pong con Caja de Diálogo Fija Abajo (Estilo Undertale)
 # ============================================================================
 
+import math
 import pygame
-import random
-from src.ai import move_ai
-from src.characters import load_girl_sprites, get_expression_by_confianza
+from src.particles import ParticleSystem
+from src.model import (
+    WIDTH, GAME_AREA_HEIGHT, PADDLE_WIDTH, PADDLE_HEIGHT, BALL_SIZE, PLAYER_X, AI_X,
+    FRAME_DT, DIFFICULTY_SETTINGS, MatchModel,
+    clamp_paddle as _clamp_paddle,
+)
+from src.assets import assets
+from src.characters import EXPRESIONES, get_expression_by_confianza
+from src.render_layers import StaticLayer
+from src.text_cache import blit_glyphs, get_font, preload_glyphs, render_text, text_width
+from src.text_layout import get_layout
+from src.timestep import FixedTimestep
+from src.trail import TrailHistory, TrailSpriteBank
 
 # Colores
 BLACK = (0, 0, 0)
@@ -21,108 +32,175 @@ LIGHT_GRAY = (200, 200, 200)
 DARK_BLUE = (30, 30, 60)
 BEIGE = (240, 224, 200)
 
-# Configuración del juego
-WIDTH, HEIGHT = 800, 600
-GAME_AREA_HEIGHT = 450  # El juego ocupa solo la parte superior
+# Configuración del juego (la simulación: área, paletas y pelota, en src/model.py)
+HEIGHT = 600
 DIALOGUE_BOX_HEIGHT = 150  # Altura de la caja de diálogo fija
 
-PADDLE_WIDTH, PADDLE_HEIGHT = 10, 80
-BALL_SIZE = 12
+# Frecuencia por defecto de la simulación (independiente de los FPS)
+TICK_RATE = 120
+
+HP_BAR_WIDTH, HP_BAR_HEIGHT = 120, 12
+CONF_BAR_WIDTH, CONF_BAR_HEIGHT = 150, 12
+PORTRAIT_SIZE = 100
+
+
+def _dialogue_layout():
+    """Posiciones fijas dentro de la caja de diálogo (retrato, texto, barra)"""
+    border_margin = 15
+    box_height = HEIGHT - GAME_AREA_HEIGHT
+    inner_box = pygame.Rect(border_margin, GAME_AREA_HEIGHT + border_margin, 
+                            WIDTH - border_margin * 2, box_height - border_margin * 2)
+    portrait_x = inner_box.x + 10
+    portrait_y = inner_box.y + (inner_box.height - PORTRAIT_SIZE) // 2
+    text_x = portrait_x + PORTRAIT_SIZE + 15
+    text_y = inner_box.y + 15
+    return {
+        "inner_box": inner_box,
+        "portrait": (portrait_x, portrait_y),
+        "text": (text_x, text_y),
+        "text_width": inner_box.width - PORTRAIT_SIZE - 40,
+        "conf_bar": (text_x, text_y + 55),
+    }
+
+
+DIALOGUE_LAYOUT = _dialogue_layout()
+
+
+def _model_attr(name):
+    """Atributo de Game que lee y escribe el del MatchModel"""
+    return property(lambda self: getattr(self.model, name),
+                    lambda self, value: setattr(self.model, name, value))
+
 
 class Game:
-    def __init__(self, difficulty):
+    """Vista pygame de un MatchModel: sprites, partículas, audio y dibujo"""
+    
+    body = _model_attr("ball")
+    player_y = _model_attr("player_y")
+    ai_y = _model_attr("ai_y")
+    score_player = _model_attr("score_player")
+    score_ai = _model_attr("score_ai")
+    player_hp = _model_attr("player_hp")
+    ai_hp = _model_attr("ai_hp")
+    confianza = _model_attr("confianza")
+    ai_speed = _model_attr("ai_speed")
+    
+    def __init__(self, difficulty, dos_jugadores=False, dirty_rects=False):
         """
         Inicializa el juego con la dificultad seleccionada
         difficulty: 0=Fácil, 1=Normal, 2=Difícil, 3=Dios
+        dos_jugadores: si es True la paleta derecha la controla otra persona (sin IA)
+        dirty_rects: si es True, draw solo repinta lo que cambió y retorna esos
+                     rects para pygame.display.update(rects)
         """
         self.difficulty = difficulty
+        self.dos_jugadores = dos_jugadores
+        self.dirty_rects = dirty_rects
         
-        # Configuración según dificultad
-        self.difficulty_settings = {
-            0: {"ball_speed": 5, "ai_speed": 3, "ai_reaction": 0.7},
-            1: {"ball_speed": 6, "ai_speed": 5, "ai_reaction": 0.85},
-            2: {"ball_speed": 7, "ai_speed": 7, "ai_reaction": 0.95},
-            3: {"ball_speed": 8, "ai_speed": 8, "ai_reaction": 1.0}
-        }
-        
-        settings = self.difficulty_settings[difficulty]
+        # Estado de la simulación (sin pygame)
+        self.difficulty_settings = DIFFICULTY_SETTINGS
+        self.model = MatchModel(difficulty, ai_right=not dos_jugadores)
         
-        # Paletas (ajustadas para el área de juego más pequeña)
-        self.player_paddle = pygame.Rect(30, GAME_AREA_HEIGHT//2 - PADDLE_HEIGHT//2, 
-                                        PADDLE_WIDTH, PADDLE_HEIGHT)
-        self.ai_paddle = pygame.Rect(WIDTH - 40, GAME_AREA_HEIGHT//2 - PADDLE_HEIGHT//2, 
-                                     PADDLE_WIDTH, PADDLE_HEIGHT)
+        # Rects solo para dibujar (se copian desde el modelo en _sync_rects)
+        self.player_paddle = pygame.Rect(PLAYER_X, 0, PADDLE_WIDTH, PADDLE_HEIGHT)
+        self.ai_paddle = pygame.Rect(AI_X, 0, PADDLE_WIDTH, PADDLE_HEIGHT)
+        self.ball = pygame.Rect(0, 0, BALL_SIZE, BALL_SIZE)
+        self._sync_rects()
         
-        # Pelota
-        self.ball = pygame.Rect(WIDTH//2, GAME_AREA_HEIGHT//2, BALL_SIZE, BALL_SIZE)
-        self.ball_speed_x = settings["ball_speed"] * random.choice([-1, 1])
-        self.ball_speed_y = settings["ball_speed"] * random.choice([-1, 1])
-        
-        # Velocidades actuales
-        self.current_ball_speed_x = self.ball_speed_x
-        self.current_ball_speed_y = self.ball_speed_y
-        
-        # Puntajes
-        self.score_player = 0
-        self.score_ai = 0
+        # Posiciones del tick anterior, para interpolar el dibujo entre ticks
+        self._prev_positions = self._positions()
         
-        # HP
-        self.player_hp = 100
-        self.ai_hp = 100
-        
-        # 🔥 CONFIANZÓMETRO (0-100)
-        self.confianza = 50  # Empieza neutral
-        
-        # Velocidad del jugador y AI
+        # Velocidad del jugador
         self.player_speed = 7
-        self.ai_speed = settings["ai_speed"]
         
-        # Cargar sprites de la flaca
+        # Cargar sprites de la flaca (atlas con el retrato ya escalado)
         try:
-            self.girl_sprites = load_girl_sprites()
-            self.current_girl_sprite = self.girl_sprites[0]  # neutral por defecto
+            self.girl_atlas = assets.get("girl_atlas")
+            self.current_girl_expression = "neutral"
             self.current_girl_line = "¡Vamos a jugar! 😏"
         except Exception as e:
             print(f"⚠️ No se pudieron cargar los sprites: {e}")
-            self.girl_sprites = None
-            self.current_girl_sprite = None
+            self.girl_atlas = None
+            self.current_girl_expression = None
             self.current_girl_line = "¡Vamos!"
         
         # Fuentes
-        self.font_score = pygame.font.SysFont("Courier New", 40, bold=True)
-        self.font_small = pygame.font.SysFont("Courier New", 18)
-        self.font_dialogue = pygame.font.SysFont("Arial", 16, bold=True)
-        self.font_tiny = pygame.font.SysFont("Courier New", 12)
+        self.font_score = get_font("Courier New", 40, bold=True)
+        self.font_small = get_font("Courier New", 18)
+        self.font_dialogue = get_font("Arial", 16, bold=True)
+        self.font_tiny = get_font("Courier New", 12)
+        # Glifos del marcador y del porcentaje, listos antes del primer punto
+        preload_glyphs(self.font_score, "0123456789 :", WHITE)
+        preload_glyphs(self.font_score, "0123456789 :", GRAY)
+        preload_glyphs(self.font_tiny, "0123456789%", BLACK)
         
         # 🎮 Trail de la pelota
-        self.ball_trail = []
+        # Un punto por frame de 60 Hz de simulación, sin importar el tick rate:
+        # la estela cubre siempre max_trail_length / 60 s
         self.max_trail_length = 8
+        self.ball_trail = TrailHistory(self.max_trail_length)
+        self._trail_clock = 0.0
+        self.trail_sprites = TrailSpriteBank(self.max_trail_length, BALL_SIZE, YELLOW)
+        
+        # ✨ Chispas al golpear y explosión al anotar (solo dentro del área de juego)
+        self.particles = ParticleSystem(
+            capacity=2048,
+            palette=(YELLOW, ORANGE, WHITE, GREEN, CYAN),
+            bounds=(0, 0, WIDTH, GAME_AREA_HEIGHT),
+        )
         
         # Timer para animación de texto
         self.text_animation_frame = 0
+        
+        # Capa pre-dibujada con todo lo fijo (se rehace si cambia la resolución)
+        self.static_layer = StaticLayer(self.draw_static)
+        
+        # Modo dirty rects: lo dibujado en el frame anterior (None = repintar todo)
+        self._prev_rects = None
+        
+        # Funciones listener(evento) que reciben "bounce", "hit" y "score" (audio, etc.)
+        self.event_listeners = []
+    
+    def emit(self, event):
+        """Publica un evento del partido a los listeners"""
+        for listener in self.event_listeners:
+            listener(event)
+    
+    def _positions(self):
+        return (self.body.x, self.body.y, self.player_y, self.ai_y)
+    
+    def _sync_rects(self):
+        """Copia las posiciones float a los Rect (solo para dibujar)"""
+        self.ball.topleft = (round(self.body.x), round(self.body.y))
+        self.player_paddle.y = round(self.player_y)
+        self.ai_paddle.y = round(self.ai_y)
     
     def reset_ball(self):
         """Reinicia la posición de la pelota"""
-        self.ball.center = (WIDTH//2, GAME_AREA_HEIGHT//2)
-        settings = self.difficulty_settings[self.difficulty]
-        self.ball_speed_x = settings["ball_speed"] * random.choice([-1, 1])
-        self.ball_speed_y = settings["ball_speed"] * random.choice([-1, 1])
-        self.current_ball_speed_x = self.ball_speed_x
-        self.current_ball_speed_y = self.ball_speed_y
+        self.model.serve()
+        self._sync_rects()
+        self._prev_positions = self._positions()  # El salto al centro no se interpola
         self.ball_trail.clear()
     
+    def score_burst(self, x, y):
+        """Explosión de partículas donde salió la pelota"""
+        x = min(max(x, BALL_SIZE), WIDTH - BALL_SIZE)
+        self.particles.emit(x, y, 300, speed=(2.0, 9.0), life=(30, 60))
+    
     def update_confianza(self, change):
         """Actualiza el confianzómetro y cambia la expresión si es necesario"""
         old_confianza = self.confianza
-        self.confianza = max(0, min(100, self.confianza + change))
-        
-        # Solo actualizar expresión si cambió de rango significativo
+        self.model.add_confianza(change)
+        self.update_expression(old_confianza)
+    
+    def update_expression(self, old_confianza):
+        """Cambia la expresión si la confianza cambió de rango significativo"""
         old_state = self.get_confianza_state(old_confianza)
         new_state = self.get_confianza_state(self.confianza)
         
-        if old_state != new_state and self.girl_sprites:
-            self.current_girl_sprite, self.current_girl_line = get_expression_by_confianza(
-                self.confianza, self.girl_sprites
+        if old_state != new_state and self.girl_atlas:
+            self.current_girl_expression, self.current_girl_line = get_expression_by_confianza(
+                self.confianza, EXPRESIONES
             )
     
     def get_confianza_state(self, confianza):
@@ -134,287 +212,289 @@ class Game:
         else:
             return 1  # Neutral
     
-    def update(self):
+    def update(self, dt=FRAME_DT):
         """
-        Actualiza la lógica del juego
+        Avanza la lógica del juego un tick de `dt` segundos
         Retorna True si el juego terminó
         """
-        # Movimiento del jugador
-        # Movimiento de la IA
-        move_ai(self.ai_paddle, self.ball, self.ai_speed)
-        
-        # Asegurar que las paletas no salgan del área de juego
-        if self.player_paddle.top < 0:
-            self.player_paddle.top = 0
-        if self.player_paddle.bottom > GAME_AREA_HEIGHT:
-            self.player_paddle.bottom = GAME_AREA_HEIGHT
-        
-        if self.ai_paddle.top < 0:
-            self.ai_paddle.top = 0
-        if self.ai_paddle.bottom > GAME_AREA_HEIGHT:
-            self.ai_paddle.bottom = GAME_AREA_HEIGHT
-        
-        # 🎮 Guardar posición anterior para trail
-        self.ball_trail.append((self.ball.x, self.ball.y))
-        if len(self.ball_trail) > self.max_trail_length:
-            self.ball_trail.pop(0)
-        
-        # Movimiento de la pelota
-        self.ball.x += self.current_ball_speed_x
-        self.ball.y += self.current_ball_speed_y
-        
-        # Rebote en paredes superior e inferior (solo en área de juego)
-        if self.ball.top <= 0 or self.ball.bottom >= GAME_AREA_HEIGHT:
-            self.current_ball_speed_y *= -1
-            if self.ball.top <= 0:
-                self.ball.top = 0
-            if self.ball.bottom >= GAME_AREA_HEIGHT:
-                self.ball.bottom = GAME_AREA_HEIGHT
-        
-        # Colisión con paletas
-        if self.ball.colliderect(self.player_paddle):
-            self.current_ball_speed_x = abs(self.current_ball_speed_x)
-            # Jugador golpea: -5 confianza
-            self.update_confianza(-5)
-            # Aumentar ligeramente la velocidad
-            self.current_ball_speed_x *= 1.05
-            self.current_ball_speed_y *= 1.05
-            # Efecto de rebote variado según dónde golpea
-            hit_pos = (self.ball.centery - self.player_paddle.centery) / (PADDLE_HEIGHT / 2)
-            self.current_ball_speed_y += hit_pos * 2
-        
-        elif self.ball.colliderect(self.ai_paddle):
-            self.current_ball_speed_x = -abs(self.current_ball_speed_x)
-            # IA golpea: +5 confianza
-            self.update_confianza(+5)
-            # Aumentar ligeramente la velocidad
-            self.current_ball_speed_x *= 1.05
-            self.current_ball_speed_y *= 1.05
-            # Efecto de rebote variado
-            hit_pos = (self.ball.centery - self.ai_paddle.centery) / (PADDLE_HEIGHT / 2)
-            self.current_ball_speed_y += hit_pos * 2
-        
-        # Limitar velocidad máxima
-        max_speed = 25
-        if abs(self.current_ball_speed_x) > max_speed:
-            self.current_ball_speed_x = max_speed if self.current_ball_speed_x > 0 else -max_speed
-        if abs(self.current_ball_speed_y) > max_speed:
-            self.current_ball_speed_y = max_speed if self.current_ball_speed_y > 0 else -max_speed
-        
-        # Puntos
-        if self.ball.left <= 0:
-            # IA anota
-            self.score_ai += 1
-            self.ai_hp = max(0, self.ai_hp - 10)
-            self.player_hp = max(0, self.player_hp - 15)
-            # +25 confianza para la IA
-            self.update_confianza(+25)
-            self.reset_ball()
-        
-        if self.ball.right >= WIDTH:
-            # Jugador anota
-            self.score_player += 1
-            self.ai_hp = max(0, self.ai_hp - 15)
-            # -25 confianza para la IA
-            self.update_confianza(-25)
-            self.reset_ball()
+        k = dt / FRAME_DT  # Fracción de un frame de 60 Hz
+        self._prev_positions = self._positions()
+        
+        # 🎮 Guardar posición anterior para trail (a 60 Hz de simulación)
+        self._trail_clock += dt
+        if self._trail_clock >= FRAME_DT:
+            self._trail_clock %= FRAME_DT
+            self.ball_trail.push(self.ball.x, self.ball.y)
+        
+        old_confianza = self.confianza
+        events = self.model.step(k)
+        self._sync_rects()
+        
+        for event in events:
+            kind = event[0]
+            if kind == "hit":
+                _, index, x, y = event
+                if index == 0:
+                    self.particles.emit(x, y, 40, color=3, direction=0, spread=math.pi / 2)
+                else:
+                    self.particles.emit(x, y, 40, color=4, direction=math.pi,
+                                        spread=math.pi / 2)
+            elif kind == "score":
+                self.score_burst(event[2], event[3])
+                self._prev_positions = self._positions()  # El saque no se interpola
+                self.ball_trail.clear()
+            self.emit(kind)
+        
+        self.update_expression(old_confianza)
+        self.particles.update(k)
         
         # Actualizar animación de texto
         self.text_animation_frame += 1
         
         # Verificar fin del juego
-        if (self.player_hp <= 0 or self.ai_hp <= 0 or 
-            self.score_player >= 12 or self.score_ai >= 12):
-            return True
-        
-        return False
+        return self.model.finished
     
     def mover_paleta_cabeza(self, dy):
         """
         Movimiento del jugador 1 controlado por la cabeza (arriba/abajo)
-        dy: valor de movimiento (positivo abajo, negativo arriba)
+        dy: valor de movimiento (positivo abajo, negativo arriba); puede ser
+            fraccionario si se reparte entre varios ticks
         """
-        self.player_paddle.y += dy
+        # Limitar dentro del área de juego
+        self.player_y = _clamp_paddle(self.player_y + dy)
+        self.player_paddle.y = round(self.player_y)
 
+    def colocar_paleta_cabeza(self, centro_y):
+        """
+        Coloca la paleta del jugador en una posición absoluta (control proporcional)
+        centro_y: centro vertical deseado, en píxeles del área de juego
+        """
         # Limitar dentro del área de juego
-        if self.player_paddle.top < 0:
-            self.player_paddle.top = 0
-        if self.player_paddle.bottom > GAME_AREA_HEIGHT:
-            self.player_paddle.bottom = GAME_AREA_HEIGHT
+        self.player_y = _clamp_paddle(centro_y - PADDLE_HEIGHT / 2)
+        self.player_paddle.y = round(self.player_y)
+
+    def mover_paleta_rival(self, dy):
+        """
+        Movimiento de la paleta derecha en modo 2 jugadores
+        dy: valor de movimiento (positivo abajo, negativo arriba)
+        """
+        self.ai_y = _clamp_paddle(self.ai_y + dy)
+        self.ai_paddle.y = round(self.ai_y)
+
+    def colocar_paleta_rival(self, centro_y):
+        """Posición absoluta de la paleta derecha en modo 2 jugadores"""
+        self.ai_y = _clamp_paddle(centro_y - PADDLE_HEIGHT / 2)
+        self.ai_paddle.y = round(self.ai_y)
 
+
+    def request_full_redraw(self):
+        """El próximo draw repinta la pantalla completa (ej. al volver de un menú)"""
+        self._prev_rects = None
     
-    def draw(self, screen):
-        """Dibuja el juego en la pantalla"""
-        screen.fill(BLACK)
+    def interpolated_rects(self, alpha):
+        """
+        Rects (pelota, paleta jugador, paleta IA) entre el tick anterior
+        (alpha=0) y el actual (alpha=1)
+        """
+        if alpha >= 1.0:
+            return self.ball, self.player_paddle, self.ai_paddle
+        bx, by, py, ay = (prev + (cur - prev) * alpha
+                          for prev, cur in zip(self._prev_positions, self._positions()))
+        return (pygame.Rect(round(bx), round(by), BALL_SIZE, BALL_SIZE),
+                pygame.Rect(self.player_paddle.x, round(py), PADDLE_WIDTH, PADDLE_HEIGHT),
+                pygame.Rect(self.ai_paddle.x, round(ay), PADDLE_WIDTH, PADDLE_HEIGHT))
+    
+    def draw(self, screen, alpha=1.0):
+        """
+        Dibuja el juego en la pantalla
+        alpha: fracción del tick en curso, para interpolar pelota y paletas
+               (ver src/timestep.py); 1.0 = estado del último update
+        Retorna la lista de rects que cambiaron (la pantalla entera si no
+        está activo el modo dirty_rects)
+        """
+        full_redraw = not (self.dirty_rects and self.static_layer.enabled
+                           and self._prev_rects is not None)
+        if not full_redraw:
+            rebuilds = self.static_layer.rebuilds
+            background = self.static_layer.get(screen.get_size())
+            full_redraw = self.static_layer.rebuilds != rebuilds
+        
+        if full_redraw:
+            # Fondo + todo lo que no cambia (línea central, marcos, etiquetas)
+            self.static_layer.draw(screen)
+        else:
+            # Borrar solo lo que se dibujó en el frame anterior
+            for rect in self._prev_rects:
+                screen.blit(background, rect, rect)
         
-        # ========== ÁREA DE JUEGO (ARRIBA) ==========
+        rects = []
         
-        # Línea central punteada
-        for y in range(0, GAME_AREA_HEIGHT, 20):
-            pygame.draw.rect(screen, DARK_GREEN, (WIDTH//2 - 2, y, 4, 10))
+        # ========== ÁREA DE JUEGO (ARRIBA) ==========
         
         # 🎮 Trail de la pelota
-        for i, (x, y) in enumerate(self.ball_trail):
-            alpha = int(255 * (i / len(self.ball_trail)))
-            size = int(BALL_SIZE * (i / len(self.ball_trail)))
-            if size > 2:
-                trail_surf = pygame.Surface((size, size), pygame.SRCALPHA)
-                pygame.draw.ellipse(trail_surf, (*YELLOW, alpha), (0, 0, size, size))
-                screen.blit(trail_surf, (x, y))
+        rects.extend(self.trail_sprites.draw(screen, self.ball_trail))
+        
+        # ✨ Partículas
+        rects.extend(self.particles.draw(screen))
+        
+        ball, player_paddle, ai_paddle = self.interpolated_rects(alpha)
         
         # Paletas con efecto glow
-        pygame.draw.rect(screen, GREEN, self.player_paddle)
-        pygame.draw.rect(screen, GREEN, self.player_paddle.inflate(4, 4), 2)
+        pygame.draw.rect(screen, GREEN, player_paddle)
+        rects.append(pygame.draw.rect(screen, GREEN, player_paddle.inflate(4, 4), 2))
         
-        pygame.draw.rect(screen, CYAN, self.ai_paddle)
-        pygame.draw.rect(screen, CYAN, self.ai_paddle.inflate(4, 4), 2)
+        pygame.draw.rect(screen, CYAN, ai_paddle)
+        rects.append(pygame.draw.rect(screen, CYAN, ai_paddle.inflate(4, 4), 2))
         
         # Pelota
-        pygame.draw.ellipse(screen, YELLOW, self.ball)
-        pygame.draw.ellipse(screen, WHITE, self.ball.inflate(4, 4), 1)
+        pygame.draw.ellipse(screen, YELLOW, ball)
+        rects.append(pygame.draw.ellipse(screen, WHITE, ball.inflate(4, 4), 1))
         
-        # Marcador con sombra
-        score_text = self.font_score.render(
-            f"{self.score_player}  :  {self.score_ai}", 
-            True, WHITE
-        )
-        shadow = self.font_score.render(
-            f"{self.score_player}  :  {self.score_ai}", 
-            True, GRAY
-        )
-        screen.blit(shadow, (WIDTH//2 - score_text.get_width()//2 + 2, 22))
-        screen.blit(score_text, (WIDTH//2 - score_text.get_width()//2, 20))
+        # Marcador con sombra (por glifos: cada punto nuevo no rasteriza texto)
+        score = f"{self.score_player}  :  {self.score_ai}"
+        score_x = WIDTH//2 - text_width(self.font_score, score, WHITE)//2
+        rects.append(blit_glyphs(screen, self.font_score, score, GRAY, (score_x + 2, 22)))
+        rects.append(blit_glyphs(screen, self.font_score, score, WHITE, (score_x, 20)))
         
         # Barras de HP
-        self.draw_hp_bars(screen)
+        rects.extend(self.draw_hp_bars(screen))
+        
+        # ========== CAJA DE DIÁLOGO (ABAJO) - SIEMPRE VISIBLE ==========
+        rects.extend(self.draw_undertale_dialogue_box(screen))
+        
+        if full_redraw or not self.dirty_rects:
+            changed = [screen.get_rect()]
+        else:
+            changed = self._prev_rects + rects
+        self._prev_rects = rects
+        return changed
+    
+    def draw_static(self, surface):
+        """
+        Dibuja las partes fijas de la pantalla (se cachean en static_layer).
+        Mismo orden que antes: lo que se dibujaba después tapa lo anterior.
+        """
+        surface.fill(BLACK)
+        
+        # Línea central punteada
+        for y in range(0, GAME_AREA_HEIGHT, 20):
+            pygame.draw.rect(surface, DARK_GREEN, (WIDTH//2 - 2, y, 4, 10))
+        
+        # Marcos de las barras de HP
+        self.draw_hp_frames(surface)
         
         # Línea divisoria entre juego y caja de diálogo
-        pygame.draw.line(screen, WHITE, (0, GAME_AREA_HEIGHT), (WIDTH, GAME_AREA_HEIGHT), 3)
+        pygame.draw.line(surface, WHITE, (0, GAME_AREA_HEIGHT), (WIDTH, GAME_AREA_HEIGHT), 3)
         
-        # ========== CAJA DE DIÁLOGO (ABAJO) - SIEMPRE VISIBLE ==========
-        self.draw_undertale_dialogue_box(screen)
+        # Marco de la caja de diálogo, retrato y barra de confianza
+        self.draw_dialogue_frame(surface)
         
         # Controles (arriba a la derecha)
-        controls = self.font_tiny.render("[W/S] Mover  [ESC] Menú", True, GRAY)
-        screen.blit(controls, (WIDTH - controls.get_width() - 10, 10))
+        controls = render_text(self.font_tiny, "[W/S] Mover  [ESC] Menú", GRAY)
+        surface.blit(controls, (WIDTH - controls.get_width() - 10, 10))
+    
+    def draw_hp_frames(self, surface):
+        """Bordes, fondo negro y etiquetas de las barras de HP (parte fija)"""
+        hp_width = HP_BAR_WIDTH
+        hp_height = HP_BAR_HEIGHT
+        
+        # HP Jugador (izquierda)
+        pygame.draw.rect(surface, WHITE, (30, 70, hp_width + 4, hp_height + 4))
+        pygame.draw.rect(surface, BLACK, (32, 72, hp_width, hp_height))
+        player_text = render_text(self.font_small, "TÚ", WHITE)
+        surface.blit(player_text, (32, 52))
+        
+        # HP IA (derecha)
+        pygame.draw.rect(surface, WHITE, (WIDTH - 30 - hp_width - 4, 70, hp_width + 4, hp_height + 4))
+        pygame.draw.rect(surface, BLACK, (WIDTH - 30 - hp_width - 2, 72, hp_width, hp_height))
+        ai_text = render_text(self.font_small, "ELLA", WHITE)
+        surface.blit(ai_text, (WIDTH - 30 - hp_width - 2, 52))
     
     def draw_hp_bars(self, screen):
-        """Dibuja las barras de HP en el juego"""
-        hp_width = 120
-        hp_height = 12
+        """Dibuja el relleno de las barras de HP en el juego (retorna los rects)"""
+        hp_width = HP_BAR_WIDTH
+        hp_height = HP_BAR_HEIGHT
         
         # HP Jugador (izquierda)
-        pygame.draw.rect(screen, WHITE, (30, 70, hp_width + 4, hp_height + 4))
-        pygame.draw.rect(screen, BLACK, (32, 72, hp_width, hp_height))
         hp_color = GREEN if self.player_hp > 50 else YELLOW if self.player_hp > 25 else RED
-        pygame.draw.rect(screen, hp_color, (32, 72, int(hp_width * self.player_hp / 100), hp_height))
-        
-        player_text = self.font_small.render("TÚ", True, WHITE)
-        screen.blit(player_text, (32, 52))
+        player_rect = pygame.draw.rect(screen, hp_color, (32, 72, int(hp_width * self.player_hp / 100), hp_height))
         
         # HP IA (derecha)
-        pygame.draw.rect(screen, WHITE, (WIDTH - 30 - hp_width - 4, 70, hp_width + 4, hp_height + 4))
-        pygame.draw.rect(screen, BLACK, (WIDTH - 30 - hp_width - 2, 72, hp_width, hp_height))
         hp_color = GREEN if self.ai_hp > 50 else YELLOW if self.ai_hp > 25 else RED
-        pygame.draw.rect(screen, hp_color, (WIDTH - 30 - hp_width - 2, 72, 
-                                           int(hp_width * self.ai_hp / 100), hp_height))
-        
-        ai_text = self.font_small.render("ELLA", True, WHITE)
-        screen.blit(ai_text, (WIDTH - 30 - hp_width - 2, 52))
+        ai_rect = pygame.draw.rect(screen, hp_color, (WIDTH - 30 - hp_width - 2, 72, 
+                                                     int(hp_width * self.ai_hp / 100), hp_height))
+        return [player_rect, ai_rect]
     
-    def draw_undertale_dialogue_box(self, screen):
-        """Dibuja la caja de diálogo fija abajo (estilo Undertale/Pokémon)"""
-        
-        box_y = GAME_AREA_HEIGHT
-        box_height = HEIGHT - GAME_AREA_HEIGHT
+    def draw_dialogue_frame(self, surface):
+        """Caja de diálogo, marco del retrato y marco de la barra (parte fija)"""
+        layout = DIALOGUE_LAYOUT
+        inner_box = layout["inner_box"]
         
         # Fondo de la caja
-        pygame.draw.rect(screen, BLACK, (0, box_y, WIDTH, box_height))
+        pygame.draw.rect(surface, BLACK, (0, GAME_AREA_HEIGHT, WIDTH, HEIGHT - GAME_AREA_HEIGHT))
         
         # Borde exterior blanco (estilo Pokémon GBA)
-        border_margin = 15
-        inner_box = pygame.Rect(border_margin, box_y + border_margin, 
-                                WIDTH - border_margin * 2, box_height - border_margin * 2)
-        
-        pygame.draw.rect(screen, WHITE, inner_box, 0)
-        pygame.draw.rect(screen, BLACK, (inner_box.x + 4, inner_box.y + 4, 
-                                         inner_box.width - 8, inner_box.height - 8), 0)
-        pygame.draw.rect(screen, BEIGE, (inner_box.x + 6, inner_box.y + 6, 
-                                         inner_box.width - 12, inner_box.height - 12), 0)
+        pygame.draw.rect(surface, WHITE, inner_box, 0)
+        pygame.draw.rect(surface, BLACK, (inner_box.x + 4, inner_box.y + 4, 
+                                          inner_box.width - 8, inner_box.height - 8), 0)
+        pygame.draw.rect(surface, BEIGE, (inner_box.x + 6, inner_box.y + 6, 
+                                          inner_box.width - 12, inner_box.height - 12), 0)
+        
+        # Borde y fondo del retrato
+        portrait_x, portrait_y = layout["portrait"]
+        portrait_size = PORTRAIT_SIZE
+        pygame.draw.rect(surface, BLACK, (portrait_x - 2, portrait_y - 2, 
+                                          portrait_size + 4, portrait_size + 4), 0)
+        pygame.draw.rect(surface, WHITE, (portrait_x - 2, portrait_y - 2, 
+                                          portrait_size + 4, portrait_size + 4), 2)
+        pygame.draw.rect(surface, DARK_BLUE, (portrait_x, portrait_y, portrait_size, portrait_size), 0)
+        
+        # Label y marco de la barra de confianza
+        conf_bar_x, conf_bar_y = layout["conf_bar"]
+        conf_label = render_text(self.font_tiny, "CONFIANZA", BLACK)
+        surface.blit(conf_label, (conf_bar_x, conf_bar_y - 13))
+        pygame.draw.rect(surface, BLACK, (conf_bar_x - 1, conf_bar_y - 1, 
+                                          CONF_BAR_WIDTH + 2, CONF_BAR_HEIGHT + 2), 2)
+        pygame.draw.rect(surface, WHITE, (conf_bar_x, conf_bar_y, CONF_BAR_WIDTH, CONF_BAR_HEIGHT))
+    
+    def draw_undertale_dialogue_box(self, screen):
+        """
+        Dibuja el contenido de la caja de diálogo fija abajo (estilo Undertale/Pokémon)
+        Retorna los rects dibujados
+        """
+        layout = DIALOGUE_LAYOUT
+        rects = []
         
         # === RETRATO DE LA FLACA (IZQUIERDA) ===
-        portrait_size = 100
-        portrait_x = inner_box.x + 10
-        portrait_y = inner_box.y + (inner_box.height - portrait_size) // 2
-        
-        # Borde del retrato
-        pygame.draw.rect(screen, BLACK, (portrait_x - 2, portrait_y - 2, 
-                                        portrait_size + 4, portrait_size + 4), 0)
-        pygame.draw.rect(screen, WHITE, (portrait_x - 2, portrait_y - 2, 
-                                        portrait_size + 4, portrait_size + 4), 2)
-        
-        # Fondo del retrato
-        pygame.draw.rect(screen, DARK_BLUE, (portrait_x, portrait_y, portrait_size, portrait_size), 0)
+        portrait_size = PORTRAIT_SIZE
+        portrait_x, portrait_y = layout["portrait"]
         
         # Sprite de la flaca
-        if self.current_girl_sprite:
-            scaled_sprite = pygame.transform.scale(self.current_girl_sprite, (portrait_size, portrait_size))
-            screen.blit(scaled_sprite, (portrait_x, portrait_y))
+        if self.girl_atlas:
+            sprite = self.girl_atlas.get(self.current_girl_expression, portrait_size)
+            rects.append(screen.blit(sprite, (portrait_x, portrait_y)))
         else:
             # Placeholder
-            pygame.draw.circle(screen, (255, 200, 150), 
-                             (portrait_x + portrait_size//2, portrait_y + portrait_size//2), 40)
+            rects.append(pygame.draw.circle(screen, (255, 200, 150), 
+                             (portrait_x + portrait_size//2, portrait_y + portrait_size//2), 40))
             pygame.draw.circle(screen, BLACK, 
                              (portrait_x + portrait_size//2 - 15, portrait_y + portrait_size//2 - 10), 5)
             pygame.draw.circle(screen, BLACK, 
                              (portrait_x + portrait_size//2 + 15, portrait_y + portrait_size//2 - 10), 5)
         
         # === ÁREA DE TEXTO (DERECHA) ===
-        text_x = portrait_x + portrait_size + 15
-        text_y = inner_box.y + 15
-        text_width = inner_box.width - portrait_size - 40
-        
-        # Dividir texto en líneas
-        words = self.current_girl_line.split()
-        lines = []
-        current_line = ""
-        
-        for word in words:
-            test_line = current_line + word + " "
-            if self.font_dialogue.size(test_line)[0] < text_width:
-                current_line = test_line
-            else:
-                if current_line:
-                    lines.append(current_line.strip())
-                current_line = word + " "
-        
-        if current_line:
-            lines.append(current_line.strip())
-        
-        # Dibujar texto (máximo 2 líneas)
-        for i, line in enumerate(lines[:2]):
-            # Sombra
-            shadow = self.font_dialogue.render(line, True, GRAY)
-            screen.blit(shadow, (text_x + 1, text_y + 1 + i * 22))
-            
-            # Texto principal
-            text_surf = self.font_dialogue.render(line, True, BLACK)
-            screen.blit(text_surf, (text_x, text_y + i * 22))
-        
-        # === BARRA DE CONFIANZA (DEBAJO DEL TEXTO) ===
-        conf_bar_x = text_x
-        conf_bar_y = text_y + 55
-        conf_bar_width = 150
-        conf_bar_height = 12
+        text_x, text_y = layout["text"]
+        text_width = layout["text_width"]
         
-        # Label
-        conf_label = self.font_tiny.render("CONFIANZA", True, BLACK)
-        screen.blit(conf_label, (conf_bar_x, conf_bar_y - 13))
+        # Texto con sombra (máximo 2 líneas); el wrap se calcula una vez por frase
+        layout_text = get_layout(self.font_dialogue, self.current_girl_line, text_width,
+                                 BLACK, 22, max_lines=2, shadow_color=GRAY)
+        rects.extend(layout_text.draw(screen, (text_x, text_y)))
         
-        # Borde de la barra
-        pygame.draw.rect(screen, BLACK, (conf_bar_x - 1, conf_bar_y - 1, 
-                                        conf_bar_width + 2, conf_bar_height + 2), 2)
-        pygame.draw.rect(screen, WHITE, (conf_bar_x, conf_bar_y, conf_bar_width, conf_bar_height))
+        # === BARRA DE CONFIANZA (DEBAJO DEL TEXTO) ===
+        conf_bar_x, conf_bar_y = layout["conf_bar"]
+        conf_bar_width = CONF_BAR_WIDTH
+        conf_bar_height = CONF_BAR_HEIGHT
         
         # Color según confianza
         if self.confianza >= 75:
@@ -426,22 +506,23 @@ class Game:
         
         fill_width = int(conf_bar_width * (self.confianza / 100))
         if fill_width > 0:
-            pygame.draw.rect(screen, bar_color, (conf_bar_x, conf_bar_y, fill_width, conf_bar_height))
+            rects.append(pygame.draw.rect(screen, bar_color, (conf_bar_x, conf_bar_y, fill_width, conf_bar_height)))
         
         # Porcentaje
-        percentage_text = self.font_tiny.render(f"{int(self.confianza)}%", True, BLACK)
-        screen.blit(percentage_text, (conf_bar_x + conf_bar_width + 8, conf_bar_y + 1))
+        rects.append(blit_glyphs(screen, self.font_tiny, f"{int(self.confianza)}%", BLACK,
+                                 (conf_bar_x + conf_bar_width + 8, conf_bar_y + 1)))
         
         # Emoji según estado
         emoji = self.get_confianza_emoji()
-        emoji_surf = self.font_small.render(emoji, True, BLACK)
-        screen.blit(emoji_surf, (conf_bar_x + conf_bar_width + 35, conf_bar_y - 3))
+        emoji_surf = render_text(self.font_small, emoji, BLACK)
+        rects.append(screen.blit(emoji_surf, (conf_bar_x + conf_bar_width + 35, conf_bar_y - 3)))
         
         # === INDICADOR DE ESTADO (ESQUINA INFERIOR DERECHA) ===
         state_text = self.get_state_text()
         state_color = self.get_state_color()
-        state_surf = self.font_tiny.render(state_text, True, state_color)
-        screen.blit(state_surf, (WIDTH - state_surf.get_width() - 20, HEIGHT - 20))
+        state_surf = render_text(self.font_tiny, state_text, state_color)
+        rects.append(screen.blit(state_surf, (WIDTH - state_surf.get_width() - 20, HEIGHT - 20)))
+        return rects
     
     def get_confianza_emoji(self):
         """Retorna el emoji según el nivel de confianza"""
@@ -471,14 +552,15 @@ class Game:
             return GREEN
 
 
-def run_game():
+def run_game(dirty_rects=False):
     """Función para ejecutar el juego directamente"""
     pygame.init()
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Retro Pong Championship")
     clock = pygame.time.Clock()
     
-    game = Game(1)
+    game = Game(1, dirty_rects=dirty_rects)
+    timestep = FixedTimestep(TICK_RATE)
     
     running = True
     while running:
@@ -489,21 +571,28 @@ def run_game():
                 if event.key == pygame.K_ESCAPE:
                     running = False
         
-        game_over = game.update()
+        game_over = False
+        for _ in range(timestep.advance()):
+            if game.update(timestep.dt):
+                game_over = True
+                break
         if game_over:
             screen.fill(BLACK)
             if game.score_player > game.score_ai:
-                text = pygame.font.SysFont("Courier New", 40).render("¡GANASTE!", True, GREEN)
+                text = render_text(get_font("Courier New", 40), "¡GANASTE!", GREEN)
             else:
-                text = pygame.font.SysFont("Courier New", 40).render("¡PERDISTE!", True, RED)
+                text = render_text(get_font("Courier New", 40), "¡PERDISTE!", RED)
             screen.blit(text, (WIDTH//2 - text.get_width()//2, HEIGHT//2))
             pygame.display.flip()
             pygame.time.wait(3000)
             running = False
         else:
-            game.draw(screen)
+            rects = game.draw(screen, timestep.alpha)
+            if game.dirty_rects:
+                pygame.display.update(rects)
+            else:
+                pygame.display.flip()
         
-        pygame.display.flip()
         clock.tick(60)
     
     pygame.quit()
\ No newline at end of file
@@ -0,0 +1,121 @@
+# ============================================================================
+# src/gesture_dataset.py - Datasets de Landmarks Etiquetados y Evaluación
+# ============================================================================
+"""
+Formato en disco (.npz sin comprimir, se carga en una sola lectura):
+
+- landmarks: float32 (N, 21, 3) normalizados como los entrega MediaPipe
+- labels:    int8 (N,) códigos de GESTOS (0=UP, 1=DOWN, 2=STOP)
+- sequences: int32 (N,) id de la grabación a la que pertenece cada frame
+             (los frames de una secuencia van seguidos y en orden)
+"""
+
+import time
+
+import numpy as np
+from src.gestures import GESTOS, clasificar_lote
+
+
+class GestureDataset:
+    """Landmarks + etiquetas + secuencias, todo en arrays de numpy"""
+
+    def __init__(self, landmarks, labels, sequences):
+        self.landmarks = np.asarray(landmarks, dtype=np.float32)
+        self.labels = np.asarray(labels, dtype=np.int8)
+        self.sequences = np.asarray(sequences, dtype=np.int32)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def save(self, path):
+        np.savez(path, landmarks=self.landmarks, labels=self.labels,
+                 sequences=self.sequences)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(data["landmarks"], data["labels"], data["sequences"])
+
+
+def generar_sintetico(n_samples=200_000, seq_len=300, noise=0.015, seed=0):
+    """
+    Genera manos sintéticas etiquetadas (puño, palma, 1-2 dedos) con ruido.
+
+    Sirve para medir velocidad y probar el harness; la precisión real hay
+    que medirla con grabaciones (ver tools/record_gestures.py).
+    """
+    rng = np.random.default_rng(seed)
+
+    # Etiquetas en tramos de 10-60 frames, como si la persona cambiara de gesto
+    lengths = rng.integers(10, 60, size=n_samples // 10 + 1)
+    labels = np.repeat(rng.integers(0, 3, size=len(lengths)), lengths)[:n_samples].astype(np.int8)
+    sequences = (np.arange(n_samples) // seq_len).astype(np.int32)
+
+    # Qué dedos (índice..meñique) están extendidos en cada frame
+    extended = np.zeros((n_samples, 4), dtype=bool)
+    extended[labels == 1] = True
+    stop = np.flatnonzero(labels == 2)
+    count = rng.integers(1, 3, size=len(stop))
+    extended[stop] = rng.random((len(stop), 4)).argsort(axis=1) < count[:, None]
+
+    # Pose base relativa a la muñeca: mcp, pip, dip, tip de cada dedo
+    landmarks = np.zeros((n_samples, 21, 3), dtype=np.float32)
+    landmarks[:, 1:5, 0] = [-0.08, -0.12, -0.15, -0.17]   # Pulgar
+    landmarks[:, 1:5, 1] = [-0.05, -0.10, -0.14, -0.17]
+    for finger in range(4):
+        mcp = 5 + finger * 4
+        landmarks[:, mcp:mcp + 4, 0] = -0.06 + finger * 0.04
+        landmarks[:, mcp, 1] = -0.18
+        landmarks[:, mcp + 1, 1] = -0.28
+        up = extended[:, finger]
+        landmarks[:, mcp + 2, 1] = np.where(up, -0.34, -0.24)  # dip
+        landmarks[:, mcp + 3, 1] = np.where(up, -0.40, -0.18)  # tip
+
+    # Cada secuencia: posición y tamaño de mano propios
+    n_sequences = sequences[-1] + 1
+    scale = rng.uniform(0.7, 1.3, size=n_sequences).astype(np.float32)[sequences]
+    origin = rng.uniform((0.3, 0.6), (0.7, 0.9), size=(n_sequences, 2)).astype(np.float32)[sequences]
+    landmarks[..., :2] *= scale[:, None, None]
+    landmarks[..., :2] += origin[:, None, :]
+    landmarks += rng.normal(0, noise, size=landmarks.shape).astype(np.float32)
+
+    return GestureDataset(landmarks, labels, sequences)
+
+
+def evaluar(dataset, clasificador=clasificar_lote, repeticiones=3, **kwargs):
+    """
+    Evalúa un clasificador vectorizado sobre todo el dataset
+
+    Args:
+        dataset: GestureDataset
+        clasificador: Función (N, 21, 3) → códigos (N,); por defecto clasificar_lote
+        repeticiones: Corridas para medir el tiempo (se toma la mejor)
+        **kwargs: Parámetros extra para el clasificador (ej. joint_offset)
+
+    Returns:
+        Dict con accuracy, matriz de confusión, flicker y µs por clasificación
+    """
+    n = len(dataset)
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        pred = clasificador(dataset.landmarks, **kwargs)
+        mejor = min(mejor, time.perf_counter() - inicio)
+
+    labels = dataset.labels.astype(np.int64)
+    k = len(GESTOS)
+    confusion = np.bincount(labels * k + pred, minlength=k * k).reshape(k, k)
+
+    # Flicker: el gesto predicho cambia entre frames seguidos de la misma
+    # secuencia aunque la etiqueta no haya cambiado
+    mismo_gesto = ((dataset.sequences[1:] == dataset.sequences[:-1])
+                   & (dataset.labels[1:] == dataset.labels[:-1]))
+    cambios = (pred[1:] != pred[:-1]) & mismo_gesto
+
+    return {
+        "muestras": n,
+        "accuracy": float((pred == dataset.labels).mean()) if n else 0.0,
+        "confusion": confusion,
+        "flicker": float(cambios.sum() / max(mismo_gesto.sum(), 1)),
+        "us_por_muestra": mejor * 1e6 / max(n, 1),
+    }
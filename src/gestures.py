@@ -0,0 +1,83 @@
+# ============================================================================
+# src/gestures.py - Detección de Gestos de la Mano
+# ============================================================================
+
+import numpy as np
+
+# Gestos en el orden de los códigos que retorna clasificar_lote
+GESTOS = ("UP", "DOWN", "STOP")
+
+# Puntas de índice, medio, anular y meñique (el pulgar se ignora)
+FINGER_TIPS = np.array([8, 12, 16, 20])
+
+# Movimiento de la paleta según el gesto detectado
+MOVIMIENTO_POR_GESTO = {
+    "UP": -7,    # SUBE
+    "DOWN": 7,   # BAJA
+    "STOP": 0,   # QUIETO
+}
+
+
+def detectar_gesto(hand):
+    """
+    Detecta:
+    - Puño ✊ (todos los dedos cerrados) → UP
+    - Palma abierta 🖐️ (todos extendidos) → DOWN
+    """
+    # Lista de puntas de dedos
+    tips = [4, 8, 12, 16, 20]
+
+    dedos_arriba = 0
+    for tip in tips[1:]:  # Ignorar el pulgar para evitar errores
+        # Si la punta está más arriba que la articulación base -> dedo extendido
+        if hand.landmark[tip].y < hand.landmark[tip - 2].y:
+            dedos_arriba += 1
+
+    # Si todos los dedos están cerrados → Puño
+    if dedos_arriba == 0:
+        return "UP"
+    # Si 3+ dedos arriba → Palma abierta
+    elif dedos_arriba >= 3:
+        return "DOWN"
+    else:
+        return "STOP"  # quieto
+
+
+def landmarks_a_array(hand):
+    """Convierte los 21 landmarks de MediaPipe a un array (21, 3) de float32"""
+    return np.array([(lm.x, lm.y, lm.z) for lm in hand.landmark], dtype=np.float32)
+
+
+def manos_a_array(hands):
+    """
+    Convierte todas las manos detectadas (results.multi_hand_landmarks) de
+    una sola vez a un array (n_manos, 21, 3) de float32
+    """
+    return np.array([[(lm.x, lm.y, lm.z) for lm in hand.landmark] for hand in hands],
+                    dtype=np.float32).reshape(-1, 21, 3)
+
+
+def clasificar_lote(landmarks, joint_offset=2):
+    """
+    Versión vectorizada de detectar_gesto para muchas manos a la vez
+
+    Args:
+        landmarks: Array (..., 21, 3) de landmarks normalizados
+        joint_offset: Articulación contra la que se compara cada punta
+                      (2 = tip - 2, la regla de detectar_gesto)
+
+    Returns:
+        Array (...) de códigos int8: índices de GESTOS (0=UP, 1=DOWN, 2=STOP)
+    """
+    y = landmarks[..., 1]
+    # Índice, medio, anular y meñique: punta vs. articulación
+    dedos_arriba = (y[..., FINGER_TIPS] < y[..., FINGER_TIPS - joint_offset]).sum(axis=-1)
+    return np.where(dedos_arriba == 0, 0, np.where(dedos_arriba >= 3, 1, 2)).astype(np.int8)
+
+
+def detectar_gesto_array(landmarks):
+    """
+    Misma regla que detectar_gesto pero sobre un array (21, 3) de landmarks
+    (ej. los que retorna landmarks_a_array o el tracker por ROI)
+    """
+    return GESTOS[int(clasificar_lote(landmarks))]
@@ -0,0 +1,382 @@
+# ============================================================================
+# src/inference.py - Estrategias de Inferencia de la Mano
+# ============================================================================
+
+import cv2
+import numpy as np
+from src.gestures import landmarks_a_array, manos_a_array
+
+
+def _primera_mano(results):
+    """Retorna los landmarks (21, 3) de la primera mano detectada o None"""
+    if results.multi_hand_landmarks:
+        return landmarks_a_array(results.multi_hand_landmarks[0])
+    return None
+
+
+class FullFrameInference:
+    """Corre MediaPipe sobre el frame completo en cada llamada (modo original)"""
+
+    def __init__(self, hands):
+        self.hands = hands
+        self.stats = {"frames": 0, "inferencias": 0}
+
+    def process(self, rgb, force=False, hint=None):
+        """
+        Retorna (landmarks, inferido): landmarks (21, 3) normalizados al
+        frame completo o None, y si se corrió el modelo en este frame
+        force: correr el modelo sí o sí (las estrategias que saltan frames
+               no reusan el resultado anterior)
+        hint: posición más nueva de la mano para las estrategias que
+              recortan (aquí no se usa)
+        """
+        self.stats["frames"] += 1
+        self.stats["inferencias"] += 1
+        return _primera_mano(self.hands.process(rgb)), True
+
+
+class RoiInference:
+    """
+    Inferencia recortada alrededor de la última mano detectada.
+
+    - Con mano: recorta una ventana cuadrada alrededor de la mano (con
+      margen) y la escala a inference_size x inference_size. La ventana
+      queda quieta mientras la mano siga lejos de sus bordes; solo se
+      re-centra cuando la mano se acerca a un borde o ya no entra
+    - Sin mano: busca en el frame completo escalado a inference_size de ancho
+    - Si los landmarks casi no se mueven, se salta frames (hasta max_skip)
+      reusando el último resultado
+
+    Los recortes van a un Hands aparte (roi_hands) en modo video: como la
+    ventana casi nunca se mueve, el seguimiento entre frames de MediaPipe
+    sigue valiendo y se salta la detección de palma, que es la parte cara.
+    Los frames completos van a `hands` para no mezclar las dos imágenes en
+    el mismo seguimiento.
+
+    La regla de detectar_gesto compara alturas de la misma mano, así que el
+    recorte (una transformación monótona en y) no cambia el gesto.
+    """
+
+    def __init__(self, hands, roi_hands, inference_size=256, margin=0.75,
+                 edge=0.1, stable_threshold=0.01, max_skip=3):
+        self.hands = hands
+        self.roi_hands = roi_hands
+        self.inference_size = inference_size
+        self.margin = margin
+        self.edge = edge         # Fracción de la ventana que cuenta como borde
+        self.stable_threshold = stable_threshold
+        self.max_skip = max_skip
+
+        self._last = None        # Últimos landmarks (frame completo)
+        self._window = None      # Ventana actual (x0, y0, lado) en píxeles
+        self._frame_size = None
+        self._skip_budget = 0    # Frames a saltar según estabilidad
+        self._skipped = 0
+
+        size = inference_size
+        self._roi_buffer = np.empty((size, size, 3), dtype=np.uint8)
+        self._full_buffer = None
+
+        self.stats = {"frames": 0, "inferencias": 0, "roi": 0,
+                      "completo": 0, "saltados": 0, "recentrados": 0}
+
+    def process(self, rgb, force=False, hint=None):
+        """
+        Igual que FullFrameInference.process
+        hint: landmarks más nuevos que el último resultado (p. ej. los que
+              predijo el flujo óptico) para ubicar la ventana del recorte
+        """
+        self.stats["frames"] += 1
+
+        # Mano estable: reusar el último resultado
+        if not force and self._last is not None and self._skipped < self._skip_budget:
+            self._skipped += 1
+            self.stats["saltados"] += 1
+            return self._last, False
+        self._skipped = 0
+
+        previous = hint if hint is not None else self._last
+        landmarks = None
+        if previous is not None:
+            landmarks = self._infer_roi(rgb, previous)
+        if landmarks is None:
+            # Mano perdida (o primera vez): búsqueda en el frame completo
+            self._window = None
+            landmarks = self._infer_full(rgb)
+
+        self._update_skip_budget(landmarks)
+        self._last = landmarks
+        return landmarks, True
+
+    def _infer_roi(self, rgb, previous):
+        """Corre el modelo sobre la ventana que contiene a la mano anterior"""
+        height, width = rgb.shape[:2]
+        x0, y0, side = self._ventana(previous, width, height)
+
+        crop = rgb[y0:y0 + side, x0:x0 + side]
+        cv2.resize(crop, (self.inference_size, self.inference_size),
+                   dst=self._roi_buffer, interpolation=cv2.INTER_AREA)
+        self.stats["inferencias"] += 1
+        self.stats["roi"] += 1
+
+        landmarks = _primera_mano(self.roi_hands.process(self._roi_buffer))
+        if landmarks is None:
+            return None
+
+        # Coordenadas del recorte → frame completo
+        landmarks[:, 0] = (x0 + landmarks[:, 0] * side) / width
+        landmarks[:, 1] = (y0 + landmarks[:, 1] * side) / height
+        landmarks[:, 2] *= side / width
+        return landmarks
+
+    def _infer_full(self, rgb):
+        """Corre el modelo sobre el frame completo reducido"""
+        height, width = rgb.shape[:2]
+        scaled_height = max(1, round(height * self.inference_size / width))
+        shape = (scaled_height, self.inference_size, 3)
+        if self._full_buffer is None or self._full_buffer.shape != shape:
+            self._full_buffer = np.empty(shape, dtype=np.uint8)
+
+        cv2.resize(rgb, (self.inference_size, scaled_height),
+                   dst=self._full_buffer, interpolation=cv2.INTER_AREA)
+        self.stats["inferencias"] += 1
+        self.stats["completo"] += 1
+
+        # Coordenadas normalizadas: iguales en el frame reducido y el original
+        return _primera_mano(self.hands.process(self._full_buffer))
+
+    def _ventana(self, landmarks, width, height):
+        """
+        La ventana actual si la mano sigue cómoda adentro; si no, una nueva
+        centrada en la mano (el modo video de roi_hands vuelve a buscar la
+        palma solo en ese caso)
+        """
+        window = self._window
+        if window is not None and self._frame_size == (width, height):
+            x0, y0, side = window
+            borde = side * self.edge
+            xs = landmarks[:, 0] * width
+            ys = landmarks[:, 1] * height
+            if (xs.min() >= x0 + borde and xs.max() <= x0 + side - borde and
+                    ys.min() >= y0 + borde and ys.max() <= y0 + side - borde):
+                return window
+
+        self._window = self._roi_box(landmarks, width, height)
+        self._frame_size = (width, height)
+        self.stats["recentrados"] += 1
+        return self._window
+
+    def _roi_box(self, landmarks, width, height):
+        """Cuadrado (x0, y0, lado) en píxeles alrededor de los landmarks"""
+        xs = landmarks[:, 0] * width
+        ys = landmarks[:, 1] * height
+        box = max(xs.max() - xs.min(), ys.max() - ys.min())
+
+        side = int(box * (1 + 2 * self.margin))
+        side = max(side, self.inference_size // 2, 1)
+        side = min(side, width, height)
+
+        cx = (xs.max() + xs.min()) / 2
+        cy = (ys.max() + ys.min()) / 2
+        # Mover el cuadrado para que quede dentro del frame (sin achicarlo)
+        x0 = int(min(max(cx - side / 2, 0), width - side))
+        y0 = int(min(max(cy - side / 2, 0), height - side))
+        return x0, y0, side
+
+    def _update_skip_budget(self, landmarks):
+        """Más frames saltados mientras la mano siga quieta"""
+        if landmarks is None or self._last is None:
+            self._skip_budget = 0
+            return
+
+        movement = float(np.abs(landmarks[:, :2] - self._last[:, :2]).mean())
+        if movement < self.stable_threshold:
+            self._skip_budget = min(self._skip_budget + 1, self.max_skip)
+        else:
+            self._skip_budget = 0
+
+
+class KeyframeFlowInference:
+    """
+    Corre el modelo completo solo en keyframes y, entre ellos, mueve los
+    landmarks con flujo óptico Lucas-Kanade piramidal (cv2.calcOpticalFlowPyrLK).
+
+    - Keyframe cada keyframe_interval frames, o antes si el flujo pierde
+      puntos (menos de min_tracked) o su error medio supera max_error
+    - En cada keyframe se compara la predicción del flujo con el modelo:
+      esa distancia (en píxeles) es el drift que se reporta en stats
+    - La base recibe la última posición del flujo como hint, así un
+      RoiInference recorta alrededor de la mano actual
+    """
+
+    def __init__(self, base, keyframe_interval=5, min_tracked=0.8, max_error=20.0,
+                 win_size=(21, 21), max_level=3):
+        self.base = base
+        self.keyframe_interval = keyframe_interval
+        self.min_tracked = min_tracked
+        self.max_error = max_error
+        self.win_size = win_size
+        self.max_level = max_level
+
+        self._last = None
+        self._since_keyframe = 0
+        self._gray = [None, None]  # Frame anterior y actual en grises
+        self._current = 0
+
+        self._drift_total = 0.0
+        self._drift_count = 0
+        self.stats = {"frames": 0, "keyframes": 0, "flujo": 0,
+                      "drift_px": 0.0, "drift_px_medio": 0.0, "base": base.stats}
+
+    def process(self, rgb, force=False):
+        """Igual que FullFrameInference.process"""
+        self.stats["frames"] += 1
+        previous, gray = self._to_gray(rgb)
+
+        predicted = None
+        if self._last is not None and previous is not None:
+            predicted = self._propagate(previous, gray)
+
+        if (not force and predicted is not None
+                and self._since_keyframe + 1 < self.keyframe_interval):
+            self._since_keyframe += 1
+            self._last = predicted
+            self.stats["flujo"] += 1
+            return predicted, False
+
+        # Keyframe: modelo completo (sin dejar que la base reuse un resultado
+        # viejo), con el recorte ubicado donde el flujo dice que está la mano
+        # y no donde estaba en el keyframe anterior
+        hint = predicted if predicted is not None else self._last
+        landmarks, inferred = self.base.process(rgb, force=True, hint=hint)
+        self.stats["keyframes"] += 1
+        if inferred and predicted is not None and landmarks is not None:
+            self._record_drift(predicted, landmarks, gray.shape)
+
+        self._since_keyframe = 0
+        self._last = landmarks
+        return landmarks, inferred
+
+    def _to_gray(self, rgb):
+        """Convierte a grises alternando entre dos buffers fijos"""
+        previous = self._gray[self._current]
+        self._current = 1 - self._current
+
+        buffer = self._gray[self._current]
+        if buffer is None or buffer.shape != rgb.shape[:2]:
+            buffer = np.empty(rgb.shape[:2], dtype=np.uint8)
+            self._gray[self._current] = buffer
+            previous = None  # Cambió la resolución: no hay frame comparable
+        cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY, dst=buffer)
+        return previous, buffer
+
+    def _propagate(self, previous, gray):
+        """Mueve los últimos landmarks con LK; None si el flujo no es confiable"""
+        height, width = gray.shape
+        points = (self._last[:, :2] * (width, height)).astype(np.float32).reshape(-1, 1, 2)
+
+        moved, status, error = cv2.calcOpticalFlowPyrLK(
+            previous, gray, points, None,
+            winSize=self.win_size, maxLevel=self.max_level,
+        )
+        tracked = status.ravel() == 1
+        if tracked.mean() < self.min_tracked:
+            return None
+        if float(error.ravel()[tracked].mean()) > self.max_error:
+            return None
+
+        # Los puntos perdidos siguen el desplazamiento mediano de la mano
+        shift = (moved - points).reshape(-1, 2)
+        shift[~tracked] = np.median(shift[tracked], axis=0)
+
+        landmarks = self._last.copy()
+        landmarks[:, 0] += shift[:, 0] / width
+        landmarks[:, 1] += shift[:, 1] / height
+        return landmarks
+
+    def _record_drift(self, predicted, landmarks, shape):
+        """Distancia media (px) entre la predicción del flujo y el modelo"""
+        height, width = shape
+        delta = (predicted[:, :2] - landmarks[:, :2]) * (width, height)
+        drift = float(np.hypot(delta[:, 0], delta[:, 1]).mean())
+
+        self._drift_total += drift
+        self._drift_count += 1
+        self.stats["drift_px"] = drift
+        self.stats["drift_px_medio"] = self._drift_total / self._drift_count
+
+
+class TwoHandInference:
+    """
+    Dos jugadores con una sola inferencia (Hands con max_num_hands=2).
+
+    Retorna landmarks (2, 21, 3): fila 0 = jugador izquierdo, fila 1 =
+    jugador derecho; la fila de un jugador sin mano queda en NaN.
+
+    asignacion:
+        "lado": por la posición de la mano en la pantalla (izquierda/derecha)
+        "mano": por la lateralidad que reporta MediaPipe (Left → izquierdo)
+    """
+
+    def __init__(self, hands, asignacion="lado"):
+        self.hands = hands
+        self.asignacion = asignacion
+        self._output = np.full((2, 21, 3), np.nan, dtype=np.float32)
+        self.stats = {"frames": 0, "inferencias": 0, "dos_manos": 0}
+
+    def process(self, rgb, force=False, hint=None):
+        """Igual que FullFrameInference.process, pero para ambos jugadores"""
+        self.stats["frames"] += 1
+        self.stats["inferencias"] += 1
+        results = self.hands.process(rgb)
+
+        output = self._output.copy()
+        if not results.multi_hand_landmarks:
+            return output, True
+
+        manos = manos_a_array(results.multi_hand_landmarks)
+        if len(manos) == 2:
+            self.stats["dos_manos"] += 1
+
+        slots = None
+        if self.asignacion == "mano" and results.multi_handedness:
+            slots = [0 if h.classification[0].label == "Left" else 1
+                     for h in results.multi_handedness]
+            if len(set(slots)) < len(slots):
+                slots = None  # Dos manos iguales: decidir por el lado
+
+        if slots is None:
+            centers = manos[:, :, 0].mean(axis=1)
+            if len(manos) == 2:
+                slots = [0, 1] if centers[0] <= centers[1] else [1, 0]
+            else:
+                slots = [0 if centers[0] < 0.5 else 1]
+
+        for mano, slot in zip(manos, slots):
+            output[slot] = mano
+        return output, True
+
+
+def crear_inferencia(hands, roi_size=None, flow_interval=0, players=1, roi_hands=None,
+                     asignacion="lado"):
+    """
+    Frame completo por defecto; recorte por ROI si se pasa roi_size (los
+    recortes van a roi_hands, un Hands aparte; ver RoiInference).
+    Con flow_interval > 0 el modelo corre solo cada flow_interval frames
+    y el flujo óptico cubre los frames intermedios.
+    Con players=2 se usa TwoHandInference (ROI y flujo son de una mano),
+    que reparte las manos según `asignacion` ("lado" o "mano").
+    """
+    if players == 2:
+        return TwoHandInference(hands, asignacion)
+
+    if roi_size:
+        if roi_hands is None:
+            raise ValueError("El modo ROI necesita un Hands aparte para los recortes (roi_hands)")
+        inferencia = RoiInference(hands, roi_hands, inference_size=roi_size)
+    else:
+        inferencia = FullFrameInference(hands)
+
+    if flow_interval > 0:
+        inferencia = KeyframeFlowInference(inferencia, keyframe_interval=flow_interval)
+    return inferencia
@@ -0,0 +1,181 @@
+# ============================================================================
+# src/model.py - Estado del Partido sin Render (no importa pygame)
+# ============================================================================
+
+import random
+
+from src.ai import ai_step, perceive
+from src.physics import Ball, advance_ball
+
+# Configuración de la simulación (src.game las re-exporta)
+WIDTH = 800
+GAME_AREA_HEIGHT = 450
+PADDLE_WIDTH, PADDLE_HEIGHT = 10, 80
+BALL_SIZE = 12
+PLAYER_X = 30
+AI_X = WIDTH - 40
+MAX_BALL_SPEED = 25
+WIN_SCORE = 12
+
+# Las velocidades están en px por frame de 60 Hz; step(steps) las escala
+FRAME_DT = 1 / 60
+
+# Ajustadas con tools/tournament.py (1000 partidos por combinación contra el
+# jugador de referencia; resultados en tools/tournament_results.csv):
+# la IA gana 29% / 50% / 71% / 86% de los partidos
+DIFFICULTY_SETTINGS = {
+    0: {"ball_speed": 5, "ai_speed": 3, "ai_reaction": 0.9},
+    1: {"ball_speed": 6, "ai_speed": 4, "ai_reaction": 0.9},
+    2: {"ball_speed": 7, "ai_speed": 6, "ai_reaction": 1.0},
+    3: {"ball_speed": 8, "ai_speed": 8, "ai_reaction": 0.9}
+}
+
+
+def clamp_paddle(y):
+    """Limita el borde superior de una paleta al área de juego"""
+    return min(max(y, 0), GAME_AREA_HEIGHT - PADDLE_HEIGHT)
+
+
+class MatchModel:
+    """
+    Todo el estado de un partido (pelota, paletas, puntajes, HP, confianza y
+    RNG) sin nada de pygame: corre sin ventana, y Game es solo una vista que
+    lo dibuja.
+
+    step() retorna los eventos del paso como tuplas:
+        ("bounce", x, y)        rebote en una pared
+        ("hit", paleta, x, y)   golpe (0 = jugador, 1 = IA); x, y = punto de contacto
+        ("score", quien, x, y)  punto (0 = jugador, 1 = IA); x, y = donde salió
+    """
+
+    __slots__ = ("difficulty", "ball_speed", "ai_speed", "ai_reaction", "ai_right",
+                 "ai_seen", "ball", "player_y", "ai_y", "score_player", "score_ai",
+                 "player_hp", "ai_hp", "confianza", "rally", "rng", "_events")
+
+    def __init__(self, difficulty=1, ai_right=True, seed=None):
+        """
+        Args:
+            difficulty: 0=Fácil, 1=Normal, 2=Difícil, 3=Dios
+            ai_right: si es False la paleta derecha solo se mueve con step(rival_dy=...)
+            seed: Semilla del RNG (saques) para partidos reproducibles
+        """
+        settings = DIFFICULTY_SETTINGS[difficulty]
+        self.difficulty = difficulty
+        self.ball_speed = settings["ball_speed"]
+        self.ai_speed = settings["ai_speed"]
+        self.ai_reaction = settings["ai_reaction"]
+        self.ai_right = ai_right
+        self.rng = random.Random(seed)
+
+        self.player_y = float(GAME_AREA_HEIGHT // 2 - PADDLE_HEIGHT // 2)
+        self.ai_y = self.player_y
+        self.ball = Ball(0.0, 0.0, 0.0, 0.0, BALL_SIZE)
+
+        self.score_player = 0
+        self.score_ai = 0
+        self.player_hp = 100
+        self.ai_hp = 100
+        self.confianza = 50  # 0-100, empieza neutral
+        self.rally = 0       # Golpes desde el último saque
+        self._events = None
+        self.serve()
+
+    def serve(self):
+        """Pelota al centro con dirección al azar"""
+        ball = self.ball
+        ball.x = float(WIDTH // 2 - BALL_SIZE // 2)
+        ball.y = float(GAME_AREA_HEIGHT // 2 - BALL_SIZE // 2)
+        ball.vx = self.ball_speed * self.rng.choice([-1, 1])
+        ball.vy = self.ball_speed * self.rng.choice([-1, 1])
+        self.ai_seen = ball.y + BALL_SIZE / 2  # Altura de la pelota que ve la IA
+        self.rally = 0
+
+    @property
+    def finished(self):
+        return (self.player_hp <= 0 or self.ai_hp <= 0 or
+                self.score_player >= WIN_SCORE or self.score_ai >= WIN_SCORE)
+
+    def add_confianza(self, change):
+        self.confianza = max(0, min(100, self.confianza + change))
+
+    def step(self, steps=1.0, player_dy=0.0, rival_dy=0.0):
+        """
+        Avanza el partido `steps` frames de 60 Hz (fraccionario en ticks más cortos)
+
+        Args:
+            player_dy, rival_dy: Desplazamiento de cada paleta en este paso
+                                 (rival_dy se ignora si la derecha es IA)
+
+        Returns:
+            Lista de eventos (ver la docstring de la clase)
+        """
+        self._events = events = []
+        ball = self.ball
+
+        # Paletas: jugador por input, derecha por input o IA
+        self.player_y = clamp_paddle(self.player_y + player_dy)
+        if self.ai_right:
+            self.ai_seen = perceive(self.ai_seen, ball.y + BALL_SIZE / 2,
+                                    self.ai_reaction, steps)
+            rival_dy = ai_step(self.ai_y + PADDLE_HEIGHT / 2, self.ai_seen,
+                               self.ai_speed * steps)
+        self.ai_y = clamp_paddle(self.ai_y + rival_dy)
+
+        # Pelota: rebotes y golpes por tiempo de impacto
+        paddles = (
+            (PLAYER_X, self.player_y, PADDLE_WIDTH, PADDLE_HEIGHT, 1),
+            (AI_X, self.ai_y, PADDLE_WIDTH, PADDLE_HEIGHT, -1),
+        )
+        advance_ball(ball, steps, paddles, 0, GAME_AREA_HEIGHT,
+                     on_wall=self._on_wall, on_paddle=self._on_paddle)
+
+        # Puntos
+        if ball.x <= 0:
+            # IA anota: +25 confianza
+            self.score_ai += 1
+            self.ai_hp = max(0, self.ai_hp - 10)
+            self.player_hp = max(0, self.player_hp - 15)
+            self.add_confianza(+25)
+            events.append(("score", 1, ball.x + BALL_SIZE / 2, ball.y + BALL_SIZE / 2))
+            self.serve()
+        elif ball.x + BALL_SIZE >= WIDTH:
+            # Jugador anota: -25 confianza
+            self.score_player += 1
+            self.ai_hp = max(0, self.ai_hp - 15)
+            self.add_confianza(-25)
+            events.append(("score", 0, ball.x + BALL_SIZE / 2, ball.y + BALL_SIZE / 2))
+            self.serve()
+
+        self._events = None
+        return events
+
+    def _on_wall(self):
+        self._events.append(("bounce", self.ball.x, self.ball.y))
+
+    def _on_paddle(self, index):
+        """Golpe con una paleta (0 = jugador, 1 = IA) en el instante del contacto"""
+        ball = self.ball
+        if index == 0:
+            ball.vx = abs(ball.vx)
+            # Jugador golpea: -5 confianza
+            self.add_confianza(-5)
+            paddle_y = self.player_y
+            contact_x = ball.x
+        else:
+            ball.vx = -abs(ball.vx)
+            # IA golpea: +5 confianza
+            self.add_confianza(+5)
+            paddle_y = self.ai_y
+            contact_x = ball.x + BALL_SIZE
+        # Aumentar ligeramente la velocidad
+        ball.vx *= 1.05
+        ball.vy *= 1.05
+        # Efecto de rebote variado según dónde golpea
+        center_y = ball.y + BALL_SIZE / 2
+        hit_pos = (center_y - (paddle_y + PADDLE_HEIGHT / 2)) / (PADDLE_HEIGHT / 2)
+        ball.vy += hit_pos * 2
+        # Limitar velocidad máxima
+        ball.vx = max(-MAX_BALL_SPEED, min(MAX_BALL_SPEED, ball.vx))
+        ball.vy = max(-MAX_BALL_SPEED, min(MAX_BALL_SPEED, ball.vy))
+        self.rally += 1
+        self._events.append(("hit", index, contact_x, center_y))
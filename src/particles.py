@@ -0,0 +1,171 @@
+# ============================================================================
+# src/particles.py - Sistema de Partículas Vectorizado (NumPy)
+# ============================================================================
+
+import math
+
+import numpy as np
+import pygame
+
+
+class ParticleSystem:
+    """
+    Partículas guardadas como struct-of-arrays (posición, velocidad, vida,
+    color) en un pool de tamaño fijo: no hay un objeto Python por partícula y
+    cada frame se actualiza con unas pocas operaciones de NumPy.
+
+    Si el pool se llena, las partículas nuevas reciclan las que menos vida
+    tienen.
+
+    Modos de dibujo:
+        "sprites": blits en lote de sprites pre-rasterizados (color × desvanecido)
+        "pixels":  mezcla directa en el array de píxeles de la pantalla
+    """
+
+    def __init__(self, capacity=2048, palette=((255, 255, 0),), size=3,
+                 gravity=0.15, drag=0.96, fade_steps=8, bounds=None, seed=None):
+        """
+        Args:
+            capacity: Máximo de partículas vivas a la vez
+            palette: Colores RGB; cada partícula guarda un índice a esta lista
+            size: Lado del cuadrado de cada partícula (px)
+            gravity: Aceleración vertical (px/frame²)
+            drag: Factor de velocidad que se conserva en cada frame
+            fade_steps: Niveles de transparencia del modo "sprites"
+            bounds: Rect opcional; la partícula que sale muere
+        """
+        self.capacity = capacity
+        self.size = size
+        self.gravity = gravity
+        self.drag = drag
+        self.fade_steps = fade_steps
+        self.bounds = pygame.Rect(bounds) if bounds is not None else None
+        self.mode = "sprites"
+        self.recycled = 0
+
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)      # Frames restantes (≤ 0 = libre)
+        self.max_life = np.ones(capacity, dtype=np.float32)
+        self.color = np.zeros(capacity, dtype=np.uint8)       # Índice en palette
+
+        self.palette = np.array(palette, dtype=np.uint8)
+        self._rng = np.random.default_rng(seed)
+        self._sprites = self._build_sprites()
+
+    def _build_sprites(self):
+        """Tabla [color, nivel de vida] → Surface con alpha"""
+        convert = pygame.display.get_surface() is not None
+        table = np.empty((len(self.palette), self.fade_steps), dtype=object)
+        for c, rgb in enumerate(self.palette.tolist()):
+            for f in range(self.fade_steps):
+                sprite = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
+                sprite.fill((*rgb, int(255 * (f + 1) / self.fade_steps)))
+                table[c, f] = sprite.convert_alpha() if convert else sprite
+        return table
+
+    @property
+    def count(self):
+        """Partículas vivas"""
+        return int(np.count_nonzero(self.life > 0))
+
+    def emit(self, x, y, count, color=None, speed=(1.0, 5.0), life=(20, 40),
+             direction=0.0, spread=2 * math.pi):
+        """
+        Lanza `count` partículas desde (x, y)
+
+        Args:
+            color: Índice en la paleta, o None para uno al azar por partícula
+            speed: Rango de velocidad inicial (px/frame)
+            life: Rango de duración (frames)
+            direction: Ángulo central en radianes (0 = derecha, y crece hacia abajo)
+            spread: Apertura total del abanico en radianes
+        """
+        count = min(count, self.capacity)
+        if count <= 0:
+            return
+        # Las de menor vida: primero las libres (≤ 0) y, si no alcanzan, las más viejas
+        idx = np.argpartition(self.life, count - 1)[:count]
+        self.recycled += int(np.count_nonzero(self.life[idx] > 0))
+
+        rng = self._rng
+        angles = direction + (rng.random(count, dtype=np.float32) - 0.5) * spread
+        speeds = rng.uniform(speed[0], speed[1], count).astype(np.float32)
+        self.pos[idx] = (x, y)
+        self.vel[idx, 0] = np.cos(angles) * speeds
+        self.vel[idx, 1] = np.sin(angles) * speeds
+        lives = rng.uniform(life[0], life[1], count).astype(np.float32)
+        self.life[idx] = lives
+        self.max_life[idx] = lives
+        if color is None:
+            self.color[idx] = rng.integers(0, len(self.palette), count)
+        else:
+            self.color[idx] = color
+
+    def update(self, steps=1.0):
+        """
+        Avanza todo el pool (las libres también: es más barato que filtrar)
+        steps: frames de 60 Hz a simular (fraccionario si la simulación va más rápido)
+        """
+        self.vel *= self.drag ** steps
+        self.vel[:, 1] += self.gravity * steps
+        self.pos += self.vel * steps
+        self.life -= steps
+
+        if self.bounds is not None:
+            x, y = self.pos[:, 0], self.pos[:, 1]
+            outside = ((x < self.bounds.left) | (x >= self.bounds.right - self.size) |
+                       (y < self.bounds.top) | (y >= self.bounds.bottom - self.size))
+            self.life[outside] = 0
+
+    def clear(self):
+        self.life[:] = 0
+
+    def draw(self, screen):
+        """
+        Dibuja las partículas vivas
+
+        Returns:
+            Lista con el rect que las contiene (vacía si no hay ninguna)
+        """
+        idx = np.flatnonzero(self.life > 0)
+        if len(idx) == 0:
+            return []
+
+        xy = self.pos[idx].astype(np.int32)
+        if self.mode == "pixels":
+            self._draw_pixels(screen, idx, xy)
+        else:
+            self._draw_sprites(screen, idx, xy)
+
+        left, top = xy.min(axis=0)
+        right, bottom = xy.max(axis=0) + self.size
+        return [pygame.Rect(int(left), int(top), int(right - left), int(bottom - top))]
+
+    def _fade(self, idx):
+        """Fracción de vida restante (0..1] de cada partícula"""
+        return self.life[idx] / self.max_life[idx]
+
+    def _draw_sprites(self, screen, idx, xy):
+        levels = np.minimum((self._fade(idx) * self.fade_steps).astype(np.intp),
+                            self.fade_steps - 1)
+        sprites = self._sprites[self.color[idx], levels]
+        screen.blits(zip(sprites.tolist(), xy.tolist()), False)
+
+    def _draw_pixels(self, screen, idx, xy):
+        width, height = screen.get_size()
+        visible = ((xy[:, 0] >= 0) & (xy[:, 0] <= width - self.size) &
+                   (xy[:, 1] >= 0) & (xy[:, 1] <= height - self.size))
+        xy = xy[visible]
+        alpha = self._fade(idx[visible])[:, None]
+        colors = self.palette[self.color[idx[visible]]].astype(np.float32) * alpha
+        keep = 1.0 - alpha
+
+        pixels = pygame.surfarray.pixels3d(screen)  # Vista (x, y, rgb) sin copiar
+        try:
+            for dx in range(self.size):
+                for dy in range(self.size):
+                    xs, ys = xy[:, 0] + dx, xy[:, 1] + dy
+                    pixels[xs, ys] = pixels[xs, ys] * keep + colors
+        finally:
+            del pixels  # Libera el lock de la superficie
@@ -0,0 +1,132 @@
+# ============================================================================
+# src/physics.py - Física de la Pelota en Float con Colisión Continua
+# ============================================================================
+"""
+Posiciones y velocidades en float (sin redondear a píxeles en cada paso) y
+choques resueltos por tiempo de impacto (swept AABB): la pelota no atraviesa
+una paleta de 10 px aunque avance 25 px por frame, y el resultado no depende
+de la frecuencia de la simulación.
+"""
+
+INF = float("inf")
+
+# Máximo de choques resueltos dentro de un mismo paso (pared + paleta + ...)
+MAX_HITS = 4
+
+
+class Ball:
+    """Estado físico de la pelota (esquina superior izquierda, px y px/frame)"""
+
+    __slots__ = ("x", "y", "vx", "vy", "size")
+
+    def __init__(self, x, y, vx, vy, size):
+        self.x = x
+        self.y = y
+        self.vx = vx
+        self.vy = vy
+        self.size = size
+
+
+def swept_aabb(x, y, w, h, dx, dy, bx, by, bw, bh):
+    """
+    Tiempo de impacto de una caja que se desplaza (dx, dy) contra una caja fija
+
+    Returns:
+        Tupla (t, nx, ny) con t en [0, 1] y la normal de la cara tocada, o
+        None si no se tocan durante este desplazamiento (o ya se solapaban)
+    """
+    if dx > 0:
+        x_entry, x_exit = bx - (x + w), (bx + bw) - x
+    else:
+        x_entry, x_exit = (bx + bw) - x, bx - (x + w)
+    if dy > 0:
+        y_entry, y_exit = by - (y + h), (by + bh) - y
+    else:
+        y_entry, y_exit = (by + bh) - y, by - (y + h)
+
+    if dx == 0:
+        if x + w <= bx or x >= bx + bw:
+            return None
+        tx_entry, tx_exit = -INF, INF
+    else:
+        tx_entry, tx_exit = x_entry / dx, x_exit / dx
+
+    if dy == 0:
+        if y + h <= by or y >= by + bh:
+            return None
+        ty_entry, ty_exit = -INF, INF
+    else:
+        ty_entry, ty_exit = y_entry / dy, y_exit / dy
+
+    entry = max(tx_entry, ty_entry)
+    exit_ = min(tx_exit, ty_exit)
+    if entry > exit_ or entry < 0 or entry > 1:
+        return None
+
+    if tx_entry > ty_entry:
+        return entry, (-1.0 if dx > 0 else 1.0), 0.0
+    return entry, 0.0, (-1.0 if dy > 0 else 1.0)
+
+
+def overlaps(x, y, w, h, bx, by, bw, bh):
+    return x < bx + bw and bx < x + w and y < by + bh and by < y + h
+
+
+def advance_ball(ball, steps, paddles, top, bottom, on_wall=None, on_paddle=None):
+    """
+    Mueve la pelota `steps` frames resolviendo los choques en orden de tiempo
+
+    Args:
+        ball: Ball (se modifica en el lugar)
+        steps: Frames de 60 Hz a simular (fraccionario en ticks más cortos)
+        paddles: Secuencia de (x, y, w, h, salida); salida = +1 si la pelota
+                 rebota hacia la derecha (paleta izquierda), -1 si al revés
+        top, bottom: Límites verticales del área de juego
+        on_wall(): Se llama en cada rebote contra una pared
+        on_paddle(i): Se llama en cada golpe con la paleta i; debe dejar
+                      ball.vx saliendo de la paleta (puede cambiar vx/vy)
+    """
+    remaining = 1.0
+    size = ball.size
+    for _ in range(MAX_HITS):
+        dx = ball.vx * steps * remaining
+        dy = ball.vy * steps * remaining
+
+        t_hit = 1.0
+        hit = None
+
+        # Paredes superior e inferior
+        if dy < 0 and ball.y + dy <= top:
+            t_hit, hit = max((top - ball.y) / dy, 0.0), "wall"
+        elif dy > 0 and ball.y + size + dy >= bottom:
+            t_hit, hit = max((bottom - size - ball.y) / dy, 0.0), "wall"
+
+        # Paletas (solo si la pelota va hacia ellas)
+        for i, (px, py, pw, ph, salida) in enumerate(paddles):
+            if ball.vx * salida >= 0:
+                continue
+            if overlaps(ball.x, ball.y, size, size, px, py, pw, ph):
+                # La paleta se movió encima de la pelota: golpe inmediato
+                t_hit, hit = 0.0, i
+                break
+            result = swept_aabb(ball.x, ball.y, size, size, dx, dy, px, py, pw, ph)
+            if result is not None and result[0] < t_hit:
+                t_hit, hit = result[0], i
+
+        ball.x += dx * t_hit
+        ball.y += dy * t_hit
+        if hit is None:
+            return
+
+        if hit == "wall":
+            ball.vy = -ball.vy
+            ball.y = min(max(ball.y, top), bottom - size)
+            if on_wall is not None:
+                on_wall()
+        else:
+            if on_paddle is not None:
+                on_paddle(hit)
+
+        remaining *= 1.0 - t_hit
+        if remaining <= 0.0:
+            return
@@ -0,0 +1,49 @@
+# ============================================================================
+# src/render_layers.py - Capas Pre-dibujadas para el Render
+# ============================================================================
+
+import pygame
+
+
+class StaticLayer:
+    """
+    Superficie pre-dibujada que se reconstruye solo cuando cambia algo de lo
+    que depende (resolución, o la clave extra que pase quien dibuja: idioma,
+    tema, etc.). Cada frame queda en un solo blit.
+    """
+
+    def __init__(self, build):
+        """
+        Args:
+            build: Función build(surface) que dibuja la capa completa
+        """
+        self.build = build
+        self.enabled = True  # False = dibujar directo cada frame (para comparar)
+        self.rebuilds = 0
+
+        self._surface = None
+        self._key = None
+
+    def get(self, size, key=()):
+        """Retorna la superficie cacheada, reconstruyéndola si cambió la clave"""
+        full_key = (size, key)
+        if self._surface is None or full_key != self._key:
+            surface = pygame.Surface(size)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert()  # Mismo formato que la pantalla: blit rápido
+            self.build(surface)
+            self._surface = surface
+            self._key = full_key
+            self.rebuilds += 1
+        return self._surface
+
+    def draw(self, screen, key=()):
+        """Dibuja la capa en la pantalla (blit del caché)"""
+        if not self.enabled:
+            self.build(screen)
+            return
+        screen.blit(self.get(screen.get_size(), key), (0, 0))
+
+    def invalidate(self):
+        """Fuerza a reconstruir la capa en el próximo draw"""
+        self._key = None
@@ -0,0 +1,50 @@
+# ============================================================================
+# src/sprite_atlas.py - Atlas de Sprites Pre-escalados
+# ============================================================================
+
+import pygame
+
+
+class SpriteAtlas:
+    """
+    Todas las variantes (sprite, tamaño) empaquetadas en una sola superficie:
+    una fila por tamaño, una columna por sprite. get() retorna una
+    subsuperficie (comparte los píxeles del atlas, no copia), así que en cada
+    frame solo queda un blit sin escalar nada.
+    """
+
+    def __init__(self, sprites, sizes, smooth=True):
+        """
+        Args:
+            sprites: Dict nombre → Surface original (cualquier tamaño)
+            sizes: Tamaños cuadrados (px) que usa la interfaz
+            smooth: Escalar con smoothscale (mejor calidad, solo al armar el atlas)
+        """
+        self.names = tuple(sprites)
+        self.sizes = tuple(sorted(set(sizes), reverse=True))
+
+        width = len(self.names) * max(self.sizes)
+        height = sum(self.sizes)
+        self.surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha()
+
+        scale = pygame.transform.smoothscale if smooth else pygame.transform.scale
+        self._regions = {}
+        y = 0
+        for size in self.sizes:
+            for column, name in enumerate(self.names):
+                sprite = sprites[name]
+                if sprite.get_bitsize() < 24:
+                    sprite = sprite.convert_alpha()  # smoothscale pide 24/32 bits
+                rect = pygame.Rect(column * size, y, size, size)
+                self.surface.blit(scale(sprite, (size, size)), rect)
+                self._regions[(name, size)] = self.surface.subsurface(rect)
+            y += size
+
+    def get(self, name, size):
+        """Sprite `name` ya escalado a `size` px (KeyError si no está en el atlas)"""
+        return self._regions[(name, size)]
+
+    def __contains__(self, key):
+        return key in self._regions
@@ -0,0 +1,46 @@
+# ============================================================================
+# src/startup.py - Línea de Tiempo del Arranque
+# ============================================================================
+
+import json
+import time
+
+
+class StartupTimeline:
+    """
+    Marcas de tiempo del arranque (imports, ventana, cámara, modelo, primer
+    frame), relativas al inicio del proceso. Sirve para seguir el tiempo
+    hasta poder jugar como una métrica más.
+    """
+
+    def __init__(self, origin=None):
+        """
+        Args:
+            origin: time.perf_counter() del inicio (por defecto, ahora)
+        """
+        self.origin = time.perf_counter() if origin is None else origin
+        self.marks = {}
+
+    def mark(self, name, timestamp=None):
+        """Anota una etapa (solo la primera vez; timestamp = perf_counter o ahora)"""
+        if name not in self.marks:
+            self.marks[name] = time.perf_counter() if timestamp is None else timestamp
+
+    def elapsed(self, name):
+        """Segundos desde el inicio hasta la etapa (None si aún no ocurrió)"""
+        if name not in self.marks:
+            return None
+        return self.marks[name] - self.origin
+
+    def as_dict(self):
+        """Etapas → ms desde el inicio, en orden cronológico"""
+        return {name: round((t - self.origin) * 1000, 1)
+                for name, t in sorted(self.marks.items(), key=lambda item: item[1])}
+
+    def report(self):
+        """Texto con una línea por etapa"""
+        return "\n".join(f"   {name:<16} {ms:8.1f} ms" for name, ms in self.as_dict().items())
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.as_dict(), f, indent=2)
@@ -0,0 +1,122 @@
+# ============================================================================
+# src/text_cache.py - Caché de Texto Renderizado y Registro de Fuentes
+# ============================================================================
+
+from collections import OrderedDict
+
+import pygame
+
+# Suficiente para todos los textos de una pantalla + los valores que rotan
+# (porcentajes, marcadores, líneas de diálogo)
+DEFAULT_MAX_ENTRIES = 512
+
+_fonts = {}
+
+
+def get_font(name, size, bold=False, italic=False):
+    """
+    Retorna la fuente pedida creándola solo la primera vez (SysFont busca en
+    el sistema y carga el archivo: es caro para hacerlo en cada frame)
+    """
+    key = (name, size, bold, italic)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.SysFont(name, size, bold=bold, italic=italic)
+        _fonts[key] = font
+    return font
+
+
+class TextCache:
+    """
+    Superficies de texto ya rasterizadas, por (fuente, texto, color, antialias).
+    Tamaño acotado: cuando se llena se descarta la menos usada (LRU).
+
+    Las superficies se comparten: quien las recibe solo debe hacer blit.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._surfaces = OrderedDict()
+
+    def render(self, font, text, color, antialias=True):
+        """Igual que font.render(text, antialias, color), pero cacheado"""
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def text_width(self, font, text, color, antialias=True):
+        """Ancho de `text` armado con blit_glyphs (mismos glifos que dibuja)"""
+        return sum(self.render(font, char, color, antialias).get_width() for char in text)
+
+    def blit_glyphs(self, target, font, text, color, pos, antialias=True):
+        """
+        Dibuja `text` carácter por carácter con glifos cacheados y retorna el
+        Rect ocupado. Para números que cambian seguido (marcador, porcentajes):
+        cada valor nuevo no se rasteriza ni ocupa una entrada del LRU, solo
+        se rasterizan una vez los dígitos y signos.
+        """
+        x, y = pos
+        height = font.get_height()
+        for char in text:
+            glyph = self.render(font, char, color, antialias)
+            target.blit(glyph, (x, y))
+            x += glyph.get_width()
+        return pygame.Rect(pos[0], y, x - pos[0], height)
+
+    def preload_glyphs(self, font, chars, color, antialias=True):
+        """Rasteriza de antemano los glifos que usará blit_glyphs"""
+        for char in chars:
+            self.render(font, char, color, antialias)
+
+    def clear(self):
+        """Vacía el caché y reinicia los contadores"""
+        self._surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": len(self._surfaces),
+            "fonts": len(_fonts),
+        }
+
+
+# Caché compartido por el juego y los menús
+text_cache = TextCache()
+
+
+def render_text(font, text, color, antialias=True):
+    """Renderiza texto usando el caché compartido"""
+    return text_cache.render(font, text, color, antialias)
+
+
+def blit_glyphs(target, font, text, color, pos, antialias=True):
+    """Dibuja texto por glifos usando el caché compartido (ver TextCache.blit_glyphs)"""
+    return text_cache.blit_glyphs(target, font, text, color, pos, antialias)
+
+
+def text_width(font, text, color, antialias=True):
+    """Ancho de un texto dibujado con blit_glyphs"""
+    return text_cache.text_width(font, text, color, antialias)
+
+
+def preload_glyphs(font, chars, color, antialias=True):
+    """Rasteriza glifos de antemano en el caché compartido"""
+    text_cache.preload_glyphs(font, chars, color, antialias)
@@ -0,0 +1,97 @@
+# ============================================================================
+# src/text_layout.py - Word-wrap Cacheado y Efecto Typewriter
+# ============================================================================
+
+import re
+from functools import lru_cache
+
+from src.text_cache import render_text
+
+_WORD = re.compile(r"\S+")
+
+
+def wrap_text(font, text, width):
+    """
+    Parte el texto en líneas que entran en `width` px
+
+    Returns:
+        Lista de (inicio, fin) de cada línea dentro de `text`, para que el
+        typewriter pueda contar caracteres sobre el texto original
+    """
+    lines = []
+    start = end = None
+    for match in _WORD.finditer(text):
+        if start is None:
+            start, end = match.span()
+        elif font.size(text[start:match.end()] + " ")[0] < width:
+            end = match.end()
+        else:
+            lines.append((start, end))
+            start, end = match.span()
+    if start is not None:
+        lines.append((start, end))
+    return lines
+
+
+class TextLayout:
+    """
+    Párrafo ya partido en líneas y rasterizado una sola vez. Para el efecto
+    typewriter no se vuelve a renderizar nada: la línea que se está
+    escribiendo se dibuja recortada al ancho de los caracteres visibles.
+    """
+
+    def __init__(self, font, text, width, color, line_height,
+                 max_lines=None, shadow_color=None):
+        self.text = text
+        self.line_height = line_height
+        self.lines = wrap_text(font, text, width)[:max_lines]
+
+        self._surfaces = []
+        self._shadows = []
+        self._prefix_widths = []
+        for start, end in self.lines:
+            line = text[start:end]
+            self._surfaces.append(render_text(font, line, color))
+            self._shadows.append(
+                render_text(font, line, shadow_color) if shadow_color else None
+            )
+            # Ancho en px de los primeros k caracteres (k = 0..len)
+            self._prefix_widths.append(
+                [font.size(line[:k])[0] for k in range(len(line) + 1)]
+            )
+
+    def __len__(self):
+        return len(self.text)
+
+    def draw(self, screen, pos, visible=None):
+        """
+        Dibuja el párrafo en pos (x, y)
+
+        Args:
+            visible: Cantidad de caracteres del texto ya escritos (None = todos)
+
+        Returns:
+            Lista de rects dibujados
+        """
+        x, y = pos
+        rects = []
+        for i, (start, end) in enumerate(self.lines):
+            if visible is not None and visible <= start:
+                break
+            surface = self._surfaces[i]
+            area = None
+            if visible is not None and visible < end:
+                width = self._prefix_widths[i][visible - start]
+                area = (0, 0, width, surface.get_height())
+
+            line_y = y + i * self.line_height
+            if self._shadows[i] is not None:
+                rects.append(screen.blit(self._shadows[i], (x + 1, line_y + 1), area))
+            rects.append(screen.blit(surface, (x, line_y), area))
+        return rects
+
+
+@lru_cache(maxsize=64)
+def get_layout(font, text, width, color, line_height, max_lines=None, shadow_color=None):
+    """TextLayout cacheado: el wrap y el render se hacen una vez por texto"""
+    return TextLayout(font, text, width, color, line_height, max_lines, shadow_color)
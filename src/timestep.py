@@ -0,0 +1,58 @@
+# ============================================================================
+# src/timestep.py - Simulación a Paso Fijo, Independiente del Render
+# ============================================================================
+
+import time
+
+
+class FixedTimestep:
+    """
+    Acumulador para correr la simulación a una frecuencia fija (ej. 120 Hz)
+    sin importar a cuántos FPS se dibuje:
+
+        for _ in range(paso.advance()):
+            juego.update(paso.dt)
+        juego.draw(pantalla, paso.alpha)
+
+    alpha es la fracción de tick que quedó en el acumulador, para interpolar
+    el dibujo entre el estado anterior y el actual.
+
+    Si un frame tarda demasiado (cámara trabada, máquina lenta) se corren
+    como mucho `max_steps` ticks y el resto se descarta: el juego va más
+    lento un momento en vez de entrar en la "espiral de la muerte" (cada
+    frame atrasado pide más ticks, que atrasan más el siguiente).
+    """
+
+    def __init__(self, tick_rate=120, max_steps=8):
+        self.tick_rate = tick_rate
+        self.dt = 1.0 / tick_rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.ticks = 0
+        self.dropped = 0.0  # Segundos de simulación descartados por el límite
+        self._last = time.perf_counter()
+
+    def reset(self, now=None):
+        """Empieza a medir desde ahora (ej. al salir de un menú o una pausa)"""
+        self._last = time.perf_counter() if now is None else now
+        self.accumulator = 0.0
+
+    def advance(self, now=None):
+        """Suma el tiempo real transcurrido y retorna cuántos ticks correr"""
+        now = time.perf_counter() if now is None else now
+        self.accumulator += now - self._last
+        self._last = now
+
+        steps = int(self.accumulator / self.dt)
+        if steps > self.max_steps:
+            self.dropped += (steps - self.max_steps) * self.dt
+            self.accumulator -= (steps - self.max_steps) * self.dt
+            steps = self.max_steps
+        self.accumulator -= steps * self.dt
+        self.ticks += steps
+        return steps
+
+    @property
+    def alpha(self):
+        """Fracción (0..1) del próximo tick ya transcurrida"""
+        return min(self.accumulator / self.dt, 1.0)
@@ -0,0 +1,426 @@
+# ============================================================================
+# src/tracking.py - Seguimiento de la Mano en Segundo Plano
+# ============================================================================
+
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import shared_memory
+
+import cv2
+import numpy as np
+from src.frame_pipeline import FramePipeline, PREVIEW_SIZE
+from src.frame_sources import abrir_fuente
+from src.gestures import GESTOS, clasificar_lote, detectar_gesto_array
+from src.inference import crear_inferencia
+
+# Mismas conexiones que mp.solutions.hands.HAND_CONNECTIONS (palma + dedos).
+# Se copian para no importar MediaPipe (~1 s) hasta que haga falta el modelo.
+HAND_CONNECTIONS = (
+    (0, 1), (0, 5), (5, 9), (9, 13), (13, 17), (0, 17),
+    (1, 2), (2, 3), (3, 4),
+    (5, 6), (6, 7), (7, 8),
+    (9, 10), (10, 11), (11, 12),
+    (13, 14), (14, 15), (15, 16),
+    (17, 18), (18, 19), (19, 20),
+)
+
+# Colores por defecto de MediaPipe, en orden RGB
+LANDMARK_COLOR = (255, 0, 0)
+CONNECTION_COLOR = (224, 224, 224)
+
+
+class TrackingResult:
+    """Último resultado publicado por el tracker (gesto + vista previa)"""
+
+    def __init__(self, gesto, landmarks, preview, timestamp, frame_id, gestos=None):
+        self.gesto = gesto          # "UP", "DOWN", "STOP" o None si no hay mano
+        self.landmarks = landmarks  # Array (21, 3) normalizado (o None)
+                                    # En modo 2 jugadores: (2, 21, 3), NaN sin mano
+        self.gestos = gestos        # Modo 2 jugadores: [gesto_izq, gesto_der]
+        self.preview = preview      # Vista previa RGB (PREVIEW_SIZE) para pygame
+        self.timestamp = timestamp  # time.perf_counter() de la captura
+        self.frame_id = frame_id
+
+
+def crear_hands(max_num_hands=1, static_image_mode=False):
+    """Crea el detector de manos de MediaPipe con la configuración del juego"""
+    import mediapipe as mp  # Import pesado: solo en el hilo/proceso que corre el modelo
+
+    return mp.solutions.hands.Hands(static_image_mode=static_image_mode,
+                                    max_num_hands=max_num_hands, min_detection_confidence=0.7,
+                                    min_tracking_confidence=0.7)
+
+
+def crear_hands_roi(roi_size, players=1):
+    """
+    Hands aparte (modo video) para los recortes de RoiInference, o None si
+    no se usa ROI (con 2 jugadores crear_inferencia no recorta)
+    """
+    if not roi_size or players != 1:
+        return None
+    return crear_hands()
+
+
+def calentar_modelo(hands, size=(256, 256)):
+    """
+    Corre el modelo una vez sobre un frame negro: la primera llamada a
+    hands.process inicializa el grafo y tarda mucho más que las siguientes
+    """
+    hands.process(np.zeros((size[1], size[0], 3), dtype=np.uint8))
+
+
+def iniciar_captura(source, camera_profile, players, startup):
+    """
+    Abre la fuente de frames y carga + calienta el modelo en paralelo (abrir
+    y negociar la cámara y cargar MediaPipe tardan cada uno del orden de 1 s)
+
+    Args:
+        startup: Dict donde se anota time.perf_counter() de "camara_abierta"
+                 y "modelo_listo"
+
+    Returns:
+        Tupla (cap, hands)
+    """
+    def abrir():
+        cap = abrir_fuente(source, camera_profile=camera_profile)
+        startup["camara_abierta"] = time.perf_counter()
+        return cap
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="CameraOpen") as pool:
+        futuro = pool.submit(abrir)
+        hands = crear_hands(max_num_hands=players)
+        calentar_modelo(hands)
+        startup["modelo_listo"] = time.perf_counter()
+        try:
+            cap = futuro.result()
+        except Exception:
+            hands.close()
+            raise
+    return cap, hands
+
+
+def describir_error(error):
+    """Texto corto de un error del tracker para mostrar en el juego"""
+    return f"{type(error).__name__}: {error}"
+
+
+def cerrar_recursos(cap, hands, roi_hands):
+    """Cierra lo que se haya llegado a abrir (None = no se abrió)"""
+    for modelo in (hands, roi_hands):
+        if modelo is not None:
+            modelo.close()
+    if cap is not None:
+        cap.release()
+
+
+def dibujar_landmarks(rgb, landmarks):
+    """Dibuja los landmarks (21, 3) sobre un frame RGB (estilo MediaPipe)"""
+    height, width = rgb.shape[:2]
+    points = [(int(x * width), int(y * height)) for x, y, _ in landmarks]
+    for start, end in HAND_CONNECTIONS:
+        cv2.line(rgb, points[start], points[end], CONNECTION_COLOR, 2)
+    for point in points:
+        cv2.circle(rgb, point, 2, LANDMARK_COLOR, 2)
+
+
+def procesar_frame(inferencia, frame, pipeline, preview_dst=None):
+    """
+    Procesa un frame BGR de la cámara
+
+    Args:
+        inferencia: Estrategia de src/inference.py
+        frame: Frame BGR tal como llega de la cámara
+        pipeline: FramePipeline con los buffers reservados
+        preview_dst: Buffer destino opcional para la vista previa
+
+    Returns:
+        Tupla (gesto, landmarks, preview_rgb, gestos); gestos solo en modo
+        2 jugadores ([izquierdo, derecho]), si no None
+    """
+    # Un solo RGB espejado para MediaPipe y para la vista previa
+    rgb = pipeline.prepare(frame)
+    landmarks, _ = inferencia.process(rgb)
+
+    gesto = None
+    gestos = None
+    if landmarks is not None and landmarks.ndim == 3:
+        # Dos jugadores: ambas manos se clasifican en una sola llamada
+        presentes = ~np.isnan(landmarks[:, 0, 0])
+        codigos = clasificar_lote(landmarks)
+        gestos = [GESTOS[c] if p else None for c, p in zip(codigos, presentes)]
+        gesto = gestos[0]
+
+        width = rgb.shape[1]
+        for mano, gesto_mano, x in zip(landmarks, gestos, (20, width // 2 + 20)):
+            if gesto_mano is not None:
+                cv2.putText(rgb, gesto_mano, (x, 40),
+                            cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+                dibujar_landmarks(rgb, mano)
+    elif landmarks is not None:
+        gesto = detectar_gesto_array(landmarks)
+
+        # Mostrar gesto en pantalla (debug) - el buffer ya está en RGB
+        cv2.putText(rgb, f"{gesto}", (20, 40),
+                    cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+        dibujar_landmarks(rgb, landmarks)
+
+    preview = pipeline.preview(rgb, preview_dst)
+    return gesto, landmarks, preview, gestos
+
+
+class RateMeter:
+    """Mide la frecuencia (Hz) de un evento en ventanas de un segundo"""
+
+    def __init__(self):
+        self.hz = 0.0
+        self._window_start = time.perf_counter()
+        self._window_count = 0
+
+    def tick(self):
+        self._window_count += 1
+        elapsed = time.perf_counter() - self._window_start
+        if elapsed >= 1.0:
+            self.hz = self._window_count / elapsed
+            self._window_start += elapsed
+            self._window_count = 0
+
+
+class HandTracker(threading.Thread):
+    """
+    Captura la cámara (o cualquier fuente de src/frame_sources.py) y corre
+    MediaPipe en un hilo aparte.
+
+    Solo se guarda el último resultado (el más nuevo reemplaza al anterior),
+    así el loop del juego nunca espera a la cámara ni a la inferencia.
+    """
+
+    def __init__(self, source=0, preview_size=PREVIEW_SIZE, roi_size=None,
+                 flow_interval=0, players=1, camera_profile="auto", asignacion="lado"):
+        super().__init__(daemon=True)
+        self.source = source
+        self.camera_profile = camera_profile
+        self.preview_size = preview_size
+        self.roi_size = roi_size
+        self.flow_interval = flow_interval
+        self.players = players
+        self.asignacion = asignacion
+        self.inference_stats = {}
+        # time.perf_counter() de cada etapa del arranque (cámara, modelo, primer frame)
+        self.startup_times = {}
+        # Texto del error si el hilo no pudo arrancar o se cayó (None = todo bien)
+        self.error = None
+
+        self._lock = threading.Lock()
+        self._latest = None
+        self._stop_event = threading.Event()
+
+        # Estadísticas de inferencia
+        self.frames_processed = 0
+        self._rate = RateMeter()
+
+    @property
+    def tracking_hz(self):
+        return self._rate.hz
+
+    def run(self):
+        """Loop del hilo: captura → inferencia → publicar"""
+        cap = hands = roi_hands = None
+        try:
+            cap, hands = iniciar_captura(self.source, self.camera_profile, self.players,
+                                         self.startup_times)
+            roi_hands = crear_hands_roi(self.roi_size, self.players)
+            inferencia = crear_inferencia(hands, self.roi_size, self.flow_interval,
+                                          self.players, roi_hands, self.asignacion)
+            self.inference_stats = inferencia.stats
+            # Ring de 3 vistas previas: el juego lee una mientras se escribe otra
+            pipeline = FramePipeline(self.preview_size, preview_buffers=3)
+
+            while not self._stop_event.is_set():
+                ret, frame = pipeline.read(cap)
+                if not ret:
+                    time.sleep(0.01)
+                    continue
+
+                timestamp = time.perf_counter()
+                gesto, landmarks, preview, gestos = procesar_frame(inferencia, frame, pipeline)
+                self.frames_processed += 1
+                result = TrackingResult(gesto, landmarks, preview, timestamp,
+                                        self.frames_processed, gestos)
+
+                self.startup_times.setdefault("primer_frame", time.perf_counter())
+                with self._lock:
+                    self._latest = result
+                self._rate.tick()
+        except Exception as e:
+            # El juego sigue sin cámara: main muestra el error en vez de esperar
+            self.error = describir_error(e)
+        finally:
+            cerrar_recursos(cap, hands, roi_hands)
+
+    def get_latest(self):
+        """Retorna el último resultado sin bloquear (o None si aún no hay)"""
+        with self._lock:
+            return self._latest
+
+    def stop(self, timeout=1.0):
+        """Detiene el hilo y libera la cámara"""
+        self._stop_event.set()
+        if self.is_alive():
+            self.join(timeout)
+
+
+# ============================================================================
+# Modo multiproceso: cámara + MediaPipe en otro núcleo
+# ============================================================================
+
+def _tracking_process(shm_name, slots, shape, conn, stop_event, source,
+                      roi_size, flow_interval, players, camera_profile, asignacion):
+    """
+    Proceso hijo: captura, corre MediaPipe y escribe la vista previa en el
+    ring buffer de memoria compartida. Por el pipe solo viaja el resultado
+    pequeño (gesto, landmarks, slot) y, en el primer frame, los tiempos de
+    arranque. Si algo falla, se manda el texto del error.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    frames = np.ndarray((slots, *shape), dtype=np.uint8, buffer=shm.buf)
+    preview_size = (shape[1], shape[0])
+
+    startup = {}
+    cap = hands = roi_hands = None
+    try:
+        cap, hands = iniciar_captura(source, camera_profile, players, startup)
+        roi_hands = crear_hands_roi(roi_size, players)
+        inferencia = crear_inferencia(hands, roi_size, flow_interval, players, roi_hands,
+                                      asignacion)
+        # La vista previa se escala directo dentro del slot compartido
+        pipeline = FramePipeline(preview_size, preview_buffers=1)
+        rate = RateMeter()
+        frame_id = 0
+
+        while not stop_event.is_set():
+            ret, frame = pipeline.read(cap)
+            if not ret:
+                time.sleep(0.01)
+                continue
+
+            timestamp = time.perf_counter()
+            slot = (frame_id + 1) % slots
+            gesto, landmarks, _, gestos = procesar_frame(inferencia, frame, pipeline, frames[slot])
+
+            frame_id += 1
+            rate.tick()
+
+            # Los tiempos de arranque viajan solo con el primer frame
+            # (perf_counter es el mismo reloj del sistema en ambos procesos)
+            if frame_id == 1:
+                startup["primer_frame"] = time.perf_counter()
+            conn.send((gesto, landmarks, gestos, slot, timestamp, frame_id, rate.hz,
+                       inferencia.stats, startup if frame_id == 1 else None))
+    except (BrokenPipeError, EOFError):
+        pass  # El proceso principal ya cerró
+    except Exception as e:
+        # Un str por el pipe (los resultados son tuplas) avisa el error a main
+        try:
+            conn.send(describir_error(e))
+        except (BrokenPipeError, EOFError, OSError):
+            pass
+    finally:
+        cerrar_recursos(cap, hands, roi_hands)
+        del frames
+        shm.close()
+        conn.close()
+
+
+class ProcessHandTracker:
+    """
+    Igual que HandTracker pero en un proceso aparte (sin pelear por el GIL).
+
+    Las vistas previas se comparten por un ring buffer en
+    multiprocessing.shared_memory, así no se serializan arrays de numpy.
+    Misma interfaz: start(), get_latest(), stop(), tracking_hz, startup_times,
+    error.
+    """
+
+    def __init__(self, source=0, preview_size=PREVIEW_SIZE, slots=4, roi_size=None,
+                 flow_interval=0, players=1, camera_profile="auto", asignacion="lado"):
+        width, height = preview_size
+        self._shape = (height, width, 3)
+        self._slots = slots
+
+        self._shm = shared_memory.SharedMemory(create=True, size=slots * height * width * 3)
+        self._frames = np.ndarray((slots, *self._shape), dtype=np.uint8, buffer=self._shm.buf)
+
+        self._recv, send = multiprocessing.Pipe(duplex=False)
+        self._stop_event = multiprocessing.Event()
+        self._process = multiprocessing.Process(
+            target=_tracking_process,
+            args=(self._shm.name, slots, self._shape, send, self._stop_event,
+                  source, roi_size, flow_interval, players, camera_profile, asignacion),
+            daemon=True,
+        )
+        self._send = send
+
+        # Buffers propios del proceso principal (se copian, no se reservan)
+        self._previews = [np.empty(self._shape, dtype=np.uint8) for _ in range(3)]
+        self._next_preview = 0
+
+        self._latest = None
+        self.frames_processed = 0
+        self.tracking_hz = 0.0
+        self.inference_stats = {}
+        self.startup_times = {}
+        self.error = None
+
+    def start(self):
+        """Lanza el proceso hijo"""
+        self._process.start()
+        self._send.close()  # Solo el hijo escribe en el pipe
+
+    def get_latest(self):
+        """Vacía el pipe y retorna el resultado más nuevo (no bloquea)"""
+        message = None
+        try:
+            while self._recv.poll():
+                recibido = self._recv.recv()
+                if isinstance(recibido, str):
+                    self.error = recibido  # El hijo no pudo arrancar o se cayó
+                    continue
+                message = recibido
+                # Los tiempos de arranque vienen solo en el primer frame: no
+                # perderlos si llegaron varios frames juntos
+                startup = message[-1]
+                if startup:
+                    self.startup_times.update(startup)
+        except (EOFError, OSError):
+            pass  # El proceso hijo terminó
+
+        if self.error is None and self._process.exitcode is not None:
+            self.error = f"El proceso de tracking terminó (código {self._process.exitcode})"
+
+        if message is not None:
+            gesto, landmarks, gestos, slot, timestamp, frame_id, hz, stats, _ = message
+            # Copiar el slot antes de que el hijo lo vuelva a usar
+            preview = self._previews[self._next_preview]
+            self._next_preview = (self._next_preview + 1) % len(self._previews)
+            np.copyto(preview, self._frames[slot])
+            self._latest = TrackingResult(gesto, landmarks, preview, timestamp, frame_id, gestos)
+            self.frames_processed = frame_id
+            self.tracking_hz = hz
+            self.inference_stats = stats
+
+        return self._latest
+
+    def stop(self, timeout=1.0):
+        """Detiene el proceso hijo y libera la memoria compartida"""
+        self._stop_event.set()
+        self._process.join(timeout)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+
+        self._recv.close()
+        del self._frames
+        self._shm.close()
+        self._shm.unlink()
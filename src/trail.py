@@ -0,0 +1,82 @@
+# ============================================================================
+# src/trail.py - Estela de la Pelota con Sprites Pre-dibujados
+# ============================================================================
+
+import pygame
+
+
+class TrailHistory:
+    """
+    Últimas `capacity` posiciones en un ring buffer de tamaño fijo: agregar
+    un punto no reserva memoria ni mueve los anteriores (a diferencia de
+    list.pop(0)).
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._x = [0] * capacity
+        self._y = [0] * capacity
+        self._head = 0   # Próxima posición a escribir
+        self._count = 0
+
+    def push(self, x, y):
+        self._x[self._head] = x
+        self._y[self._head] = y
+        self._head = (self._head + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def clear(self):
+        self._head = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        """Posiciones (x, y) de la más vieja a la más nueva"""
+        start = self._head - self._count
+        for k in range(start, self._head):
+            yield self._x[k], self._y[k]  # Índices negativos = vuelta del ring
+
+
+class TrailSpriteBank:
+    """
+    Un sprite con alpha ya rasterizado por cada índice de la estela (el más
+    viejo es el más chico y transparente). Dibujar es solo blitear; el mismo
+    banco sirve para cualquier cantidad de pelotas.
+    """
+
+    def __init__(self, length, size, color, min_size=3):
+        """
+        Args:
+            length: Largo de la estela (puntos)
+            size: Tamaño del punto más nuevo (px)
+            color: Color RGB
+            min_size: Los puntos más chicos que esto no se dibujan
+        """
+        self.length = length
+        self.sprites = []
+        for i in range(length):
+            alpha = int(255 * (i / length))
+            sprite_size = int(size * (i / length))
+            if sprite_size < min_size:
+                self.sprites.append(None)
+                continue
+            sprite = pygame.Surface((sprite_size, sprite_size), pygame.SRCALPHA)
+            pygame.draw.ellipse(sprite, (*color, alpha), (0, 0, sprite_size, sprite_size))
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()
+            self.sprites.append(sprite)
+
+    def draw(self, screen, history):
+        """Dibuja la estela de un TrailHistory y retorna los rects dibujados"""
+        # Si la estela aún no está llena, los puntos que hay son los más nuevos
+        index = self.length - len(history)
+        rects = []
+        for position in history:
+            sprite = self.sprites[index]
+            if sprite is not None:
+                rects.append(screen.blit(sprite, position))
+            index += 1
+        return rects
@@ -0,0 +1,120 @@
+# ============================================================================
+# tools/bench_batch.py - Paridad y Velocidad del Simulador por Lotes
+# ============================================================================
+"""
+1. Paridad: juega partidos con MatchModel (escalar) y con una fila de
+   BatchMatches a la vez, con la misma paleta izquierda, y compara el estado
+   en cada paso. Los saques salen de RNG distintos, así que en cada punto el
+   saque del modelo escalar se copia al lote.
+2. Velocidad: pasos de partido por segundo de BatchMatches según el tamaño
+   del lote, contra MatchModel.step en un bucle de Python.
+
+No necesita pygame. Uso:
+    python -m tools.bench_batch [--matches 20] [--sizes 1 100 1000 10000]
+"""
+
+import argparse
+import math
+import time
+
+import numpy as np
+
+from src.batch import BatchMatches
+from src.model import MatchModel
+
+TOLERANCIA = 1e-6
+
+
+def paleta_izquierda(paso):
+    """Input determinístico para la paleta izquierda (oscila arriba y abajo)"""
+    return 6.0 * math.sin(paso * 0.05) + 2.0 * math.sin(paso * 0.31)
+
+
+def estado_modelo(model):
+    ball = model.ball
+    return (ball.x, ball.y, ball.vx, ball.vy, model.player_y, model.ai_y,
+            model.score_player, model.score_ai, model.player_hp, model.ai_hp,
+            model.confianza, model.rally, model.ai_seen)
+
+
+def estado_lote(batch, i):
+    return (batch.x[i], batch.y[i], batch.vx[i], batch.vy[i], batch.player_y[i],
+            batch.ai_y[i], batch.score_player[i], batch.score_ai[i],
+            batch.player_hp[i], batch.ai_hp[i], batch.confianza[i], batch.rally[i],
+            batch.ai_seen[i])
+
+
+def paridad(difficulty, seed, max_pasos=100_000):
+    """
+    Retorna (pasos, primer paso distinto o None) de un partido completo
+    """
+    model = MatchModel(difficulty, seed=seed)
+    batch = BatchMatches(1, difficulty)
+    batch.load_model(0, model)
+
+    for paso in range(max_pasos):
+        dy = paleta_izquierda(paso)
+        events = model.step(1.0, player_dy=dy)
+        batch.step(1.0, player_dy=dy)
+        if any(event[0] == "score" for event in events):
+            # Mismo puntaje y HP; la dirección del saque se toma del escalar
+            ball = model.ball
+            batch.x[0], batch.y[0], batch.vx[0], batch.vy[0] = ball.x, ball.y, ball.vx, ball.vy
+            batch.ai_seen[0] = model.ai_seen
+
+        for a, b in zip(estado_modelo(model), estado_lote(batch, 0)):
+            if abs(a - b) > TOLERANCIA:
+                return paso + 1, paso
+        if model.finished:
+            if not batch.done[0]:
+                return paso + 1, paso
+            return paso + 1, None
+    return max_pasos, None
+
+
+def pasos_por_segundo_lote(n, difficulty, pasos):
+    batch = BatchMatches(n, difficulty, seed=0)
+    dy = np.zeros(n)
+    inicio = time.perf_counter()
+    for paso in range(pasos):
+        dy[:] = paleta_izquierda(paso)
+        batch.step(1.0, player_dy=dy)
+    return n * pasos / (time.perf_counter() - inicio)
+
+
+def pasos_por_segundo_escalar(difficulty, pasos):
+    model = MatchModel(difficulty, seed=0)
+    inicio = time.perf_counter()
+    for paso in range(pasos):
+        model.step(1.0, player_dy=paleta_izquierda(paso))
+    return pasos / (time.perf_counter() - inicio)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Paridad y velocidad de BatchMatches")
+    parser.add_argument("--matches", type=int, default=20, help="Partidos de paridad por dificultad")
+    parser.add_argument("--steps", type=int, default=500, help="Pasos por medición de velocidad")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100, 1000, 10000])
+    args = parser.parse_args()
+
+    print(f"🔍 Paridad escalar vs lote ({args.matches} partidos por dificultad)")
+    fallas = 0
+    for difficulty in range(4):
+        total = 0
+        for seed in range(args.matches):
+            pasos, distinto = paridad(difficulty, seed)
+            total += pasos
+            if distinto is not None:
+                fallas += 1
+                print(f"   ❌ dificultad {difficulty}, seed {seed}: difiere en el paso {distinto}")
+        print(f"   dificultad {difficulty}: {total} pasos comparados")
+    print("   ✅ Sin diferencias" if fallas == 0 else f"   ⚠️ {fallas} partidos con diferencias")
+
+    print(f"\n📊 Pasos de partido por segundo ({args.steps} pasos por medición)")
+    print(f"   {'escalar':>10}  {pasos_por_segundo_escalar(1, args.steps):>14,.0f}")
+    for n in args.sizes:
+        print(f"   {n:>10}  {pasos_por_segundo_lote(n, 1, args.steps):>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
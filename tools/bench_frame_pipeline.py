@@ -0,0 +1,97 @@
+# ============================================================================
+# tools/bench_frame_pipeline.py - Benchmark del Pipeline de Frames
+# ============================================================================
+"""
+Compara el camino anterior de main.py (una copia nueva por paso) contra
+FramePipeline (buffers fijos + superficie persistente).
+
+No usa cámara ni MediaPipe: solo mide flip/color/resize/superficie.
+
+Uso:
+    python -m tools.bench_frame_pipeline [--frames 500] [--width 1280 --height 720]
+"""
+
+import argparse
+import os
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import cv2
+import numpy as np
+import pygame
+
+from src.frame_pipeline import FramePipeline, PREVIEW_SIZE
+
+
+def camino_anterior(frame, state):
+    """Réplica del loop original de main.py"""
+    frame = cv2.flip(frame, 1)
+    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)  # Entrada de MediaPipe
+    cam_small = cv2.resize(frame, PREVIEW_SIZE)
+    cam_small = cv2.cvtColor(cam_small, cv2.COLOR_BGR2RGB)
+    return rgb, pygame.surfarray.make_surface(np.rot90(cam_small))
+
+
+def camino_nuevo(frame, state):
+    """FramePipeline + blit_array sobre una superficie fija"""
+    pipeline, surface = state
+    rgb = pipeline.prepare(frame)
+    preview = pipeline.preview(rgb)
+    pygame.surfarray.blit_array(surface, np.rot90(preview))
+    return rgb, surface
+
+
+def medir(nombre, paso, state, frames, n):
+    """Retorna (ms por frame, pico de memoria del loop en KB sobre la base)"""
+    # Calentamiento (reserva inicial de buffers)
+    for i in range(5):
+        paso(frames[i % len(frames)], state)
+
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+
+    inicio = time.perf_counter()
+    for i in range(n):
+        paso(frames[i % len(frames)], state)
+    duracion = time.perf_counter() - inicio
+
+    # numpy reporta sus arrays a tracemalloc: el pico muestra lo más que
+    # llegó a estar reservado a la vez (las copias de un frame, aunque se
+    # liberen enseguida), no el total reservado por frame
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    ms = duracion * 1000 / n
+    kb = (pico - base) / 1024
+    print(f"{nombre:<10} {ms:8.3f} ms/frame   pico de memoria {kb:9.1f} KB")
+    return ms, kb
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del pipeline de frames")
+    parser.add_argument("--frames", type=int, default=500)
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    args = parser.parse_args()
+
+    pygame.init()
+
+    rng = np.random.default_rng(0)
+    frames = [rng.integers(0, 256, (args.height, args.width, 3), dtype=np.uint8)
+              for _ in range(4)]
+
+    print(f"📊 {args.frames} frames de {args.width}x{args.height} → vista previa {PREVIEW_SIZE}")
+    antes, kb_antes = medir("anterior", camino_anterior, None, frames, args.frames)
+    despues, kb_despues = medir("pipeline", camino_nuevo,
+                                (FramePipeline(PREVIEW_SIZE), pygame.Surface(PREVIEW_SIZE)),
+                                frames, args.frames)
+    print(f"   Aceleración: {antes / despues:.2f}x | pico de memoria del loop: "
+          f"{kb_antes:.1f} KB → {kb_despues:.1f} KB")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# ============================================================================
+# tools/bench_particles.py - Benchmark del Sistema de Partículas
+# ============================================================================
+"""
+Mide update + draw de ParticleSystem a medida que crece la cantidad de
+partículas vivas, en los dos modos de dibujo. Corre sin ventana
+(SDL_VIDEODRIVER=dummy) desde la raíz del repo.
+
+Uso:
+    python -m tools.bench_particles [--frames 200] [--counts 0 1000 4000 16000]
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from src.game import WIDTH, HEIGHT, GAME_AREA_HEIGHT, YELLOW, ORANGE, WHITE, GREEN, CYAN
+from src.particles import ParticleSystem
+
+MODOS = ["sprites", "pixels"]
+
+
+def medir(screen, count, mode, frames, seed=0):
+    """Retorna (ms de update, ms de draw) promedio por frame con `count` partículas vivas"""
+    system = ParticleSystem(capacity=max(count, 1),
+                            palette=(YELLOW, ORANGE, WHITE, GREEN, CYAN),
+                            bounds=(0, 0, WIDTH, GAME_AREA_HEIGHT), seed=seed)
+    system.mode = mode
+    system.gravity = 0.0  # Que se queden en pantalla todo el benchmark
+
+    t_update = t_draw = 0.0
+    for _ in range(frames):
+        # Mantener el pool lleno: reponer las que murieron por los bordes
+        faltan = count - system.count
+        if faltan > 0:
+            system.emit(WIDTH / 2, GAME_AREA_HEIGHT / 2, faltan,
+                        speed=(0.2, 2.0), life=(frames, frames * 2))
+
+        screen.fill((0, 0, 0))
+        inicio = time.perf_counter()
+        system.update()
+        medio = time.perf_counter()
+        system.draw(screen)
+        fin = time.perf_counter()
+        t_update += medio - inicio
+        t_draw += fin - medio
+
+    return t_update * 1000 / frames, t_draw * 1000 / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de partículas")
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--counts", type=int, nargs="+",
+                        default=[0, 250, 1000, 4000, 16000])
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+
+    print(f"📊 Partículas, {args.frames} frames por medición")
+    print(f"   {'partículas':>10}  {'modo':<8} {'update':>9} {'draw':>9} {'total':>9}")
+    for count in args.counts:
+        for mode in MODOS:
+            ms_update, ms_draw = medir(screen, count, mode, args.frames)
+            print(f"   {count:>10}  {mode:<8} {ms_update:7.3f}ms {ms_draw:7.3f}ms "
+                  f"{ms_update + ms_draw:7.3f}ms")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# ============================================================================
+# tools/bench_render.py - Benchmark de Game.draw
+# ============================================================================
+"""
+Mide cuánto tarda Game.draw (+ display.update) por frame con y sin las
+optimizaciones de render.
+Corre sin ventana (SDL_VIDEODRIVER=dummy) desde la raíz del repo.
+
+Uso:
+    python -m tools.bench_render [--frames 2000]
+"""
+
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from src.game import Game, WIDTH, HEIGHT
+from src.text_cache import text_cache
+
+
+def sin_capa_estatica(game):
+    """Como antes: todo lo fijo se vuelve a dibujar cada frame"""
+    game.static_layer.enabled = False
+
+
+def con_capa_estatica(game):
+    game.static_layer.enabled = True
+
+
+def con_dirty_rects(game):
+    """Capa estática + borrar/enviar solo lo que cambió"""
+    game.static_layer.enabled = True
+    game.dirty_rects = True
+
+
+VARIANTES = [
+    ("redibujar todo", sin_capa_estatica),
+    ("capa estática", con_capa_estatica),
+    ("dirty rects", con_dirty_rects),
+]
+
+
+def medir_draw(screen, configurar, frames, seed=0):
+    """
+    Retorna (ms promedio por frame, % de la pantalla enviada por frame, textos
+    rasterizados en la segunda mitad) durante `frames` frames de juego. El
+    tiempo incluye enviar los rects a la pantalla.
+    """
+    random.seed(seed)
+    text_cache.clear()
+    game = Game(1)
+    configurar(game)
+
+    pantalla = screen.get_rect()
+    total = 0.0
+    area = 0
+    for frame in range(frames):
+        if frame == frames // 2:
+            misses = text_cache.misses
+        if game.update():
+            game = Game(1)
+            configurar(game)
+        inicio = time.perf_counter()
+        rects = game.draw(screen)
+        pygame.display.update(rects)
+        total += time.perf_counter() - inicio
+        for rect in rects:
+            visible = rect.clip(pantalla)
+            area += visible.width * visible.height
+    return (total * 1000 / frames, area * 100 / (frames * WIDTH * HEIGHT),
+            text_cache.misses - misses)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de Game.draw")
+    parser.add_argument("--frames", type=int, default=2000)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+
+    print(f"📊 Game.draw, {args.frames} frames a {WIDTH}x{HEIGHT}")
+    base = None
+    for nombre, configurar in VARIANTES:
+        ms, pantalla, textos = medir_draw(screen, configurar, args.frames)
+        base = base or ms
+        print(f"   {nombre:<20} {ms:7.3f} ms/frame   ({base / ms:.2f}x)   "
+              f"{pantalla:5.1f}% de la pantalla enviada   "
+              f"{textos} textos rasterizados (2ª mitad)")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
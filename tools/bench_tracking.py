@@ -0,0 +1,127 @@
+# ============================================================================
+# tools/bench_tracking.py - Throughput del Pipeline de Gestos
+# ============================================================================
+"""
+Corre lectura → conversión → MediaPipe → detectar_gesto → vista previa lo más
+rápido posible sobre cualquier fuente de frames y reporta frames/seg y la
+latencia de cada etapa. Pensado para CI y para comparar cambios de tracking.
+
+Uso:
+    python -m tools.bench_tracking --source grabacion.mp4 --frames 500
+    python -m tools.bench_tracking --source synthetic:1280x720 --roi
+    python -m tools.bench_tracking --source frames/ --json resultado.json
+"""
+
+import argparse
+import json
+import time
+
+import numpy as np
+
+from src.frame_pipeline import FramePipeline
+from src.frame_sources import abrir_fuente
+from src.gestures import detectar_gesto_array
+from src.inference import crear_inferencia
+from src.tracking import crear_hands, crear_hands_roi
+
+STAGES = ["lectura", "conversion", "inferencia", "gesto", "preview"]
+
+
+def medir_pipeline(source, frames, roi_size=None, flow_interval=0, warmup=10,
+                   camera_profile="none"):
+    """
+    Procesa `frames` frames y retorna un dict con los tiempos por etapa (ms)
+    """
+    cap = abrir_fuente(source, realtime=False, camera_profile=camera_profile)
+    hands = crear_hands()
+    roi_hands = crear_hands_roi(roi_size)
+    inferencia = crear_inferencia(hands, roi_size, flow_interval, roi_hands=roi_hands)
+    pipeline = FramePipeline()
+
+    tiempos = {stage: [] for stage in STAGES}
+    gestos = {"UP": 0, "DOWN": 0, "STOP": 0, None: 0}
+    total = 0
+
+    try:
+        inicio = None
+        for i in range(warmup + frames):
+            if i == warmup:
+                inicio = time.perf_counter()
+                tiempos = {stage: [] for stage in STAGES}
+
+            t0 = time.perf_counter()
+            ret, frame = pipeline.read(cap)
+            if not ret:
+                break
+            t1 = time.perf_counter()
+            rgb = pipeline.prepare(frame)
+            t2 = time.perf_counter()
+            landmarks, _ = inferencia.process(rgb)
+            t3 = time.perf_counter()
+            gesto = detectar_gesto_array(landmarks) if landmarks is not None else None
+            t4 = time.perf_counter()
+            pipeline.preview(rgb)
+            t5 = time.perf_counter()
+
+            for stage, delta in zip(STAGES, (t1 - t0, t2 - t1, t3 - t2, t4 - t3, t5 - t4)):
+                tiempos[stage].append(delta * 1000)
+            if i >= warmup:
+                gestos[gesto] += 1
+                total += 1
+
+        duracion = time.perf_counter() - inicio if inicio is not None else 0.0
+    finally:
+        hands.close()
+        if roi_hands is not None:
+            roi_hands.close()
+        cap.release()
+
+    return {
+        "source": str(source),
+        "frames": total,
+        "fps": total / duracion if duracion > 0 else 0.0,
+        "etapas_ms": {
+            stage: {
+                "media": float(np.mean(valores)) if valores else 0.0,
+                "p50": float(np.percentile(valores, 50)) if valores else 0.0,
+                "p95": float(np.percentile(valores, 95)) if valores else 0.0,
+            }
+            for stage, valores in tiempos.items()
+        },
+        "gestos": {str(k): v for k, v in gestos.items()},
+        "inferencia": inferencia.stats,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Throughput del pipeline de gestos")
+    parser.add_argument("--source", default="synthetic",
+                        help="Índice de cámara, video, carpeta de imágenes o 'synthetic[:WxH]'")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--roi", action="store_true")
+    parser.add_argument("--inference-size", type=int, default=256)
+    parser.add_argument("--flow-interval", type=int, default=0)
+    parser.add_argument("--camera-profile", default="none",
+                        help="Perfil de cámara: none, auto o p. ej. 640x480@30:MJPG")
+    parser.add_argument("--json", help="Guardar el resultado en este archivo")
+    args = parser.parse_args()
+
+    roi_size = args.inference_size if args.roi else None
+    resultado = medir_pipeline(args.source, args.frames, roi_size, args.flow_interval,
+                               camera_profile=args.camera_profile)
+
+    print(f"📊 {resultado['frames']} frames de {resultado['source']}: "
+          f"{resultado['fps']:.1f} frames/seg")
+    for stage, valores in resultado["etapas_ms"].items():
+        print(f"   {stage:<11} media {valores['media']:7.2f} ms   "
+              f"p50 {valores['p50']:7.2f} ms   p95 {valores['p95']:7.2f} ms")
+    print(f"   Gestos: {resultado['gestos']}")
+    print(f"   Inferencia: {resultado['inferencia']}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(resultado, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# ============================================================================
+# tools/eval_gestures.py - Evaluación Offline del Clasificador de Gestos
+# ============================================================================
+"""
+Evalúa la regla de detectar_gesto (vectorizada) sobre landmarks etiquetados:
+accuracy, matriz de confusión, flicker y µs por clasificación.
+
+Uso:
+    python -m tools.eval_gestures grabaciones.npz
+    python -m tools.eval_gestures grabaciones.npz --joint-offset 3   # comparar variante
+    python -m tools.eval_gestures --synthetic 500000                 # sin datos propios
+"""
+
+import argparse
+
+from src.gesture_dataset import GestureDataset, evaluar, generar_sintetico
+from src.gestures import GESTOS
+
+
+def imprimir_resultado(nombre, resultado):
+    print(f"📊 {nombre}: {resultado['muestras']} muestras")
+    print(f"   Accuracy: {resultado['accuracy'] * 100:.2f}%")
+    print(f"   Flicker:  {resultado['flicker'] * 100:.2f}% de frames estables")
+    print(f"   Tiempo:   {resultado['us_por_muestra']:.3f} µs por clasificación")
+    print("   Confusión (fila = real, columna = predicho):")
+    print("          " + "".join(f"{g:>9}" for g in GESTOS))
+    for gesto, fila in zip(GESTOS, resultado["confusion"]):
+        print(f"   {gesto:>6} " + "".join(f"{v:>9}" for v in fila))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluación offline de gestos")
+    parser.add_argument("dataset", nargs="?", help="Archivo .npz (landmarks, labels, sequences)")
+    parser.add_argument("--synthetic", type=int, default=0,
+                        help="Generar N muestras sintéticas en vez de cargar un archivo")
+    parser.add_argument("--save-synthetic", help="Guardar el dataset sintético en este .npz")
+    parser.add_argument("--joint-offset", type=int, default=2,
+                        help="Articulación contra la que se compara la punta (2 = tip - 2)")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        dataset = generar_sintetico(args.synthetic)
+        nombre = f"sintético ({args.synthetic})"
+        if args.save_synthetic:
+            dataset.save(args.save_synthetic)
+    elif args.dataset:
+        dataset = GestureDataset.load(args.dataset)
+        nombre = args.dataset
+    else:
+        parser.error("Indica un dataset .npz o --synthetic N")
+
+    resultado = evaluar(dataset, joint_offset=args.joint_offset)
+    imprimir_resultado(f"{nombre}, tip - {args.joint_offset}", resultado)
+
+
+if __name__ == "__main__":
+    main()
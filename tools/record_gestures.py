@@ -0,0 +1,88 @@
+# ============================================================================
+# tools/record_gestures.py - Grabar Landmarks Etiquetados
+# ============================================================================
+"""
+Graba landmarks de MediaPipe con la etiqueta que indiques por teclado, en el
+formato .npz de src/gesture_dataset.py.
+
+Teclas (en la ventana de la cámara):
+    1 = puño (UP)   2 = palma (DOWN)   3 = otro (STOP)
+    0 = pausa       n = nueva secuencia   q = guardar y salir
+
+Uso:
+    python -m tools.record_gestures grabaciones.npz [--source 0]
+"""
+
+import argparse
+
+import cv2
+
+from src.frame_pipeline import FramePipeline
+from src.frame_sources import abrir_fuente
+from src.gesture_dataset import GestureDataset
+from src.gestures import GESTOS, detectar_gesto_array
+from src.inference import FullFrameInference
+from src.tracking import crear_hands, dibujar_landmarks
+
+TECLAS = {ord("1"): 0, ord("2"): 1, ord("3"): 2, ord("0"): None}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Grabar landmarks etiquetados")
+    parser.add_argument("output", help="Archivo .npz de salida")
+    parser.add_argument("--source", default="0")
+    args = parser.parse_args()
+
+    cap = abrir_fuente(args.source)
+    hands = crear_hands()
+    inferencia = FullFrameInference(hands)
+    pipeline = FramePipeline()
+
+    landmarks, labels, sequences = [], [], []
+    etiqueta = None
+    secuencia = 0
+
+    try:
+        while True:
+            ret, frame = pipeline.read(cap)
+            if not ret:
+                break
+
+            rgb = pipeline.prepare(frame)
+            mano, _ = inferencia.process(rgb)
+            if mano is not None:
+                dibujar_landmarks(rgb, mano)
+                if etiqueta is not None:
+                    landmarks.append(mano)
+                    labels.append(etiqueta)
+                    sequences.append(secuencia)
+
+            estado = "PAUSA" if etiqueta is None else f"GRABANDO {GESTOS[etiqueta]}"
+            if mano is not None:
+                estado += f" (detecta {detectar_gesto_array(mano)})"
+            vista = cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR)
+            cv2.putText(vista, f"{estado} | seq {secuencia} | {len(labels)} muestras",
+                        (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+            cv2.imshow("Grabar gestos", vista)
+
+            tecla = cv2.waitKey(1) & 0xFF
+            if tecla == ord("q"):
+                break
+            if tecla == ord("n"):
+                secuencia += 1
+            elif tecla in TECLAS:
+                etiqueta = TECLAS[tecla]
+    finally:
+        hands.close()
+        cap.release()
+        cv2.destroyAllWindows()
+
+    if labels:
+        GestureDataset(landmarks, labels, sequences).save(args.output)
+        print(f"✅ {len(labels)} muestras guardadas en {args.output}")
+    else:
+        print("⚠️ No se grabó ninguna muestra")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+# ============================================================================
+# tools/tournament.py - Torneo IA contra IA para Ajustar las Dificultades
+# ============================================================================
+"""
+Juega partidos sin ventana entre la IA del juego (paleta derecha, con los
+parámetros a probar) y una IA de referencia que hace de jugador (paleta
+izquierda). El jugador de referencia erra la puntería al azar (sorteada con
+semilla en cada saque y cada devolución), así que el % de victorias no queda
+clavado en 0 o 100 como entre dos IAs determinísticas.
+
+Barre la grilla ball_speed × ai_speed × ai_reaction repartiendo las
+combinaciones entre todos los núcleos (ProcessPoolExecutor); cada
+combinación corre sus partidos juntos en un BatchMatches.
+
+Escribe una tabla CSV (una fila por combinación: % de victorias de la IA,
+golpes por punto, diferencia de puntos, partidos sin terminar) y sugiere,
+para cada nivel, la combinación más cercana a su % de victorias objetivo.
+La sugerencia mantiene la velocidad de pelota de cada nivel (es el ritmo
+que siente el jugador, y el torneo no lo puede medir) y pide una IA más
+rápida que la del nivel anterior.
+
+La última corrida está en tools/tournament_results.csv.
+
+Uso:
+    python -m tools.tournament [--matches 1000] [--workers 8]
+        [--ball-speeds 5 6 7 8] [--ai-speeds 3 4 5 6 7 8 9]
+        [--reactions 0.6 0.7 0.8 0.9 1.0] [--targets 0.25 0.45 0.65 0.85]
+        [--out tournament.csv]
+"""
+
+import argparse
+import csv
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src.batch import BatchMatches
+from src.model import DIFFICULTY_SETTINGS
+
+NIVELES = ["Fácil", "Normal", "Difícil", "Dios"]
+COLUMNAS = ["ball_speed", "ai_speed", "ai_reaction", "matches", "ai_win_rate",
+            "draws", "unfinished", "rally_mean", "margin_mean", "steps_mean"]
+
+
+def jugar(tarea):
+    """
+    Juega los partidos de una combinación (corre en un proceso del pool)
+
+    Args:
+        tarea: (ball_speed, ai_speed, ai_reaction, opciones)
+
+    Returns:
+        Dict con una fila de la tabla
+    """
+    ball_speed, ai_speed, ai_reaction, opciones = tarea
+    batch = BatchMatches(opciones["matches"], seed=opciones["seed"],
+                         ball_speed=ball_speed, ai_speed=ai_speed,
+                         ai_reaction=ai_reaction,
+                         left_ai_speed=opciones["player_speed"],
+                         left_ai_reaction=opciones["player_reaction"],
+                         left_ai_aim=opciones["player_aim"])
+    for _ in range(opciones["max_steps"]):
+        if batch.finished:
+            break
+        batch.step()
+
+    done = batch.done
+    jugados = max(int(np.count_nonzero(done)), 1)
+    margin = (batch.score_ai - batch.score_player)[done]
+    puntos = int((batch.score_ai + batch.score_player).sum())
+    return {
+        "ball_speed": ball_speed,
+        "ai_speed": ai_speed,
+        "ai_reaction": ai_reaction,
+        "matches": opciones["matches"],
+        "ai_win_rate": round(float(np.count_nonzero(margin > 0)) / jugados, 4),
+        "draws": int(np.count_nonzero(margin == 0)),
+        "unfinished": int(np.count_nonzero(~done)),
+        "rally_mean": round(float(batch.rally_total.sum()) / max(puntos, 1), 2),
+        "margin_mean": round(float(margin.mean()) if margin.size else 0.0, 2),
+        "steps_mean": round(float(batch.steps.mean()), 1),
+    }
+
+
+def elegir(filas, objetivo, ball_speed, ai_speed_min=None):
+    """
+    Combinación con el % de victorias más cercano al objetivo (empate:
+    rallies más largos) entre las de esa velocidad de pelota y, si se pasa
+    ai_speed_min, con la IA más rápida que eso
+    """
+    candidatas = [f for f in filas if f["ball_speed"] == ball_speed and
+                  (ai_speed_min is None or f["ai_speed"] > ai_speed_min)] or filas
+    return min(candidatas, key=lambda f: (abs(f["ai_win_rate"] - objetivo), -f["rally_mean"]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Torneo IA vs IA para ajustar dificultades")
+    parser.add_argument("--ball-speeds", type=float, nargs="+", default=[5, 6, 7, 8])
+    parser.add_argument("--ai-speeds", type=float, nargs="+", default=[3, 4, 5, 6, 7, 8, 9])
+    parser.add_argument("--reactions", type=float, nargs="+", default=[0.6, 0.7, 0.8, 0.9, 1.0])
+    parser.add_argument("--player-speed", type=float, default=7,
+                        help="Velocidad de la IA que hace de jugador (Game.player_speed)")
+    parser.add_argument("--player-reaction", type=float, default=0.8,
+                        help="Reacción de la IA que hace de jugador")
+    parser.add_argument("--player-aim", type=float, default=25.0,
+                        help="Error de puntería (desvío estándar en px) de la IA que hace de jugador")
+    parser.add_argument("--matches", type=int, default=1000, help="Partidos por combinación")
+    parser.add_argument("--max-steps", type=int, default=30_000,
+                        help="Pasos máximos por partido (los que no terminan no cuentan)")
+    parser.add_argument("--targets", type=float, nargs=len(NIVELES), default=[0.25, 0.45, 0.65, 0.85],
+                        help="%% de victorias objetivo de la IA por nivel")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="tournament.csv")
+    args = parser.parse_args()
+
+    opciones = {
+        "matches": args.matches,
+        "max_steps": args.max_steps,
+        "player_speed": args.player_speed,
+        "player_reaction": args.player_reaction,
+        "player_aim": args.player_aim,
+        "seed": args.seed,
+    }
+    # La grilla más los niveles actuales, para comparar contra lo que hay
+    combinaciones = list(itertools.product(args.ball_speeds, args.ai_speeds, args.reactions))
+    for settings in DIFFICULTY_SETTINGS.values():
+        actual = (settings["ball_speed"], settings["ai_speed"], settings["ai_reaction"])
+        if actual not in combinaciones:
+            combinaciones.append(actual)
+    tareas = [(b, a, r, opciones) for b, a, r in combinaciones]
+
+    print(f"🏓 Torneo: {len(tareas)} combinaciones × {args.matches} partidos "
+          f"en {args.workers} procesos")
+    inicio = time.perf_counter()
+    filas = []
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for fila in pool.map(jugar, tareas):
+            filas.append(fila)
+            if len(filas) % max(len(tareas) // 10, 1) == 0:
+                print(f"   {len(filas)}/{len(tareas)} ({time.perf_counter() - inicio:.0f}s)")
+    print(f"   ✅ {time.perf_counter() - inicio:.1f}s")
+
+    with open(args.out, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNAS)
+        writer.writeheader()
+        writer.writerows(filas)
+    print(f"💾 Tabla guardada en {args.out}")
+
+    sin_terminar = sum(f["unfinished"] for f in filas)
+    if sin_terminar:
+        print(f"⚠️ {sin_terminar} partidos llegaron a --max-steps sin terminar")
+
+    por_clave = {(f["ball_speed"], f["ai_speed"], f["ai_reaction"]): f for f in filas}
+    print("\n📊 Sugerencia por nivel (actual → propuesto)")
+    anterior = None
+    for nivel, (nombre, objetivo) in enumerate(zip(NIVELES, args.targets)):
+        settings = DIFFICULTY_SETTINGS[nivel]
+        actual = por_clave[(settings["ball_speed"], settings["ai_speed"], settings["ai_reaction"])]
+        mejor = elegir(filas, objetivo, settings["ball_speed"],
+                       anterior["ai_speed"] if anterior else None)
+        anterior = mejor
+        print(f"   {nombre:<8} objetivo {objetivo:.0%}: "
+              f"ball {actual['ball_speed']:g} ai {actual['ai_speed']:g} "
+              f"reac {actual['ai_reaction']:g} ({actual['ai_win_rate']:.0%}) → "
+              f"ball {mejor['ball_speed']:g} ai {mejor['ai_speed']:g} reac {mejor['ai_reaction']:g} "
+              f"({mejor['ai_win_rate']:.0%} victorias, {mejor['rally_mean']} golpes/punto, "
+              f"margen {mejor['margin_mean']:+})")
+
+
+if __name__ == "__main__":
+    main()